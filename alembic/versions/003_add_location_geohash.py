@@ -0,0 +1,52 @@
+"""add geohash spatial index to locations
+
+Revision ID: 003
+Revises: 002
+Create Date: 2025-08-12
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.geo import GEOHASH_PRECISION, encode_geohash
+
+revision = "003"
+down_revision = "002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "locations",
+        sa.Column("geohash", sa.String(length=GEOHASH_PRECISION), nullable=True),
+    )
+
+    # Backfill existing rows
+    bind = op.get_bind()
+    locations = sa.table(
+        "locations",
+        sa.column("id", sa.Integer),
+        sa.column("latitude", sa.Float),
+        sa.column("longitude", sa.Float),
+        sa.column("geohash", sa.String),
+    )
+    rows = bind.execute(
+        sa.select(locations.c.id, locations.c.latitude, locations.c.longitude)
+    ).fetchall()
+    for row in rows:
+        bind.execute(
+            locations.update()
+            .where(locations.c.id == row.id)
+            .values(geohash=encode_geohash(row.latitude, row.longitude))
+        )
+
+    # Prefix lookups are issued as range scans, so a plain B-tree is enough
+    op.create_index("ix_locations_geohash", "locations", ["geohash"])
+    op.create_index("ix_locations_lat_lng", "locations", ["latitude", "longitude"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_locations_lat_lng", table_name="locations")
+    op.drop_index("ix_locations_geohash", table_name="locations")
+    op.drop_column("locations", "geohash")
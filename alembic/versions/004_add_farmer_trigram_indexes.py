@@ -0,0 +1,44 @@
+"""add trigram indexes for farmer text search
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-08-14
+"""
+
+from alembic import op
+
+revision = "004"
+down_revision = "003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Trigram GIN indexes serve ILIKE '%term%' and similarity() ranking;
+    # they only exist on PostgreSQL
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_farmers_farm_name_trgm",
+        "farmers",
+        ["farm_name"],
+        postgresql_using="gin",
+        postgresql_ops={"farm_name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_farmers_description_trgm",
+        "farmers",
+        ["description"],
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_farmers_description_trgm", table_name="farmers")
+    op.drop_index("ix_farmers_farm_name_trgm", table_name="farmers")
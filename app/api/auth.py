@@ -3,18 +3,18 @@ Authentication API routes.
 """
 
 from datetime import timedelta
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel
 
 from app.core.dependencies import CurrentUser, get_current_active_user
+from app.core.hashing import password_hasher
 from app.core.security import (
     Token,
     create_token_for_user,
     get_password_hash,
-    verify_password,
 )
 
 router = APIRouter()
@@ -44,7 +44,7 @@ class UserResponse(BaseModel):
 
 
 # Mock user database - replace with actual database operations
-MOCK_USERS = {
+MOCK_USERS: dict[str, dict[str, Any]] = {
     "testuser": {
         "id": "1",
         "username": "testuser",
@@ -56,7 +56,7 @@ MOCK_USERS = {
 }
 
 
-def authenticate_user(username: str, password: str) -> dict | None:
+async def authenticate_user(username: str, password: str) -> dict[str, Any] | None:
     """
     Authenticate a user with username and password.
     
@@ -70,7 +70,7 @@ def authenticate_user(username: str, password: str) -> dict | None:
     user = MOCK_USERS.get(username)
     if not user:
         return None
-    if not verify_password(password, user["hashed_password"]):
+    if not await password_hasher.verify(password, user["hashed_password"]):
         return None
     return user
 
@@ -80,7 +80,7 @@ async def login(form_data: Annotated[OAuth2PasswordRequestForm, Depends()]):
     """
     OAuth2 compatible token login, get an access token for future requests.
     """
-    user = authenticate_user(form_data.username, form_data.password)
+    user = await authenticate_user(form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -101,7 +101,7 @@ async def login_json(user_data: UserLogin):
     """
     JSON login endpoint - alternative to OAuth2 form login.
     """
-    user = authenticate_user(user_data.username, user_data.password)
+    user = await authenticate_user(user_data.username, user_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -137,7 +137,7 @@ async def register(user_data: UserRegister):
             )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await password_hasher.hash(user_data.password)
     new_user_id = str(len(MOCK_USERS) + 1)
     
     new_user = {
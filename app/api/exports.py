@@ -0,0 +1,130 @@
+"""
+Export REST API endpoints for Farmers Marketplace.
+
+Streams whole tables as NDJSON or CSV. Rows are read from a server-side
+cursor in fixed-size batches and each batch is encoded and flushed
+before the next one is fetched, so memory use does not grow with the
+size of the export.
+"""
+
+import csv
+import io
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Literal
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.dependencies import get_current_active_user, CurrentUser
+from app.services.export_service import ExportService
+
+router = APIRouter()
+
+ExportFormat = Literal["ndjson", "csv"]
+RowBatches = Callable[[AsyncSession, int], AsyncIterator[List[Dict[str, Any]]]]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _csv_value(value: Any) -> Any:
+    """Render enum members by value; csv handles everything else."""
+    return getattr(value, "value", value)
+
+
+def _encode_ndjson(batch: List[Dict[str, Any]]) -> bytes:
+    return b"".join(to_json(row) + b"\n" for row in batch)
+
+
+def _encode_csv(rows: Iterable[Iterable[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+
+async def _export_stream(
+    batches: RowBatches, fields: List[str], format: ExportFormat, batch_size: int
+) -> AsyncIterator[bytes]:
+    if format == "csv":
+        yield _encode_csv([fields])
+
+    # The request-scoped session is closed before the body is streamed,
+    # so the export owns a session for as long as the generator runs
+    async for db in get_db():
+        async for batch in batches(db, batch_size):
+            if format == "csv":
+                yield _encode_csv(
+                    [_csv_value(row[field]) for field in fields] for row in batch
+                )
+            else:
+                yield _encode_ndjson(batch)
+
+
+def _export_response(
+    batches: RowBatches,
+    fields: List[str],
+    name: str,
+    format: ExportFormat,
+    batch_size: int,
+) -> StreamingResponse:
+    return StreamingResponse(
+        _export_stream(batches, fields, format, batch_size),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{format}"'},
+    )
+
+
+@router.get("/farmers")
+async def export_farmers(
+    format: ExportFormat = Query("ndjson", description="Output format"),
+    batch_size: int = Query(1000, ge=1, le=10000, description="Rows fetched per batch"),
+    current_user: CurrentUser = Depends(get_current_active_user),
+) -> StreamingResponse:
+    """
+    Export all farmers together with their location.
+
+    Args:
+        format: Output format (ndjson or csv)
+        batch_size: Rows fetched from the database per batch
+        current_user: Current authenticated user
+
+    Returns:
+        Streaming response with one farmer per line
+    """
+    return _export_response(
+        ExportService.stream_farmers,
+        ExportService.farmer_fields(),
+        "farmers",
+        format,
+        batch_size,
+    )
+
+
+@router.get("/users")
+async def export_users(
+    format: ExportFormat = Query("ndjson", description="Output format"),
+    batch_size: int = Query(1000, ge=1, le=10000, description="Rows fetched per batch"),
+    current_user: CurrentUser = Depends(get_current_active_user),
+) -> StreamingResponse:
+    """
+    Export all users (without credentials).
+
+    Args:
+        format: Output format (ndjson or csv)
+        batch_size: Rows fetched from the database per batch
+        current_user: Current authenticated user
+
+    Returns:
+        Streaming response with one user per line
+    """
+    return _export_response(
+        ExportService.stream_users,
+        ExportService.user_fields(),
+        "users",
+        format,
+        batch_size,
+    )
@@ -5,48 +5,252 @@ Provides CRUD operations for farmer profiles, location-based search,
 and farmer verification endpoints.
 """
 
-from typing import List
+import csv
+import io
+import json
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import iterate_in_threadpool
 
+from app.core.config import get_settings
 from app.core.database import get_db
-from app.core.dependencies import get_current_active_user, CurrentUser
-from app.schemas.farmer import FarmerCreate, FarmerUpdate, FarmerResponse
-from app.services.farmer_service import FarmerService
+from app.core.dependencies import (
+    CurrentUser,
+    get_current_active_user,
+    get_current_admin_user,
+)
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_uuid_cursor, encode_cursor
+from app.core.responses import ModelResponder
+from app.schemas.farmer import (
+    FarmerBatchRequest,
+    FarmerBatchResponse,
+    FarmerBulkResult,
+    FarmerCreate,
+    FarmerResponse,
+    FarmerUpdate,
+    NearbyFarmerResponse,
+)
+from app.services.farmer_service import (
+    FarmerService,
+    LocationOrder,
+    to_nearby_responses,
+)
 
 router = APIRouter()
+farmer_responses = ModelResponder(FarmerResponse, router="farmers")
+farmer_batch_responses = ModelResponder(FarmerBatchResponse, router="farmers")
+nearby_responses = ModelResponder(NearbyFarmerResponse, router="farmers")
+
+# Flat CSV columns for the nested location (same as the export format)
+LOCATION_COLUMN_PREFIX = "location_"
+
+# Upload formats by file extension, for bulk uploads without a format
+UPLOAD_FORMATS: Dict[str, Literal["csv", "ndjson"]] = {
+    "csv": "csv",
+    "ndjson": "ndjson",
+    "jsonl": "ndjson",
+}
+
+
+def _csv_record(row: Dict[str, str]) -> Dict[str, Any]:
+    """Turn a flat CSV row into a FarmerCreate-shaped record."""
+    record: Dict[str, Any] = {}
+    location: Dict[str, Any] = {}
+    for key, value in row.items():
+        if key is None or value is None or value == "":
+            continue
+        if key.startswith(LOCATION_COLUMN_PREFIX):
+            location[key[len(LOCATION_COLUMN_PREFIX):]] = value
+        else:
+            record[key] = value
+    if location:
+        record["location"] = location
+    return record
+
+
+async def _limit_records(
+    records: AsyncIterator[Any], max_rows: int
+) -> AsyncIterator[Any]:
+    count = 0
+    async for record in records:
+        count += 1
+        if count > max_rows:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Bulk imports are limited to {max_rows} rows"
+            )
+        yield record
+
+
+async def _iter_records(records: Iterable[Any]) -> AsyncIterator[Any]:
+    for record in records:
+        yield record
+
+
+def _parse_upload(file: IO[bytes], format: str) -> Generator[Any, None, None]:
+    """Parse a CSV or NDJSON file one record at a time (blocking)."""
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        if format == "csv":
+            for row in csv.DictReader(text):
+                yield _csv_record(row)
+            return
+
+        for line in text:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # Reported as a validation error for this row
+                yield None
+    finally:
+        # Closing the wrapper would close the upload FastAPI still owns
+        text.detach()
+
+
+def _batched(
+    records: Iterator[Any], size: int
+) -> Generator[List[Any], None, None]:
+    batch: List[Any] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _iter_upload(
+    upload: UploadFile, format: str, batch_size: int
+) -> AsyncIterator[Any]:
+    """
+    Parse an uploaded CSV or NDJSON file one record at a time.
+
+    Large uploads are spooled to disk, so reading and parsing run in the
+    threadpool, ``batch_size`` records per hop, to keep the event loop free.
+    """
+    records = _parse_upload(upload.file, format)
+    batches = _batched(records, batch_size)
+    try:
+        async for batch in iterate_in_threadpool(batches):
+            for record in batch:
+                yield record
+    finally:
+        # Runs the parser's cleanup when the import stops early
+        batches.close()
+        records.close()
 
 
 @router.get("/", response_model=List[FarmerResponse])
 async def list_farmers(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    limit: int = Query(
+        100, ge=1, le=1000, description="Maximum number of records to return"
+    ),
+    after: Optional[str] = Query(
+        None,
+        description=(
+            f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"
+        ),
+    ),
     db: AsyncSession = Depends(get_db)
-) -> List[FarmerResponse]:
+) -> Union[List[FarmerResponse], Response]:
     """
     Get list of all farmers with pagination.
-    
+
+    Pages are ordered by farmer ID. The first page (and any page requested
+    with ``after``) uses keyset pagination and returns an
+    ``X-Next-Cursor`` header while more results exist, so deep pages cost
+    the same as the first one. ``skip`` is kept for offset pagination.
+
     Args:
+        response: Outgoing response, used to set the next-page cursor
         skip: Number of records to skip for pagination
         limit: Maximum number of records to return
+        after: Cursor of the previous page (keyset pagination)
         db: Database session
-        
+
     Returns:
         List of farmer profiles
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    if after is None and skip > 0:
+        farmers = await FarmerService.get_all(db, skip=skip, limit=limit)
+        return farmer_responses.many(farmers)
+
+    after_id = None
+    if after is not None:
+        try:
+            after_id = decode_uuid_cursor(after)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor"
+            )
+
+    farmers, next_after = await FarmerService.get_page(db, limit, after_id)
+    if next_after is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(next_after)
+    return farmer_responses.many(farmers, response=response)
+
+
+@router.post("/batch", response_model=FarmerBatchResponse)
+async def get_farmers_batch(
+    data: FarmerBatchRequest,
+    db: AsyncSession = Depends(get_db)
+) -> Union[FarmerBatchResponse, Response]:
+    """
+    Get many farmers by ID in one call.
+
+    Args:
+        data: Up to 100 farmer IDs
+        db: Database session
+
+    Returns:
+        Farmers in request order (null where not found) and the missing IDs
     """
-    farmers = await FarmerService.get_all(db)
-    # Apply pagination
-    paginated_farmers = farmers[skip:skip + limit]
-    return [FarmerResponse.model_validate(farmer) for farmer in paginated_farmers]
+    farmers = await FarmerService.get_by_ids(db, data.ids)
+    missing = [
+        farmer_id for farmer_id, farmer in zip(data.ids, farmers) if farmer is None
+    ]
+    return farmer_batch_responses.one({"results": farmers, "missing": missing})
 
 
 @router.get("/{farmer_id}", response_model=FarmerResponse)
 async def get_farmer(
     farmer_id: UUID,
     db: AsyncSession = Depends(get_db)
-) -> FarmerResponse:
+) -> Union[FarmerResponse, Response]:
     """
     Get a specific farmer by ID.
     
@@ -60,13 +264,13 @@ async def get_farmer(
     Raises:
         HTTPException: If farmer not found
     """
-    farmer = await FarmerService.get_by_id(db, farmer_id)
+    farmer = await FarmerService.get_cached_by_id(db, farmer_id)
     if not farmer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Farmer not found"
         )
-    return FarmerResponse.model_validate(farmer)
+    return farmer_responses.one(farmer)
 
 
 @router.post("/", response_model=FarmerResponse, status_code=status.HTTP_201_CREATED)
@@ -74,7 +278,7 @@ async def create_farmer(
     data: FarmerCreate,
     db: AsyncSession = Depends(get_db),
     current_user: CurrentUser = Depends(get_current_active_user)
-) -> FarmerResponse:
+) -> Union[FarmerResponse, Response]:
     """
     Create a new farmer profile.
     
@@ -105,7 +309,100 @@ async def create_farmer(
         )
     
     farmer = await FarmerService.create(db, data)
-    return FarmerResponse.model_validate(farmer)
+    return farmer_responses.one(farmer, status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/bulk", response_model=FarmerBulkResult)
+async def bulk_create_farmers(
+    records: List[Any] = Body(
+        ..., description="Farmer records in FarmerCreate shape"
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_admin_user)
+) -> FarmerBulkResult:
+    """
+    Create many farmer profiles at once (admin only).
+
+    Each record is validated on its own; invalid records are reported in
+    ``errors`` by their 1-based position and do not abort the import.
+    The JSON body is parsed into memory in full before the import starts,
+    so ``BULK_IMPORT_MAX_ROWS`` is what bounds its size; use
+    ``/bulk/upload`` for large files.
+
+    Args:
+        records: Farmer records in FarmerCreate shape
+        db: Database session
+        current_user: Authenticated admin user
+
+    Returns:
+        Created farmer IDs and per-record errors
+
+    Raises:
+        HTTPException: If the import exceeds the row limit
+    """
+    settings = get_settings()
+    if len(records) > settings.bulk_import_max_rows:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Bulk imports are limited to {settings.bulk_import_max_rows} rows"
+        )
+    return await FarmerService.bulk_create(
+        db,
+        _iter_records(records),
+        chunk_size=settings.bulk_import_chunk_size,
+    )
+
+
+@router.post("/bulk/upload", response_model=FarmerBulkResult)
+async def bulk_upload_farmers(
+    file: UploadFile = File(
+        ..., description="CSV or NDJSON file of farmer records"
+    ),
+    format: Optional[Literal["csv", "ndjson"]] = Query(
+        None, description="File format (defaults to the file extension)"
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_admin_user)
+) -> FarmerBulkResult:
+    """
+    Create many farmer profiles from an uploaded file (admin only).
+
+    CSV files use the farmer export columns (location fields prefixed
+    with ``location_``); NDJSON files hold one FarmerCreate record per
+    line. The file is parsed and validated in chunks as it is read, so
+    memory use does not grow with the file size.
+
+    Args:
+        file: Uploaded CSV or NDJSON file
+        format: File format, inferred from the file name when omitted
+        db: Database session
+        current_user: Authenticated admin user
+
+    Returns:
+        Created farmer IDs and per-record errors
+
+    Raises:
+        HTTPException: If the format is unknown or the import exceeds the
+            row limit
+    """
+    if format is None:
+        extension = (file.filename or "").rsplit(".", 1)[-1].lower()
+        format = UPLOAD_FORMATS.get(extension)
+        if format is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Unknown file format, expected csv or ndjson"
+            )
+
+    settings = get_settings()
+    return await FarmerService.bulk_create(
+        db,
+        _limit_records(
+            _iter_upload(file, format, settings.bulk_import_chunk_size),
+            settings.bulk_import_max_rows,
+        ),
+        chunk_size=settings.bulk_import_chunk_size,
+    )
 
 
 @router.put("/{farmer_id}", response_model=FarmerResponse)
@@ -114,7 +411,7 @@ async def update_farmer(
     data: FarmerUpdate,
     db: AsyncSession = Depends(get_db),
     current_user: CurrentUser = Depends(get_current_active_user)
-) -> FarmerResponse:
+) -> Union[FarmerResponse, Response]:
     """
     Update an existing farmer profile.
     
@@ -145,7 +442,7 @@ async def update_farmer(
         )
     
     farmer = await FarmerService.update(db, farmer, data)
-    return FarmerResponse.model_validate(farmer)
+    return farmer_responses.one(farmer)
 
 
 @router.delete("/{farmer_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -182,13 +479,19 @@ async def delete_farmer(
     await FarmerService.delete(db, farmer)
 
 
-@router.get("/search/location/", response_model=List[FarmerResponse])
+@router.get("/search/location/", response_model=List[NearbyFarmerResponse])
 async def search_farmers_by_location(
     lat: float = Query(..., description="Latitude of search center"),
     lng: float = Query(..., description="Longitude of search center"),
     radius: float = Query(50.0, ge=0.1, le=500.0, description="Search radius in kilometers"),
+    order_by: Optional[LocationOrder] = Query(
+        None, description="Use 'distance' to sort closest first"
+    ),
+    limit: Optional[int] = Query(
+        None, ge=1, le=500, description="Maximum number of results to return"
+    ),
     db: AsyncSession = Depends(get_db)
-) -> List[FarmerResponse]:
+) -> Union[List[NearbyFarmerResponse], Response]:
     """
     Search for farmers within a specified radius of given coordinates.
     
@@ -196,38 +499,81 @@ async def search_farmers_by_location(
         lat: Latitude of search center
         lng: Longitude of search center
         radius: Search radius in kilometers (0.1 to 500 km)
+        order_by: Result order; ``distance`` returns the closest farmers first
+        limit: Maximum number of results to return
         db: Database session
         
     Returns:
-        List of farmers within the specified radius
+        Farmers within the specified radius with their distance in kilometers
+    """
+    farmers = await FarmerService.search_cached_by_location(
+        db, lat, lng, radius, order_by=order_by, limit=limit
+    )
+    return nearby_responses.many(farmers)
+
+
+@router.get("/search/nearest/", response_model=List[NearbyFarmerResponse])
+async def search_nearest_farmers(
+    lat: float = Query(..., ge=-90, le=90, description="Latitude of search center"),
+    lng: float = Query(..., ge=-180, le=180, description="Longitude of search center"),
+    limit: int = Query(
+        20, ge=1, le=100, description="Maximum number of farmers to return"
+    ),
+    max_distance: Optional[float] = Query(
+        None, gt=0, le=20000.0, description="Optional search radius in kilometers"
+    ),
+    db: AsyncSession = Depends(get_db)
+) -> Union[List[NearbyFarmerResponse], Response]:
+    """
+    Find the farmers closest to given coordinates.
+
+    Args:
+        lat: Latitude of search center
+        lng: Longitude of search center
+        limit: Maximum number of farmers to return
+        max_distance: Optional search radius in kilometers
+        db: Database session
+
+    Returns:
+        Farmers with their distance in kilometers, closest first
     """
-    farmers = await FarmerService.search_by_location(db, lat, lng, radius)
-    return [FarmerResponse.model_validate(farmer) for farmer in farmers]
+    results = await FarmerService.get_nearest(db, lat, lng, limit, max_distance)
+    return nearby_responses.many(to_nearby_responses(results))
 
 
 @router.get("/search/name/", response_model=List[FarmerResponse])
 async def search_farmers_by_name(
     farm_name: str = Query(..., min_length=1, description="Farm name to search for"),
+    skip: int = Query(0, ge=0, description="Number of ranked results to skip"),
+    limit: int = Query(
+        50, ge=1, le=200, description="Maximum number of results to return"
+    ),
     db: AsyncSession = Depends(get_db)
-) -> List[FarmerResponse]:
+) -> Union[List[FarmerResponse], Response]:
     """
-    Search for farmers by farm name (case-insensitive partial match).
+    Search for farmers by farm name or description.
+
+    Matching is case-insensitive and results are ranked by relevance.
     
     Args:
         farm_name: Farm name to search for
+        skip: Number of ranked results to skip
+        limit: Maximum number of results to return
         db: Database session
         
     Returns:
-        List of farmers matching the search criteria
+        One page of farmers matching the search criteria, best matches first
     """
-    farmers = await FarmerService.search_by_farm_name(db, farm_name)
-    return [FarmerResponse.model_validate(farmer) for farmer in farmers]
+    farmers = await FarmerService.search_cached_by_farm_name(
+        db, farm_name, limit=limit, offset=skip
+    )
+    return farmer_responses.many(farmers)
 
 
 @router.get("/organic/", response_model=List[FarmerResponse])
 async def get_organic_farmers(
     db: AsyncSession = Depends(get_db)
-) -> List[FarmerResponse]:
+) -> Union[List[FarmerResponse], Response]:
     """
     Get all organic certified farmers.
     
@@ -237,15 +583,15 @@ async def get_organic_farmers(
     Returns:
         List of organic certified farmers
     """
-    farmers = await FarmerService.get_organic_farmers(db)
-    return [FarmerResponse.model_validate(farmer) for farmer in farmers]
+    farmers = await FarmerService.get_cached_organic_farmers(db)
+    return farmer_responses.many(farmers)
 
 
 @router.get("/me/profile", response_model=FarmerResponse)
 async def get_my_farmer_profile(
     db: AsyncSession = Depends(get_db),
     current_user: CurrentUser = Depends(get_current_active_user)
-) -> FarmerResponse:
+) -> Union[FarmerResponse, Response]:
     """
     Get the current user's farmer profile.
     
@@ -265,4 +611,4 @@ async def get_my_farmer_profile(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No farmer profile found for current user"
         )
-    return FarmerResponse.model_validate(farmer) 
\ No newline at end of file
+    return farmer_responses.one(farmer)
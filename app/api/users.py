@@ -2,19 +2,31 @@
 Users REST API endpoints for Farmers Marketplace.
 """
 
-from typing import Annotated, List
+from typing import Annotated, List, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.dependencies import invalidate_principal
+from app.core.hashing import PasswordHasherBusy, password_hasher
+from app.core.responses import ModelResponder
 from app.models.users.user import User
-from app.schemas.user import Token, UserCreate, UserLogin, UserResponse
+from app.schemas.user import (
+    Token,
+    UserBatchRequest,
+    UserBatchResponse,
+    UserCreate,
+    UserLogin,
+    UserResponse,
+)
 from app.services.auth_service import auth_service
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
+user_responses = ModelResponder(UserResponse, router="users")
+user_batch_responses = ModelResponder(UserBatchResponse, router="users")
 
 
 @router.post(
@@ -22,12 +34,12 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 )
 async def register_user(
     user_create: UserCreate, db: AsyncSession = Depends(get_db)
-) -> UserResponse:
+) -> Union[UserResponse, Response]:
     """Register a new user."""
     try:
         user = await auth_service.create_user(db, user_create)
-        return UserResponse.model_validate(user)
-    except HTTPException:
+        return user_responses.one(user, status_code=status.HTTP_201_CREATED)
+    except (HTTPException, PasswordHasherBusy):
         raise
     except Exception as e:
         raise HTTPException(
@@ -41,8 +53,9 @@ async def login_user(
     user_login: UserLogin, db: AsyncSession = Depends(get_db)
 ) -> Token:
     """Login user and return access token."""
+    # UserLogin has no email field; its username carries the account email
     user = await auth_service.authenticate_user(
-        db, user_login.email, user_login.password
+        db, email=user_login.username, password=user_login.password
     )
     if not user:
         raise HTTPException(
@@ -60,11 +73,11 @@ async def login_user(
 @router.get("/me", response_model=UserResponse)
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)], db: AsyncSession = Depends(get_db)
-) -> UserResponse:
+) -> Union[UserResponse, Response]:
     """Get current user information."""
     try:
         user = await auth_service.get_current_user_from_token(db, token)
-        return UserResponse.model_validate(user)
+        return user_responses.one(user)
     except HTTPException:
         raise
     except Exception as e:
@@ -77,7 +90,7 @@ async def get_current_user(
 @router.get("/", response_model=List[UserResponse])
 async def get_users(
     skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)
-) -> List[UserResponse]:
+) -> Union[List[UserResponse], Response]:
     """Get list of users with pagination."""
     from sqlalchemy import select
 
@@ -85,11 +98,23 @@ async def get_users(
     result = await db.execute(query)
     users = result.scalars().all()
 
-    return [UserResponse.model_validate(user) for user in users]
+    return user_responses.many(users)
+
+
+@router.post("/batch", response_model=UserBatchResponse)
+async def get_users_batch(
+    data: UserBatchRequest, db: AsyncSession = Depends(get_db)
+) -> Union[UserBatchResponse, Response]:
+    """Get many users by ID, in request order with explicit misses."""
+    users = await auth_service.get_users_by_ids(db, data.ids)
+    missing = [user_id for user_id, user in zip(data.ids, users) if user is None]
+    return user_batch_responses.one({"results": users, "missing": missing})
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(user_id: str, db: AsyncSession = Depends(get_db)) -> UserResponse:
+async def get_user(
+    user_id: str, db: AsyncSession = Depends(get_db)
+) -> Union[UserResponse, Response]:
     """Get user by ID."""
     from uuid import UUID
 
@@ -111,7 +136,7 @@ async def get_user(user_id: str, db: AsyncSession = Depends(get_db)) -> UserResp
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    return UserResponse.model_validate(user)
+    return user_responses.one(user)
 
 
 @router.put("/{user_id}", response_model=UserResponse)
@@ -120,7 +145,7 @@ async def update_user(
     user_update: UserCreate,
     token: Annotated[str, Depends(oauth2_scheme)],
     db: AsyncSession = Depends(get_db),
-) -> UserResponse:
+) -> Union[UserResponse, Response]:
     """Update user information (requires authentication)."""
     from uuid import UUID
 
@@ -147,15 +172,18 @@ async def update_user(
         )
 
     # Update user fields
+    previous_email = user.email
     user.email = user_update.email
     user.user_type = user_update.user_type
     if user_update.password:
-        user.password_hash = auth_service.get_password_hash(user_update.password)
+        user.password_hash = await password_hasher.hash(user_update.password)
 
     await db.commit()
     await db.refresh(user)
+    invalidate_principal(previous_email)
+    invalidate_principal(user.email)
 
-    return UserResponse.model_validate(user)
+    return user_responses.one(user)
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -191,3 +219,4 @@ async def delete_user(
 
     await db.delete(user)
     await db.commit()
+    invalidate_principal(user.email)
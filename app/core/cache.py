@@ -0,0 +1,268 @@
+"""
+In-process caching primitives.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from time import monotonic
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from pydantic import TypeAdapter
+
+V = TypeVar("V")
+T = TypeVar("T")
+
+
+class TTLCache(Generic[V]):
+    """
+    Bounded LRU cache whose entries expire after a time-to-live.
+
+    Not thread-safe; intended for use from a single event loop.
+    A ``ttl`` of 0 disables the cache (every lookup misses).
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Optional lifetime override in seconds; the cache default
+                applies when omitted and acts as an upper bound otherwise
+        """
+        if not self.enabled:
+            return
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        if lifetime <= 0:
+            return
+
+        self._data[key] = (monotonic() + lifetime, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a key if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters for monitoring."""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class CacheBackend(ABC):
+    """
+    Storage for ``ResultCache``.
+
+    Values are bytes so a shared backend (e.g. Redis or memcached) can
+    store them as-is; counters are integers that never expire on their
+    own.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return the stored value, or None if missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a value for ``ttl`` seconds."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a key if present."""
+
+    @abstractmethod
+    async def get_counter(self, key: str) -> int:
+        """Return a counter's value (0 if never incremented)."""
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        """Atomically increment a counter and return its new value."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Per-process backend built on ``TTLCache``."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.values: TTLCache[bytes] = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Counters are tiny and must not be evicted: a reset counter could
+        # make an old entry current again
+        self.counters: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.values.set(key, value, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        self.values.delete(key)
+
+    async def get_counter(self, key: str) -> int:
+        return self.counters.get(key, 0)
+
+    async def incr(self, key: str) -> int:
+        self.counters[key] = self.counters.get(key, 0) + 1
+        return self.counters[key]
+
+
+class SingleFlight:
+    """
+    Collapses concurrent loads of the same key into one call.
+
+    The first caller runs the loader; callers arriving while it runs
+    await its result instead of starting their own load.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def do(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        """Run ``load`` unless a load for ``key`` is already in flight."""
+        future = self._calls.get(key)
+        if future is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leading caller was cancelled; load independently
+                return await load()
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark as retrieved so an unobserved failure is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+
+class ResultCache:
+    """
+    Read-through cache of serialized query results.
+
+    Entries are namespaced by versions: ``scope`` counters are bumped on
+    writes, so entries loaded before a write are never served after it,
+    even if the load finished after the invalidation. Concurrent misses
+    for the same key are collapsed with ``SingleFlight``.
+    """
+
+    def __init__(self, backend: CacheBackend, namespace: str, ttl: float) -> None:
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+        self._single_flight = SingleFlight()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _counter_key(self, scope: str) -> str:
+        return f"{self.namespace}:version:{scope}"
+
+    async def bump(self, scope: str) -> None:
+        """Invalidate every entry cached under ``scope``."""
+        await self.backend.incr(self._counter_key(scope))
+
+    async def get_or_load(
+        self,
+        scope: str,
+        key: str,
+        adapter: TypeAdapter[T],
+        load: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Return a cached result, loading and storing it on a miss.
+
+        Args:
+            scope: Version scope the entry belongs to
+            key: Entry key within the scope
+            adapter: Adapter used to (de)serialize the result
+            load: Loader called on a miss; None results are not cached
+
+        Returns:
+            The cached or freshly loaded result
+        """
+        if not self.enabled:
+            return await load()
+
+        version = await self.backend.get_counter(self._counter_key(scope))
+        full_key = f"{self.namespace}:{scope}:{version}:{key}"
+        cached = await self.backend.get(full_key)
+        if cached is not None:
+            return adapter.validate_json(cached)
+
+        async def load_and_store() -> T:
+            result = await load()
+            if result is not None:
+                await self.backend.set(full_key, adapter.dump_json(result), self.ttl)
+            return result
+
+        return await self._single_flight.do(full_key, load_and_store)
@@ -2,9 +2,17 @@
 Database connection and session management.
 """
 
-from typing import AsyncGenerator, Optional
+import asyncio
+import re
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 from loguru import logger
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -13,7 +21,7 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import declarative_base
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
 
 # Base class for SQLAlchemy models
 Base = declarative_base()
@@ -23,6 +31,112 @@ engine: Optional[AsyncEngine] = None
 SessionLocal: Optional[async_sessionmaker[AsyncSession]] = None
 
 
+# Collapse expanded IN lists so "IN (?, ?)" and "IN (?, ?, ?)" share a shape
+_PARAMETER_LIST = re.compile(
+    r"\(\s*(?:\?|\$\d+|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|\$\d+|%\(\w+\)s|:\w+))+\s*\)"
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so repeated queries compare equal."""
+    return _PARAMETER_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+@dataclass
+class QueryStats:
+    """Statements executed while handling one request."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    shapes: "Counter[str]" = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes executed more than ``threshold`` times."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+
+# Set per request by QueryStatsMiddleware; SQLAlchemy runs cursor events
+# in a greenlet that inherits the calling task's context
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats() -> Tuple[QueryStats, Any]:
+    """Start collecting statement stats for the current context."""
+    stats = QueryStats()
+    return stats, _query_stats.set(stats)
+
+
+def stop_query_stats(token: Any) -> None:
+    """Stop collecting statement stats started with ``start_query_stats``."""
+    _query_stats.reset(token)
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    if _query_stats.get() is not None:
+        conn.info["query_start_time"] = perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    stats = _query_stats.get()
+    started = conn.info.pop("query_start_time", None)
+    if stats is None or started is None:
+        return
+    stats.record(statement, perf_counter() - started)
+
+
+def _engine_options(settings: Settings) -> Dict[str, Any]:
+    """Build create_async_engine keyword arguments from settings."""
+    url = make_url(settings.database_url)
+    options: Dict[str, Any] = {
+        "echo": settings.is_development,
+        "future": True,
+    }
+
+    # SQLite (used in tests) does not use a sized connection pool
+    if url.get_backend_name() == "sqlite":
+        return options
+
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+
+    if url.get_driver_name() == "asyncpg":
+        connect_args: Dict[str, Any] = {
+            "statement_cache_size": settings.db_statement_cache_size,
+        }
+        if settings.db_statement_timeout_ms:
+            connect_args["server_settings"] = {
+                "statement_timeout": str(settings.db_statement_timeout_ms)
+            }
+        options["connect_args"] = connect_args
+
+    return options
+
+
 async def init_db() -> None:
     """Initialize database connection."""
     global engine, SessionLocal
@@ -30,11 +144,9 @@ async def init_db() -> None:
     settings = get_settings()
 
     # Create async engine
-    engine = create_async_engine(
-        settings.database_url,
-        echo=settings.is_development,
-        future=True,
-    )
+    engine = create_async_engine(settings.database_url, **_engine_options(settings))
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
 
     # Create session factory
     SessionLocal = async_sessionmaker(
@@ -46,6 +158,32 @@ async def init_db() -> None:
     logger.info("Database connection initialized")
 
 
+async def warm_up_pool(connections: Optional[int] = None) -> None:
+    """
+    Open pool connections ahead of traffic.
+
+    Connections are checked out concurrently so each one is a distinct
+    physical connection, then returned to the pool. The first requests
+    after a deploy therefore do not pay connection setup latency.
+
+    Args:
+        connections: Number of connections to open (defaults to settings)
+    """
+    if engine is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+
+    count = get_settings().db_pool_warmup if connections is None else connections
+    if count <= 0:
+        return
+
+    async def _open_connection() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_open_connection() for _ in range(count)))
+    logger.info(f"Database pool warmed up with {count} connections")
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get database session."""
     if SessionLocal is None:
@@ -7,6 +7,8 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 
+from app.core.cache import TTLCache
+from app.core.config import get_settings
 from app.core.security import verify_token, TokenData
 
 # OAuth2 scheme for bearer token
@@ -19,6 +21,58 @@ class CurrentUser(BaseModel):
     username: str
     email: Optional[str] = None
     is_active: bool = True
+    user_type: Optional[str] = None
+
+
+# Principals keyed by token subject, so repeated requests with a valid
+# token skip the user lookup. Entries are dropped explicitly whenever the
+# underlying user changes (see invalidate_principal).
+_settings = get_settings()
+principal_cache: TTLCache[CurrentUser] = TTLCache(
+    maxsize=_settings.principal_cache_size,
+    ttl=_settings.principal_cache_ttl_seconds,
+)
+
+
+def invalidate_principal(subject: Optional[str]) -> None:
+    """
+    Drop a cached principal after its user was updated, deactivated or deleted.
+
+    Args:
+        subject: Token subject (the user's email)
+    """
+    if subject is not None:
+        principal_cache.delete(subject)
+
+
+async def _load_principal(subject: Optional[str]) -> Optional[CurrentUser]:
+    """Return the principal for a token subject, from cache or database."""
+    if subject is None:
+        return None
+
+    cached = principal_cache.get(subject)
+    if cached is not None:
+        return cached
+
+    # Fetch user from database using email (username in token)
+    from app.services.auth_service import auth_service
+    from app.core.database import get_db
+
+    async for db in get_db():
+        user = await auth_service.get_user_by_email(db, subject)
+        if user is None:
+            return None
+
+        current_user = CurrentUser(
+            id=str(user.id),
+            username=user.email,
+            email=user.email,
+            is_active=user.is_active,
+            user_type=user.user_type.value,
+        )
+        principal_cache.set(subject, current_user)
+        return current_user
+    return None
 
 
 async def get_current_user(
@@ -52,22 +106,9 @@ async def get_current_user(
     token = credentials.credentials
     token_data = verify_token(token, credentials_exception)
     
-    # Fetch user from database using email (username in token)
-    from app.services.auth_service import auth_service
-    from app.core.database import get_db
-    
-    async for db in get_db():
-        user = await auth_service.get_user_by_email(db, token_data.username)
-        if user is None:
-            raise credentials_exception
-        
-        current_user = CurrentUser(
-            id=str(user.id),
-            username=user.email,
-            email=user.email,
-            is_active=user.is_active
-        )
-        break
+    current_user = await _load_principal(token_data.username)
+    if current_user is None:
+        raise credentials_exception
     
     return current_user
 
@@ -95,6 +136,29 @@ async def get_current_active_user(
     return current_user
 
 
+async def get_current_admin_user(
+    current_user: CurrentUser = Depends(get_current_active_user)
+) -> CurrentUser:
+    """
+    Get the current active user, who must be an administrator.
+
+    Args:
+        current_user: The current user from get_current_active_user dependency
+
+    Returns:
+        CurrentUser instance if user is an admin
+
+    Raises:
+        HTTPException: If user is not an admin
+    """
+    if current_user.user_type != "ADMIN":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required"
+        )
+    return current_user
+
+
 async def get_optional_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> Optional[CurrentUser]:
@@ -117,23 +181,6 @@ async def get_optional_current_user(
             HTTPException(status_code=401)
         )
         
-        if token_data.username is None:
-            return None
-        
-        # Fetch user from database using email
-        from app.services.auth_service import auth_service
-        from app.core.database import get_db
-        
-        async for db in get_db():
-            user = await auth_service.get_user_by_email(db, token_data.username)
-            if user is None:
-                return None
-            
-            return CurrentUser(
-                id=str(user.id),
-                username=user.email,
-                email=user.email,
-                is_active=user.is_active
-            )
+        return await _load_principal(token_data.username)
     except Exception:
         return None
@@ -0,0 +1,399 @@
+"""
+Geospatial helpers for location-based search.
+
+Provides haversine distance, bounding boxes around a search point and a
+geohash encoder used to index ``locations`` so radius searches only scan
+the cells that can contain matches. ``GeoIndex`` keeps an in-memory
+snapshot of point coordinates for nearest-neighbour queries.
+"""
+
+import heapq
+from array import array
+from dataclasses import dataclass
+from math import asin, atan2, cos, degrees, pi, radians, sin, sqrt
+from typing import (
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+EARTH_RADIUS_KM = 6371.0
+
+GEOHASH_PRECISION = 9
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Upper bound on the number of geohash cells used to cover a search area.
+# More cells means a tighter prefilter but a longer SQL ``OR`` clause.
+MAX_COVERING_CELLS = 16
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    """Latitude/longitude box enclosing a search circle."""
+
+    min_lat: float
+    max_lat: float
+    min_lng: float
+    max_lng: float
+
+    @property
+    def crosses_antimeridian(self) -> bool:
+        """Whether the box wraps around longitude +/-180."""
+        return self.min_lng > self.max_lng
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Calculate distance between two points using the Haversine formula."""
+    dlat = radians(lat2 - lat1)
+    dlng = radians(lng2 - lng1)
+
+    a = (
+        sin(dlat / 2) ** 2
+        + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlng / 2) ** 2
+    )
+    c = 2 * atan2(sqrt(a), sqrt(1 - a))
+
+    return EARTH_RADIUS_KM * c
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> BoundingBox:
+    """
+    Compute the smallest lat/lng box containing a circle on the sphere.
+
+    Args:
+        lat: Latitude of the circle center
+        lng: Longitude of the circle center
+        radius_km: Circle radius in kilometers
+
+    Returns:
+        BoundingBox; longitudes span the whole globe when the circle
+        contains a pole, and ``min_lng > max_lng`` when it wraps the
+        antimeridian.
+    """
+    angular = max(radius_km, 0.0) / EARTH_RADIUS_KM
+    min_lat = lat - degrees(angular)
+    max_lat = lat + degrees(angular)
+
+    if min_lat <= -90 or max_lat >= 90:
+        return BoundingBox(max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0)
+
+    ratio = sin(angular) / cos(radians(lat))
+    if ratio >= 1:
+        return BoundingBox(min_lat, max_lat, -180.0, 180.0)
+
+    delta_lng = degrees(asin(ratio))
+    min_lng = lng - delta_lng
+    max_lng = lng + delta_lng
+    if min_lng < -180:
+        min_lng += 360
+    if max_lng > 180:
+        max_lng -= 360
+
+    return BoundingBox(min_lat, max_lat, min_lng, max_lng)
+
+
+def encode_geohash(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Encode a coordinate as a base32 geohash of the given length."""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars: List[str] = []
+    bits = 0
+    bit_count = 0
+    even = True
+
+    while len(chars) < precision:
+        rng, value = (lng_range, lng) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            rng[0] = mid
+        else:
+            bits <<= 1
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(chars)
+
+
+def geohash_prefix_range(prefix: str) -> Tuple[str, Optional[str]]:
+    """
+    Return the half-open ``[low, high)`` range of geohashes sharing a prefix.
+
+    Range comparisons can use an ordinary B-tree index with bound
+    parameters, unlike ``LIKE 'prefix%'``. ``high`` is None when the
+    prefix is the last one in sort order.
+    """
+    chars = list(prefix)
+    while chars:
+        index = _GEOHASH_ALPHABET.index(chars[-1])
+        if index + 1 < len(_GEOHASH_ALPHABET):
+            chars[-1] = _GEOHASH_ALPHABET[index + 1]
+            return prefix, "".join(chars)
+        chars.pop()
+    return prefix, None
+
+
+def _cell_size(precision: int) -> Tuple[float, float]:
+    """Return (lat_degrees, lng_degrees) covered by one cell at a precision."""
+    total_bits = precision * 5
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def _frange(start: float, stop: float, step: float) -> List[float]:
+    """Inclusive float range that always ends exactly on ``stop``."""
+    values = []
+    current = start
+    while current < stop:
+        values.append(current)
+        current += step
+    values.append(stop)
+    return values
+
+
+def _cells_for_box(
+    min_lat: float, max_lat: float, min_lng: float, max_lng: float, precision: int
+) -> Set[str]:
+    lat_step, lng_step = _cell_size(precision)
+    return {
+        encode_geohash(lat, lng, precision)
+        for lat in _frange(min_lat, max_lat, lat_step)
+        for lng in _frange(min_lng, max_lng, lng_step)
+    }
+
+
+def covering_geohashes(
+    box: BoundingBox, max_cells: int = MAX_COVERING_CELLS
+) -> List[str]:
+    """
+    Find geohash prefixes whose cells together cover a bounding box.
+
+    Picks the longest prefix length for which the box is covered by at
+    most ``max_cells`` cells. Returns an empty list when the box is so
+    large that no prefix filter would help (a full scan is cheaper).
+    """
+    best: Set[str] = set()
+    for precision in range(1, GEOHASH_PRECISION + 1):
+        lat_step, lng_step = _cell_size(precision)
+        lng_span = (
+            (box.max_lng + 360 - box.min_lng)
+            if box.crosses_antimeridian
+            else box.max_lng - box.min_lng
+        )
+        lat_cells = ((box.max_lat - box.min_lat) / lat_step) + 2
+        estimate = lat_cells * ((lng_span / lng_step) + 2)
+        if estimate > max_cells * 4:
+            break
+
+        if box.crosses_antimeridian:
+            cells = _cells_for_box(
+                box.min_lat, box.max_lat, box.min_lng, 180.0, precision
+            )
+            cells |= _cells_for_box(
+                box.min_lat, box.max_lat, -180.0, box.max_lng, precision
+            )
+        else:
+            cells = _cells_for_box(
+                box.min_lat, box.max_lat, box.min_lng, box.max_lng, precision
+            )
+
+        if len(cells) > max_cells:
+            break
+        best = cells
+
+    return sorted(best)
+
+
+K = TypeVar("K", bound=Hashable)
+
+
+class GeoIndex(Generic[K]):
+    """
+    Array-backed snapshot of point coordinates keyed by ID.
+
+    Coordinates are stored in contiguous float arrays (radians, plus the
+    cosine of each latitude) so a query evaluates the haversine term for
+    every point in one tight pass without touching ORM objects. Points
+    can be upserted and removed incrementally; ``load`` swaps in a full
+    snapshot and replays any writes made while it was being read.
+    """
+
+    def __init__(self) -> None:
+        self._keys: List[K] = []
+        self._positions: Dict[K, int] = {}
+        self._lat = array("d")
+        self._lng = array("d")
+        self._cos_lat = array("d")
+        self._journal: Optional[List[Tuple[K, Optional[Tuple[float, float]]]]] = None
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._positions
+
+    def begin_load(self) -> None:
+        """Start journaling writes made while a snapshot is being read."""
+        self._journal = []
+
+    def cancel_load(self) -> None:
+        """Stop journaling after a failed snapshot read."""
+        self._journal = None
+
+    def load(self, points: Iterable[Tuple[K, float, float]]) -> None:
+        """
+        Replace the index contents with a snapshot.
+
+        Args:
+            points: ``(key, latitude, longitude)`` tuples in degrees
+        """
+        journal = self._journal or []
+        self._journal = None
+
+        self._keys = []
+        self._positions = {}
+        self._lat = array("d")
+        self._lng = array("d")
+        self._cos_lat = array("d")
+        for key, lat, lng in points:
+            self._set(key, lat, lng)
+
+        # Writes committed after the snapshot query started may be missing
+        # from it; replaying them is idempotent for those that are not.
+        for key, coordinates in journal:
+            if coordinates is None:
+                self._remove(key)
+            else:
+                self._set(key, *coordinates)
+        self.loaded = True
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale so the owner reloads it before the next query."""
+        self.loaded = False
+
+    def upsert(self, key: K, lat: float, lng: float) -> None:
+        """Insert a point or move an existing one."""
+        self._set(key, lat, lng)
+        if self._journal is not None:
+            self._journal.append((key, (lat, lng)))
+
+    def remove(self, key: K) -> None:
+        """Remove a point if present."""
+        self._remove(key)
+        if self._journal is not None:
+            self._journal.append((key, None))
+
+    def _set(self, key: K, lat: float, lng: float) -> None:
+        phi = radians(lat)
+        position = self._positions.get(key)
+        if position is None:
+            self._positions[key] = len(self._keys)
+            self._keys.append(key)
+            self._lat.append(phi)
+            self._lng.append(radians(lng))
+            self._cos_lat.append(cos(phi))
+        else:
+            self._lat[position] = phi
+            self._lng[position] = radians(lng)
+            self._cos_lat[position] = cos(phi)
+
+    def _remove(self, key: K) -> None:
+        position = self._positions.pop(key, None)
+        if position is None:
+            return
+        # Move the last point into the freed slot to keep the arrays dense
+        last = len(self._keys) - 1
+        if position != last:
+            moved = self._keys[last]
+            self._keys[position] = moved
+            self._lat[position] = self._lat[last]
+            self._lng[position] = self._lng[last]
+            self._cos_lat[position] = self._cos_lat[last]
+            self._positions[moved] = position
+        self._keys.pop()
+        self._lat.pop()
+        self._lng.pop()
+        self._cos_lat.pop()
+
+    def _haversine_terms(self, lat: float, lng: float) -> List[float]:
+        """
+        Compute the haversine ``a`` term from a point to every indexed point.
+
+        ``a`` grows monotonically with distance, so ranking and radius
+        checks use it directly and only the returned points pay for the
+        ``asin``/``sqrt`` conversion to kilometers.
+        """
+        phi = radians(lat)
+        lam = radians(lng)
+        cos_phi = cos(phi)
+        points = zip(self._lat, self._lng, self._cos_lat)
+        return [
+            sin((other_phi - phi) / 2) ** 2
+            + cos_phi * other_cos * sin((other_lam - lam) / 2) ** 2
+            for other_phi, other_lam, other_cos in points
+        ]
+
+    @staticmethod
+    def _term_to_km(term: float) -> float:
+        return 2 * EARTH_RADIUS_KM * asin(sqrt(min(1.0, max(0.0, term))))
+
+    @staticmethod
+    def _km_to_term(distance_km: float) -> float:
+        half_angle = distance_km / (2 * EARTH_RADIUS_KM)
+        return 1.0 if half_angle >= pi / 2 else sin(half_angle) ** 2
+
+    def nearest(
+        self,
+        lat: float,
+        lng: float,
+        k: int,
+        max_distance_km: Optional[float] = None,
+    ) -> List[Tuple[K, float]]:
+        """
+        Find the ``k`` points closest to a coordinate.
+
+        Args:
+            lat: Latitude of the query point
+            lng: Longitude of the query point
+            k: Maximum number of points to return
+            max_distance_km: Optional cut-off distance in kilometers
+
+        Returns:
+            ``(key, distance_km)`` tuples, closest first
+        """
+        if k <= 0 or not self._keys:
+            return []
+        terms = self._haversine_terms(lat, lng)
+        positions: Iterable[int] = range(len(terms))
+        if max_distance_km is not None:
+            limit = self._km_to_term(max_distance_km)
+            positions = [i for i in positions if terms[i] <= limit]
+        closest = heapq.nsmallest(k, positions, key=terms.__getitem__)
+        return [(self._keys[i], self._term_to_km(terms[i])) for i in closest]
+
+    def within(self, lat: float, lng: float, radius_km: float) -> List[Tuple[K, float]]:
+        """
+        Find every point within a radius of a coordinate.
+
+        Returns:
+            ``(key, distance_km)`` tuples, closest first
+        """
+        terms = self._haversine_terms(lat, lng)
+        limit = self._km_to_term(radius_km)
+        matches = sorted(
+            (term, i) for i, term in enumerate(terms) if term <= limit
+        )
+        return [(self._keys[i], self._term_to_km(term)) for term, i in matches]
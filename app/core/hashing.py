@@ -0,0 +1,137 @@
+"""
+Asynchronous password hashing backed by a bounded worker pool.
+
+bcrypt is deliberately slow (~200 ms per call), so running it inside an
+``async def`` handler stalls every other request on the worker. This
+module runs hashing and verification in a thread or process pool and
+raises ``PasswordHasherBusy`` once too many calls are waiting; the API
+answers it with 503.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from app.core.config import get_settings
+from app.core.security import get_password_hash, verify_password
+
+T = TypeVar("T")
+
+# Seconds clients are asked to wait before retrying a rejected call
+RETRY_AFTER_SECONDS = 1
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing pool is saturated and rejects a call."""
+
+    def __init__(self, retry_after: int = RETRY_AFTER_SECONDS) -> None:
+        super().__init__("Authentication service busy, please retry")
+        self.retry_after = retry_after
+
+
+class PasswordHasher:
+    """Runs bcrypt hashing/verification in a bounded executor."""
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_queue: int,
+        executor_type: str = "thread",
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.executor_type = executor_type
+        self._executor: Optional[Executor] = None
+        self._in_flight = 0
+
+        # Metrics
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.failed = 0
+        self.total_seconds = 0.0
+        self.max_queue_depth_seen = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running or waiting for a worker."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting for a free worker."""
+        return max(self._in_flight - self.max_workers, 0)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if self._in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusy()
+
+        self._in_flight += 1
+        self.submitted += 1
+        self.max_queue_depth_seen = max(self.max_queue_depth_seen, self.queue_depth)
+        start = perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._get_executor(), func, *args)
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self._in_flight -= 1
+            self.total_seconds += perf_counter() - start
+        self.completed += 1
+        return result
+
+    async def hash(self, password: str) -> str:
+        """Hash a plain password without blocking the event loop."""
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a plain password against its hash without blocking the event loop."""
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, float]:
+        """Return pool counters for monitoring."""
+        return {
+            "workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth_seen": self.max_queue_depth_seen,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "total_seconds": self.total_seconds,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker pool; it is recreated lazily on next use."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def _create_password_hasher() -> PasswordHasher:
+    settings = get_settings()
+    return PasswordHasher(
+        max_workers=settings.password_hash_workers,
+        max_queue=settings.password_hash_max_queue,
+        executor_type=settings.password_hash_executor,
+    )
+
+
+# Create global instance
+password_hasher = _create_password_hasher()
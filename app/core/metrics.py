@@ -0,0 +1,430 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+Counters, gauges and histograms are kept in memory and rendered on
+demand by the ``/metrics`` endpoint, so no collector or client library
+is required. ``MetricsMiddleware`` records per-route request latency;
+pool, password hasher and cache statistics are read when metrics are
+scraped.
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from time import perf_counter
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from sqlalchemy.pool import QueuePool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# Requests that match no route are grouped under one label, so scanners
+# probing random URLs cannot create unbounded series
+UNMATCHED_ROUTE = "unmatched"
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric(ABC):
+    """Base class for named metrics with a fixed set of label names."""
+
+    type_name = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    @abstractmethod
+    def samples(self) -> Iterable[str]:
+        """Yield the exposition lines for every label set."""
+
+    def collect(self) -> List[str]:
+        """Render this metric as exposition lines."""
+        return self.header() + list(self.samples())
+
+
+class Counter(Metric):
+    """Monotonically increasing value."""
+
+    type_name = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterable[str]:
+        for key, value in self._values.items():
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    """Distribution of observations over cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: (per-bucket counts incl. +Inf, sum)
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = ([0] * (len(self.buckets) + 1), [0.0])
+            self._series[key] = series
+        counts, total = series
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def samples(self) -> Iterable[str]:
+        bucket_labelnames = self.labelnames + ("le",)
+        for key, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(
+                    bucket_labelnames, key + (_format_value(bound),)
+                )
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total[0])}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+# A collector returns (name, type, help, [(labels, value), ...]) families
+# computed at scrape time
+Family = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+Collector = Callable[[], Iterable[Family]]
+
+M = TypeVar("M", bound=Metric)
+
+
+class MetricsRegistry:
+    """Holds metrics and scrape-time collectors and renders them."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Collector] = []
+
+    def register(self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Collector) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.collect())
+        for collector in self._collectors:
+            for name, type_name, documentation, samples in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {type_name}")
+                for labels, value in samples:
+                    labelnames = tuple(labels)
+                    values = tuple(labels[label] for label in labelnames)
+                    rendered = _format_labels(labelnames, values)
+                    lines.append(f"{name}{rendered} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "http_requests_total",
+    "HTTP requests by route and status.",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route.",
+    ("method", "route"),
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served.", ("method",)
+)
+http_requests_coalesced_total = registry.counter(
+    "http_requests_coalesced_total",
+    "Requests answered with the response of an identical in-flight request.",
+    ("method",),
+)
+graphql_operation_duration_seconds = registry.histogram(
+    "graphql_operation_duration_seconds",
+    "GraphQL operation latency by operation.",
+    ("operation_type", "operation_name", "status"),
+)
+graphql_operation_cost = registry.histogram(
+    "graphql_operation_cost",
+    "Estimated cost of GraphQL operations before execution.",
+    ("operation_type",),
+    buckets=(1, 10, 50, 100, 500, 1000, 5000, 10000, 50000),
+)
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+    template = str(getattr(route, "path_format", None) or getattr(route, "path", ""))
+
+    # Routes of included routers may only know their path relative to the
+    # router prefix, so recover the prefix from the concrete request path
+    path_parts = scope["path"].split("/")
+    keep = len(path_parts) - len(template.split("/")) + 1
+    return "/".join(path_parts[:keep]) + template
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request counts, latency and concurrency.
+
+    Requests are labelled with the matched route template (for example
+    ``/api/farmers/{farmer_id}``) rather than the raw path.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc(method=method)
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = perf_counter() - start
+            http_requests_in_flight.dec(method=method)
+            route = _route_template(scope)
+            http_request_duration_seconds.observe(elapsed, method=method, route=route)
+            http_requests_total.inc(method=method, route=route, status=str(status_code))
+
+
+def _pool_metrics() -> Iterable[Family]:
+    from app.core.database import get_engine
+
+    engine = get_engine()
+    pool = engine.pool if engine is not None else None
+    if not isinstance(pool, QueuePool):
+        return []
+    return [
+        (
+            "db_pool_size",
+            "gauge",
+            "Configured connection pool size.",
+            [({}, pool.size())],
+        ),
+        (
+            "db_pool_checked_out",
+            "gauge",
+            "Connections currently checked out.",
+            [({}, pool.checkedout())],
+        ),
+        (
+            "db_pool_checked_in",
+            "gauge",
+            "Idle connections in the pool.",
+            [({}, pool.checkedin())],
+        ),
+        (
+            "db_pool_overflow",
+            "gauge",
+            "Connections open beyond the pool size.",
+            [({}, max(pool.overflow(), 0))],
+        ),
+    ]
+
+
+def _password_hasher_metrics() -> Iterable[Family]:
+    from app.core.hashing import password_hasher
+
+    stats = password_hasher.stats()
+    return [
+        (
+            "password_hash_in_flight",
+            "gauge",
+            "Password hash calls running or queued.",
+            [({}, stats["in_flight"])],
+        ),
+        (
+            "password_hash_queue_depth",
+            "gauge",
+            "Password hash calls waiting for a worker.",
+            [({}, stats["queue_depth"])],
+        ),
+        (
+            "password_hash_completed_total",
+            "counter",
+            "Completed password hash calls.",
+            [({}, stats["completed"])],
+        ),
+        (
+            "password_hash_failed_total",
+            "counter",
+            "Failed password hash calls.",
+            [({}, stats["failed"])],
+        ),
+        (
+            "password_hash_rejected_total",
+            "counter",
+            "Password hash calls rejected as overloaded.",
+            [({}, stats["rejected"])],
+        ),
+        (
+            "password_hash_seconds_total",
+            "counter",
+            "Time spent hashing passwords.",
+            [({}, stats["total_seconds"])],
+        ),
+    ]
+
+
+class _StatsSource(Protocol):
+    def stats(self) -> Mapping[str, float]: ...
+
+
+def _cache_metrics() -> Iterable[Family]:
+    from app.core.dependencies import principal_cache
+    from app.core.security import verified_token_cache
+    from app.graphql.extensions import document_cache
+    from app.graphql.persisted_queries import persisted_queries
+
+    caches: Dict[str, _StatsSource] = {
+        "principal": principal_cache,
+        "verified_token": verified_token_cache,
+        "graphql_document": document_cache,
+        "persisted_query": persisted_queries,
+    }
+    stats = {name: cache.stats() for name, cache in caches.items()}
+    return [
+        (f"cache_{field}{suffix}", type_name, documentation,
+         [({"cache": name}, values[field]) for name, values in stats.items()])
+        for field, suffix, type_name, documentation in (
+            ("size", "", "gauge", "Entries currently cached."),
+            ("hits", "_total", "counter", "Cache hits."),
+            ("misses", "_total", "counter", "Cache misses."),
+            ("evictions", "_total", "counter", "Entries evicted to respect maxsize."),
+        )
+    ]
+
+
+registry.add_collector(_pool_metrics)
+registry.add_collector(_password_hasher_metrics)
+registry.add_collector(_cache_metrics)
@@ -1,120 +1,143 @@
 """
-Authentication middleware for FastAPI.
+Authentication, query instrumentation and request coalescing middleware for FastAPI.
 """
-from typing import Callable, List
+import asyncio
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qsl, urlencode
 
-from fastapi import Request, Response, HTTPException, status
-from fastapi.security import HTTPBearer
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from loguru import logger
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.core.database import start_query_stats, stop_query_stats
+from app.core.metrics import http_requests_coalesced_total
 from app.core.security import verify_token
 
 
-class AuthenticationMiddleware(BaseHTTPMiddleware):
+def _compile_prefixes(prefixes: List[str]) -> Optional[Pattern[str]]:
+    """Compile path prefixes into one anchored regex (None if empty)."""
+    if not prefixes:
+        return None
+    return re.compile("|".join(re.escape(prefix) for prefix in dict.fromkeys(prefixes)))
+
+
+class AuthenticationMiddleware:
     """
     Middleware to handle JWT authentication for protected routes.
-    
+
     This middleware can be configured to:
     - Protect all routes by default
     - Allow specific routes to be public
     - Require authentication only for specific route patterns
+
+    Implemented as a plain ASGI middleware: path prefixes are compiled
+    once at construction, and responses (including streaming ones) are
+    passed through untouched.
     """
-    
+
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         protected_paths: List[str] = None,
         public_paths: List[str] = None,
         require_auth_by_default: bool = False
     ):
         """
         Initialize the authentication middleware.
-        
+
         Args:
             app: The FastAPI application
             protected_paths: List of path patterns that require authentication
             public_paths: List of path patterns that don't require authentication
             require_auth_by_default: If True, all routes require auth unless in public_paths
         """
-        super().__init__(app)
+        self.app = app
         self.protected_paths = protected_paths or ["/api/v1/protected", "/api/v1/users"]
         self.public_paths = public_paths or [
-            "/", "/docs", "/redoc", "/openapi.json", 
+            "/", "/docs", "/redoc", "/openapi.json",
             "/auth/login", "/auth/register", "/auth/login/json",
             "/graphql"
         ]
         self.require_auth_by_default = require_auth_by_default
-        self.security = HTTPBearer(auto_error=False)
-    
-    def _path_matches_patterns(self, path: str, patterns: List[str]) -> bool:
-        """Check if path matches any of the given patterns."""
-        for pattern in patterns:
-            if path.startswith(pattern):
-                return True
-        return False
-    
+        self._public_pattern = _compile_prefixes(self.public_paths)
+        self._protected_pattern = _compile_prefixes(self.protected_paths)
+
     def _requires_authentication(self, path: str) -> bool:
         """Determine if the given path requires authentication."""
         # Check if path is explicitly public
-        if self._path_matches_patterns(path, self.public_paths):
+        if self._public_pattern is not None and self._public_pattern.match(path):
             return False
-        
+
         # Check if path is explicitly protected
-        if self._path_matches_patterns(path, self.protected_paths):
+        if self._protected_pattern is not None and self._protected_pattern.match(path):
             return True
-        
+
         # Use default behavior
         return self.require_auth_by_default
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+
+    @staticmethod
+    def _unauthorized(detail: str) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": detail},
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request through the authentication middleware."""
-        
-        # Skip authentication for non-protected paths
-        if not self._requires_authentication(request.url.path):
-            return await call_next(request)
-        
+
+        # Skip authentication for non-HTTP traffic and non-protected paths
+        if scope["type"] != "http" or not self._requires_authentication(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
         # Extract authorization header
-        authorization = request.headers.get("Authorization")
-        
+        authorization = Headers(scope=scope).get("Authorization")
+
         if not authorization:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Authorization header missing",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
+            response = self._unauthorized("Authorization header missing")
+            await response(scope, receive, send)
+            return
+
         # Validate bearer token format
         try:
             scheme, token = authorization.split()
             if scheme.lower() != "bearer":
                 raise ValueError("Invalid scheme")
         except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authorization header format. Expected: Bearer <token>",
-                headers={"WWW-Authenticate": "Bearer"},
+            response = self._unauthorized(
+                "Invalid authorization header format. Expected: Bearer <token>"
             )
-        
+            await response(scope, receive, send)
+            return
+
         # Verify the JWT token
         credentials_exception = HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-        
+
         try:
             token_data = verify_token(token, credentials_exception)
-            # Add user info to request state for use in route handlers
-            request.state.current_user = {
-                "username": token_data.username,
-                "sub": token_data.sub
-            }
         except HTTPException:
-            raise credentials_exception
-        
+            response = self._unauthorized(credentials_exception.detail)
+            await response(scope, receive, send)
+            return
+
+        # Add user info to request state for use in route handlers
+        scope.setdefault("state", {})["current_user"] = {
+            "username": token_data.username,
+            "sub": token_data.sub
+        }
+
         # Continue to the actual route handler
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
 
 
 def create_auth_middleware(
@@ -124,22 +147,181 @@ def create_auth_middleware(
 ) -> type:
     """
     Factory function to create configured authentication middleware.
-    
+
     Args:
         protected_paths: List of path patterns that require authentication
-        public_paths: List of path patterns that don't require authentication  
+        public_paths: List of path patterns that don't require authentication
         require_auth_by_default: If True, all routes require auth unless in public_paths
-        
+
     Returns:
         Configured AuthenticationMiddleware class
     """
     class ConfiguredAuthMiddleware(AuthenticationMiddleware):
-        def __init__(self, app):
+        def __init__(self, app: ASGIApp):
             super().__init__(
-                app, 
-                protected_paths, 
-                public_paths, 
+                app,
+                protected_paths,
+                public_paths,
                 require_auth_by_default
             )
-    
+
     return ConfiguredAuthMiddleware
+
+
+class QueryStatsMiddleware:
+    """
+    Counts SQL statements and database time per request.
+
+    Adds a ``Server-Timing: db;dur=<ms>;desc="<n> queries"`` header to
+    every response and logs a warning when a request executes the same
+    statement shape more than ``repeat_threshold`` times, which usually
+    means an N+1 query pattern. A threshold of 0 disables the warning.
+    """
+
+    def __init__(self, app: ASGIApp, repeat_threshold: int = 10):
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_query_stats()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                duration_ms = stats.total_seconds * 1000
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={duration_ms:.2f};desc="{stats.count} queries"',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            stop_query_stats(token)
+            if self.repeat_threshold:
+                for shape, count in stats.repeated(self.repeat_threshold):
+                    logger.warning(
+                        f"Possible N+1 query: statement executed {count} times "
+                        f"during {scope['method']} {scope['path']}: {shape[:200]}"
+                    )
+
+
+@dataclass
+class _BufferedResponse:
+    """A complete response captured from the leader of a coalesced group."""
+
+    start: Message
+    body: bytes
+
+
+class RequestCoalescingMiddleware:
+    """
+    Shares one in-flight response between identical concurrent GET requests.
+
+    Requests are identical when they have the same path, the same query
+    parameters (in any order) and the same credentials (``Authorization``
+    and ``Cookie`` headers, compared by digest). The first request runs
+    the endpoint and its buffered response is replayed to every identical
+    request that arrived while it was running. Nothing is kept once the
+    leader finishes, so this is not a cache.
+
+    Only paths under ``paths`` and not under ``exclude_paths`` are
+    coalesced; streaming endpoints such as exports must be excluded since
+    the response body is buffered in memory.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: List[str],
+        exclude_paths: Optional[List[str]] = None,
+    ):
+        self.app = app
+        self._pattern = _compile_prefixes(paths)
+        self._exclude_pattern = _compile_prefixes(exclude_paths or [])
+        self._in_flight: Dict[
+            Tuple[str, ...], "asyncio.Future[Optional[_BufferedResponse]]"
+        ] = {}
+
+    def _applies(self, scope: Scope) -> bool:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return False
+        path = scope["path"]
+        if self._pattern is None or not self._pattern.match(path):
+            return False
+        return self._exclude_pattern is None or not self._exclude_pattern.match(path)
+
+    @staticmethod
+    def _key(scope: Scope) -> Tuple[str, ...]:
+        query_string = scope.get("query_string", b"").decode("latin-1")
+        query = parse_qsl(query_string, keep_blank_values=True)
+        headers = Headers(scope=scope)
+        credentials = "\n".join(
+            [headers.get("authorization", ""), headers.get("cookie", "")]
+        )
+        return (
+            scope["method"],
+            scope["path"],
+            urlencode(sorted(query)),
+            hashlib.sha256(credentials.encode("latin-1")).hexdigest(),
+        )
+
+    @staticmethod
+    async def _replay(response: _BufferedResponse, send: Send) -> None:
+        # Outer middleware may append headers in place, so each request
+        # gets its own copy of the header list
+        headers = list(response.start.get("headers", []))
+        await send({**response.start, "headers": headers})
+        await send(
+            {"type": "http.response.body", "body": response.body, "more_body": False}
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._applies(scope):
+            await self.app(scope, receive, send)
+            return
+
+        key = self._key(scope)
+        leader = self._in_flight.get(key)
+        if leader is not None:
+            # Shield so a disconnecting follower cannot cancel the leader's result
+            shared = await asyncio.shield(leader)
+            if shared is not None:
+                http_requests_coalesced_total.inc(method=scope["method"])
+                await self._replay(shared, send)
+                return
+            # The leader failed; run this request on its own
+            await self.app(scope, receive, send)
+            return
+
+        future: "asyncio.Future[Optional[_BufferedResponse]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._in_flight[key] = future
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+
+        async def buffer(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        response: Optional[_BufferedResponse] = None
+        try:
+            await self.app(scope, receive, buffer)
+            if start is not None:
+                response = _BufferedResponse(start, b"".join(chunks))
+        finally:
+            del self._in_flight[key]
+            future.set_result(response)
+
+        if response is None:
+            raise RuntimeError("Coalesced request finished without a response")
+        await self._replay(response, send)
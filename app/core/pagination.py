@@ -0,0 +1,44 @@
+"""
+Cursor helpers for keyset pagination.
+
+Cursors are opaque to clients: the sort key of the last row on a page,
+base64url-encoded. Decoding validates the shape so bad input can be
+reported as a client error.
+"""
+
+import base64
+import binascii
+from uuid import UUID
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(value: object) -> str:
+    """Encode a sort key as an opaque cursor string."""
+    raw = str(value).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """
+    Decode an opaque cursor back into its sort key.
+
+    Raises:
+        ValueError: If the cursor is not valid base64url text
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        raw = base64.b64decode(padded.encode("ascii"), altchars=b"-_", validate=True)
+        return raw.decode("utf-8")
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def decode_uuid_cursor(cursor: str) -> UUID:
+    """
+    Decode a cursor whose sort key is a UUID primary key.
+
+    Raises:
+        ValueError: If the cursor does not contain a UUID
+    """
+    return UUID(decode_cursor(cursor))
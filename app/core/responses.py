@@ -0,0 +1,101 @@
+"""
+Response serialization helpers for REST routers.
+
+By default endpoints return Pydantic models and FastAPI validates them
+again against ``response_model`` before encoding them with the stdlib
+JSON encoder. When the fast path is enabled, ``ModelResponder`` instead
+validates ORM objects once and serializes them straight to bytes with
+pydantic-core, returning a ready ``Response`` that FastAPI sends as-is.
+"""
+
+from typing import Any, Generic, Iterable, List, Optional, Type, TypeVar, Union
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.config import get_settings
+
+M = TypeVar("M", bound=BaseModel)
+
+# Headers the fast path must compute itself rather than copy from the
+# injected sub-response.
+_SKIPPED_HEADERS = {"content-length", "content-type"}
+
+
+class ModelResponder(Generic[M]):
+    """
+    Serializes ORM objects (or models) into responses for one schema.
+
+    The fast path is enabled globally with ``FAST_JSON_RESPONSES`` or for
+    individual routers by listing their name in ``FAST_JSON_ROUTERS``.
+    """
+
+    def __init__(self, model: Type[M], router: str) -> None:
+        self.model = model
+        self.router = router
+        self._adapter: TypeAdapter[M] = TypeAdapter(model)
+        self._list_adapter: TypeAdapter[List[M]] = TypeAdapter(
+            List[model]  # type: ignore[valid-type]
+        )
+
+    @property
+    def fast(self) -> bool:
+        """Whether the fast serialization path is enabled for this router."""
+        settings = get_settings()
+        return settings.fast_json_responses or self.router in settings.fast_json_routers
+
+    def _render(
+        self, content: bytes, status_code: int, response: Optional[Response]
+    ) -> Response:
+        rendered = Response(
+            content=content, status_code=status_code, media_type="application/json"
+        )
+        if response is not None:
+            for name, value in response.headers.items():
+                if name not in _SKIPPED_HEADERS:
+                    rendered.headers.append(name, value)
+        return rendered
+
+    def one(
+        self,
+        obj: Any,
+        status_code: int = 200,
+        response: Optional[Response] = None,
+    ) -> Union[M, Response]:
+        """
+        Serialize a single object.
+
+        Args:
+            obj: ORM object or model instance
+            status_code: Status code for the fast-path response
+            response: Injected sub-response whose headers should be kept
+
+        Returns:
+            A model for FastAPI to serialize, or an encoded Response
+        """
+        if not self.fast:
+            return self.model.model_validate(obj)
+        model = self._adapter.validate_python(obj, from_attributes=True)
+        return self._render(self._adapter.dump_json(model), status_code, response)
+
+    def many(
+        self,
+        objs: Iterable[Any],
+        status_code: int = 200,
+        response: Optional[Response] = None,
+    ) -> Union[List[M], Response]:
+        """
+        Serialize a list of objects.
+
+        Args:
+            objs: ORM objects or model instances
+            status_code: Status code for the fast-path response
+            response: Injected sub-response whose headers should be kept
+
+        Returns:
+            A list of models for FastAPI to serialize, or an encoded Response
+        """
+        if not self.fast:
+            return [self.model.model_validate(obj) for obj in objs]
+        models = self._list_adapter.validate_python(list(objs), from_attributes=True)
+        return self._render(self._list_adapter.dump_json(models), status_code, response)
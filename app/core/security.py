@@ -1,17 +1,27 @@
 """
 JWT authentication and security utilities.
 """
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional, Union
+from typing import Any, Dict, Optional, Union
 
 import bcrypt
 from jose import JWTError, jwt
 from pydantic import BaseModel
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
 
 settings = get_settings()
 
+# Payloads of tokens that already passed signature and claim checks,
+# keyed by token digest so raw tokens are never held as keys.
+verified_token_cache: TTLCache[Dict[str, Any]] = TTLCache(
+    maxsize=settings.token_cache_size,
+    ttl=settings.token_cache_ttl_seconds,
+)
+
 
 class Token(BaseModel):
     """Token response model."""
@@ -56,6 +66,33 @@ def create_access_token(
     return encoded_jwt
 
 
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """
+    Decode and verify a JWT, reusing earlier verifications of the same token.
+
+    Args:
+        token: The JWT token to decode
+
+    Returns:
+        The verified token payload
+
+    Raises:
+        JWTError: If the token signature or claims are invalid
+    """
+    key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    payload = verified_token_cache.get(key)
+    if payload is not None:
+        return dict(payload)
+
+    payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+
+    # Never keep a token cached past its own expiry
+    exp = payload.get("exp")
+    ttl = float(exp) - time.time() if isinstance(exp, (int, float)) else None
+    verified_token_cache.set(key, payload, ttl=ttl)
+    return dict(payload)
+
+
 def verify_token(token: str, credentials_exception) -> TokenData:
     """
     Verify and decode a JWT token.
@@ -71,10 +108,8 @@ def verify_token(token: str, credentials_exception) -> TokenData:
         credentials_exception: If token verification fails
     """
     try:
-        payload = jwt.decode(
-            token, settings.secret_key, algorithms=[settings.algorithm]
-        )
-        username: str = payload.get("sub")
+        payload = decode_access_token(token)
+        username: Optional[str] = payload.get("sub")
         if username is None:
             raise credentials_exception
         token_data = TokenData(username=username, sub=username)
@@ -0,0 +1,45 @@
+"""
+GraphQL request context.
+
+Every GraphQL request gets one database session, shared by all of its
+resolvers and DataLoaders, instead of each resolver opening its own.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.fastapi import BaseContext
+
+from app.core.database import get_db
+from app.graphql.loaders import Loaders
+
+
+class GraphQLContext(BaseContext):
+    """Context passed to resolvers as ``info.context``."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__()
+        self.db = db
+        # AsyncSession does not allow concurrent operations, but sibling
+        # fields are resolved concurrently, so access is serialized.
+        self._db_lock = asyncio.Lock()
+        self.loaders = Loaders(self)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Borrow the request session for one unit of work.
+
+        Do not await DataLoaders while holding the session; loaders
+        borrow it themselves.
+        """
+        async with self._db_lock:
+            yield self.db
+
+
+async def get_context(db: AsyncSession = Depends(get_db)) -> GraphQLContext:
+    """Build the GraphQL context for a request."""
+    return GraphQLContext(db)
@@ -0,0 +1,320 @@
+"""
+Schema extensions for the GraphQL API.
+"""
+
+from time import perf_counter
+from typing import Any, Dict, FrozenSet, Iterator, Optional, Tuple
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLField,
+    GraphQLNamedType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    Undefined,
+    get_named_type,
+    get_nullable_type,
+    is_list_type,
+    value_from_ast,
+    value_from_ast_untyped,
+)
+from graphql.utilities import get_operation_ast
+from loguru import logger
+from strawberry.extensions import SchemaExtension
+from strawberry.types.execution import ExecutionContext
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.metrics import graphql_operation_cost, graphql_operation_duration_seconds
+from app.graphql.persisted_queries import query_hash
+
+# Arguments that bound the length of a list field, in lookup order
+LIST_SIZE_ARGUMENTS = ("limit", "first")
+
+# Assumed length of list fields that take no size argument
+DEFAULT_LIST_SIZE = 100
+
+# Parsed documents that passed validation, keyed by query hash. Schema
+# validity of a document never changes within a process, so entries
+# only leave the cache through LRU eviction.
+document_cache: TTLCache[DocumentNode] = TTLCache(
+    maxsize=get_settings().graphql_document_cache_size, ttl=float("inf")
+)
+
+
+class OperationMetrics(SchemaExtension):
+    """Records the duration and outcome of every GraphQL operation."""
+
+    def on_operation(self) -> Iterator[None]:
+        start = perf_counter()
+        yield
+        elapsed = perf_counter() - start
+
+        context = self.execution_context
+        try:
+            operation_type = context.operation_type.value
+        except Exception:
+            # The document failed to parse or names an unknown operation
+            operation_type = "unknown"
+        result = context.result
+        status = "error" if result is None or getattr(result, "errors", None) else "ok"
+
+        graphql_operation_duration_seconds.observe(
+            elapsed,
+            operation_type=operation_type,
+            operation_name=context.operation_name or "anonymous",
+            status=status,
+        )
+
+
+class DocumentCache(SchemaExtension):
+    """
+    Skips parsing and validation for documents seen before.
+
+    Only documents without validation errors are cached, and extensions
+    that inspect variables (such as ``QueryCostLimiter``) still run on
+    every request.
+    """
+
+    def __init__(self, *, execution_context: Optional[ExecutionContext] = None) -> None:
+        super().__init__(execution_context=execution_context)
+        self._key: Optional[str] = None
+        self._cached = False
+
+    def on_operation(self) -> Iterator[None]:
+        context = self.execution_context
+        if context.query is not None and context.graphql_document is None:
+            self._key = query_hash(context.query)
+            document = document_cache.get(self._key)
+            if document is not None:
+                context.graphql_document = document
+                self._cached = True
+        yield
+
+    def on_validate(self) -> Iterator[None]:
+        context = self.execution_context
+        # strawberry only validates while pre_execution_errors is None
+        # (strawberry.schema.schema._run_validation), so an empty list marks
+        # a cached document as already validated. This relies on strawberry
+        # internals; test_document_cache_validates_each_document_once pins
+        # it so an upgrade cannot silently skip or repeat validation.
+        if self._cached and context.pre_execution_errors is None:
+            context.pre_execution_errors = []
+        yield
+        if (
+            not self._cached
+            and self._key is not None
+            and context.graphql_document is not None
+            and context.pre_execution_errors == []
+        ):
+            document_cache.set(self._key, context.graphql_document)
+
+
+class _CostAnalysis:
+    """Static depth and cost estimate for one operation of a document."""
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        operation: OperationDefinitionNode,
+        variables: Dict[str, Any],
+        field_weights: Dict[str, int],
+    ) -> None:
+        self.schema = schema
+        self.field_weights = field_weights
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        # Variables the client omitted fall back to their declared defaults
+        self.variables = {
+            definition.variable.name.value: value_from_ast_untyped(
+                definition.default_value
+            )
+            for definition in operation.variable_definitions or ()
+            if definition.default_value is not None
+        }
+        self.variables.update(variables)
+
+    def _list_size(self, node: FieldNode, field: GraphQLField) -> Optional[int]:
+        for name in LIST_SIZE_ARGUMENTS:
+            argument = field.args.get(name)
+            if argument is None:
+                continue
+            value: Any = Undefined
+            for argument_node in node.arguments or ():
+                if argument_node.name.value == name:
+                    value = value_from_ast(
+                        argument_node.value, argument.type, self.variables
+                    )
+            if value is Undefined or value is None:
+                value = argument.default_value
+            if isinstance(value, int):
+                return max(value, 0)
+        return None
+
+    def measure(
+        self,
+        parent_type: GraphQLNamedType,
+        selection_set: SelectionSetNode,
+        depth: int = 1,
+        fragments_seen: FrozenSet[str] = frozenset(),
+        page_size: Optional[int] = None,
+    ) -> Tuple[int, int]:
+        """
+        Estimate the cost and depth of a selection set.
+
+        Unknown fields and fragments are skipped; validation reports them.
+        ``page_size`` is the size argument of an enclosing non-list field
+        (a connection's ``first``), applied to lists below it that have no
+        size argument of their own, such as ``edges``.
+
+        Returns:
+            ``(cost, depth)`` where depth counts nested field levels
+        """
+        cost = 0
+        deepest = 0
+        fields = getattr(parent_type, "fields", {})
+
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                name = selection.name.value
+                field = fields.get(name)
+                if field is None or name.startswith("__"):
+                    continue
+                deepest = max(deepest, depth)
+                size = self._list_size(selection, field)
+                is_list = is_list_type(get_nullable_type(field.type))
+                child_cost = 0
+                if selection.selection_set is not None:
+                    child_cost, child_depth = self.measure(
+                        get_named_type(field.type),
+                        selection.selection_set,
+                        depth + 1,
+                        fragments_seen,
+                        None if is_list else size,
+                    )
+                    deepest = max(deepest, child_depth)
+                default_weight = 0 if selection.selection_set is None else 1
+                weight = self.field_weights.get(
+                    f"{parent_type.name}.{name}", default_weight
+                )
+                multiplier = 1
+                if is_list:
+                    multiplier = next(
+                        value
+                        for value in (size, page_size, DEFAULT_LIST_SIZE)
+                        if value is not None
+                    )
+                cost += multiplier * (weight + child_cost)
+                continue
+
+            fragment_type: Optional[GraphQLNamedType] = parent_type
+            if isinstance(selection, InlineFragmentNode):
+                if selection.type_condition is not None:
+                    type_name = selection.type_condition.name.value
+                    fragment_type = self.schema.get_type(type_name)
+                selection_set_node = selection.selection_set
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in fragments_seen:
+                    continue
+                fragments_seen = fragments_seen | {name}
+                type_name = fragment.type_condition.name.value
+                fragment_type = self.schema.get_type(type_name)
+                selection_set_node = fragment.selection_set
+            else:
+                continue
+
+            if fragment_type is None:
+                continue
+            fragment_cost, fragment_depth = self.measure(
+                fragment_type, selection_set_node, depth, fragments_seen, page_size
+            )
+            cost += fragment_cost
+            deepest = max(deepest, fragment_depth)
+
+        return cost, deepest
+
+
+class QueryCostLimiter(SchemaExtension):
+    """
+    Rejects operations whose depth or estimated cost is over budget.
+
+    The estimate is computed from the document before validation and
+    execution, so no resolver runs for a rejected operation. Object
+    fields cost 1 and scalar fields 0 unless ``field_weights`` (keyed by
+    ``"Type.field"``) says otherwise, and a list field multiplies the cost
+    of its selection by its ``limit``/``first`` argument (or by that of
+    the enclosing connection, else ``DEFAULT_LIST_SIZE``). Introspection
+    fields are ignored. Every operation's cost is recorded in the
+    ``graphql_operation_cost`` histogram so budgets can be tuned;
+    rejected operations are also logged as warnings.
+    """
+
+    field_weights: Dict[str, int] = {}
+
+    def __init__(
+        self,
+        *,
+        execution_context: Optional[ExecutionContext] = None,
+        max_depth: Optional[int] = None,
+        max_cost: Optional[int] = None,
+    ) -> None:
+        super().__init__(execution_context=execution_context)
+        settings = get_settings()
+        self.max_depth = settings.graphql_max_depth if max_depth is None else max_depth
+        self.max_cost = settings.graphql_max_cost if max_cost is None else max_cost
+
+    def on_validate(self) -> Iterator[None]:
+        context = self.execution_context
+        document = context.graphql_document
+        operation = None
+        if document is not None:
+            operation = get_operation_ast(document, context.operation_name)
+        if (
+            document is not None
+            and operation is not None
+            and not context.pre_execution_errors
+        ):
+            root_type = context.schema._schema.get_root_type(operation.operation)
+            if root_type is not None:
+                analysis = _CostAnalysis(
+                    context.schema._schema,
+                    document,
+                    operation,
+                    context.variables or {},
+                    self.field_weights,
+                )
+                cost, depth = analysis.measure(root_type, operation.selection_set)
+                operation_type = operation.operation.value
+                operation_name = context.operation_name or "anonymous"
+                summary = (
+                    f"GraphQL {operation_type} {operation_name}: "
+                    f"cost={cost} depth={depth}"
+                )
+                graphql_operation_cost.observe(cost, operation_type=operation_type)
+
+                error = None
+                if self.max_depth and depth > self.max_depth:
+                    error = (
+                        f"Query depth {depth} exceeds the maximum of {self.max_depth}"
+                    )
+                elif self.max_cost and cost > self.max_cost:
+                    error = f"Query cost {cost} exceeds the maximum of {self.max_cost}"
+
+                if error is not None:
+                    logger.warning(f"{summary} rejected")
+                    context.pre_execution_errors = [GraphQLError(error)]
+                else:
+                    logger.debug(summary)
+        yield
@@ -0,0 +1,103 @@
+"""
+Request-scoped DataLoaders for GraphQL resolvers.
+
+Each loader collects the keys requested while resolving one level of a
+query and fetches them with a single ``IN (...)`` statement on the
+request's shared session.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+)
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import InstrumentedAttribute, selectinload
+from strawberry.dataloader import DataLoader
+
+from app.graphql.projection import type_columns
+from app.graphql.types.user_type import User as UserType
+from app.models.farmers.farmer import Farmer
+from app.models.shared.location import Location
+from app.models.users.user import User
+from app.services.auth_service import auth_service
+from app.services.farmer_service import FarmerService
+
+if TYPE_CHECKING:
+    from app.graphql.context import GraphQLContext
+
+
+def _order_by_keys(
+    keys: Sequence[Hashable], rows: Sequence[Any], key_fn: Callable[[Any], Hashable]
+) -> List[Optional[Any]]:
+    """Return rows aligned with the requested keys, None for misses."""
+    by_key: Dict[Hashable, Any] = {key_fn(row): row for row in rows}
+    return [by_key.get(key) for key in keys]
+
+
+class Loaders:
+    """DataLoader registry for one GraphQL request."""
+
+    def __init__(self, context: "GraphQLContext") -> None:
+        self._context = context
+        self.user_by_id: DataLoader[UUID, Optional[User]] = DataLoader(
+            load_fn=self._load_users_by_id
+        )
+        self.user_by_email: DataLoader[str, Optional[User]] = DataLoader(
+            load_fn=self._load_users_by_email
+        )
+        self.farmer_by_id: DataLoader[UUID, Optional[Farmer]] = DataLoader(
+            load_fn=self._load_farmers_by_id
+        )
+        self.farmer_by_user_id: DataLoader[UUID, Optional[Farmer]] = DataLoader(
+            load_fn=self._load_farmers_by_user_id
+        )
+        self.location_by_id: DataLoader[int, Optional[Location]] = DataLoader(
+            load_fn=self._load_locations_by_id
+        )
+
+    async def _fetch(
+        self,
+        model: Any,
+        column: InstrumentedAttribute[Any],
+        keys: List[Any],
+        *options: Any,
+    ) -> List[Any]:
+        async with self._context.session() as db:
+            result = await db.execute(
+                select(model).where(column.in_(keys)).options(*options)
+            )
+            return list(result.scalars().all())
+
+    async def _load_users_by_id(self, keys: List[UUID]) -> List[Optional[User]]:
+        # Only columns exposed by the GraphQL type; password hashes stay deferred
+        columns = list(type_columns(User, UserType).values())
+        async with self._context.session() as db:
+            return await auth_service.get_users_by_ids(db, keys, columns=columns)
+
+    async def _load_users_by_email(self, keys: List[str]) -> List[Optional[User]]:
+        users = await self._fetch(User, User.email, keys)
+        return _order_by_keys(keys, users, lambda user: user.email)
+
+    async def _load_farmers_by_id(self, keys: List[UUID]) -> List[Optional[Farmer]]:
+        async with self._context.session() as db:
+            return await FarmerService.get_by_ids(db, keys)
+
+    async def _load_farmers_by_user_id(
+        self, keys: List[UUID]
+    ) -> List[Optional[Farmer]]:
+        farmers = await self._fetch(
+            Farmer, Farmer.user_id, keys, selectinload(Farmer.location)
+        )
+        return _order_by_keys(keys, farmers, lambda farmer: farmer.user_id)
+
+    async def _load_locations_by_id(self, keys: List[int]) -> List[Optional[Location]]:
+        locations = await self._fetch(Location, Location.id, keys)
+        return _order_by_keys(keys, locations, lambda location: location.id)
@@ -0,0 +1,130 @@
+"""
+Relay-style cursor connections for GraphQL list fields.
+
+``paginate`` turns any ``select`` into one page of a ``Connection``
+using keyset pagination on a unique, ordered key column: each page is
+``WHERE key > :after ORDER BY key LIMIT first + 1``, so deep pages cost
+the same as the first and concurrent inserts cannot shift rows between
+pages. Cursors are the opaque encodings from ``app.core.pagination``.
+"""
+
+from typing import Any, Awaitable, Callable, Generic, List, Optional, TypeVar
+
+import strawberry
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import InstrumentedAttribute
+from strawberry.exceptions import StrawberryGraphQLError
+from strawberry.types import Info
+
+from app.core.pagination import decode_uuid_cursor, encode_cursor
+
+NodeType = TypeVar("NodeType")
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+@strawberry.type
+class PageInfo:
+    """Relay pagination metadata for one page of a connection."""
+
+    has_next_page: bool
+    has_previous_page: bool
+    start_cursor: Optional[str]
+    end_cursor: Optional[str]
+
+
+@strawberry.type
+class Edge(Generic[NodeType]):
+    """One item of a connection with the cursor pointing at it."""
+
+    cursor: str
+    node: NodeType
+
+
+@strawberry.type
+class Connection(Generic[NodeType]):
+    """One page of a list, with cursors for fetching the next one."""
+
+    edges: List[Edge[NodeType]]
+    page_info: PageInfo
+    count_total: strawberry.Private[Callable[[], Awaitable[int]]]
+
+    @strawberry.field
+    async def total_count(self) -> int:
+        """Number of items across all pages (only counted when selected)."""
+        return await self.count_total()
+
+
+def _selects_single_entity(query: Select[Any]) -> bool:
+    descriptions = query.column_descriptions
+    return (
+        len(descriptions) == 1
+        and descriptions[0]["expr"] is descriptions[0]["entity"]
+    )
+
+
+async def paginate(
+    info: Info[Any, Any],
+    query: Select[Any],
+    key: InstrumentedAttribute[Any],
+    to_node: Callable[[Any], NodeType],
+    first: int = DEFAULT_PAGE_SIZE,
+    after: Optional[str] = None,
+    decode_key: Callable[[str], Any] = decode_uuid_cursor,
+) -> Connection[NodeType]:
+    """
+    Fetch one page of ``query`` as a connection.
+
+    Args:
+        info: Resolver info; its context provides the database session
+        query: Unordered, unpaginated select of ORM entities or columns
+        key: Unique column used for ordering and cursors (must be selected)
+        to_node: Converts an ORM entity or row to the GraphQL node type
+        first: Page size
+        after: Cursor of the last edge of the previous page
+        decode_key: Parses a decoded cursor into a key value
+
+    Returns:
+        The page, with ``totalCount`` deferred until it is resolved
+
+    Raises:
+        StrawberryGraphQLError: If ``first`` is out of range or the cursor is malformed
+    """
+    if not 1 <= first <= MAX_PAGE_SIZE:
+        raise StrawberryGraphQLError(f"first must be between 1 and {MAX_PAGE_SIZE}")
+
+    page_query = query.order_by(key).limit(first + 1)
+    if after is not None:
+        try:
+            page_query = page_query.where(key > decode_key(after))
+        except ValueError:
+            raise StrawberryGraphQLError("Invalid pagination cursor")
+
+    async with info.context.session() as db:
+        result = await db.execute(page_query)
+        rows = result.scalars().all() if _selects_single_entity(query) else result.all()
+
+    has_next_page = len(rows) > first
+    edges = [
+        Edge(cursor=encode_cursor(getattr(row, key.key)), node=to_node(row))
+        for row in rows[:first]
+    ]
+
+    async def count_total() -> int:
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        async with info.context.session() as db:
+            total: int = (await db.execute(count_query)).scalar_one()
+        return total
+
+    return Connection(
+        edges=edges,
+        page_info=PageInfo(
+            has_next_page=has_next_page,
+            # Cheap approximation allowed by the Relay spec for forward paging
+            has_previous_page=after is not None,
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+        ),
+        count_total=count_total,
+    )
@@ -0,0 +1,183 @@
+"""
+Automatic persisted queries (APQ) for the GraphQL endpoint.
+
+Clients send ``extensions.persistedQuery.sha256Hash`` instead of the
+query text. The first time a hash is unknown the server answers
+``PersistedQueryNotFound`` and the client retries with both the hash and
+the text, which registers it. In allow-list mode only operations from a
+manifest (``{"<sha256>": "<query>"}``) may run, and clients cannot
+register new ones.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from graphql import GraphQLError
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLRequestData
+from strawberry.types import ExecutionResult
+
+from app.core.cache import TTLCache
+from app.core.config import Settings, get_settings
+
+PERSISTED_QUERY_VERSION = 1
+
+
+def query_hash(query: str) -> str:
+    """Return the hex SHA-256 digest identifying a query text."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def _error(message: str, code: str) -> GraphQLError:
+    return GraphQLError(message, extensions={"code": code})
+
+
+class PersistedQueryStore:
+    """Maps query hashes to query texts for registered and APQ operations."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        manifest: Optional[Dict[str, str]] = None,
+        allow_list_only: bool = False,
+    ) -> None:
+        """
+        Args:
+            maxsize: Maximum number of client-registered queries kept (LRU)
+            manifest: Pre-registered ``{sha256: query}`` operations
+            allow_list_only: Reject every operation missing from the manifest
+        """
+        self.registered = dict(manifest or {})
+        self.allow_list_only = allow_list_only
+        self._queries: TTLCache[str] = TTLCache(maxsize=maxsize, ttl=float("inf"))
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "PersistedQueryStore":
+        manifest = None
+        if settings.graphql_persisted_queries_path:
+            manifest = cls.load_manifest(settings.graphql_persisted_queries_path)
+        elif settings.graphql_persisted_queries_only:
+            raise ValueError(
+                "GRAPHQL_PERSISTED_QUERIES_ONLY requires GRAPHQL_PERSISTED_QUERIES_PATH"
+            )
+        return cls(
+            maxsize=settings.graphql_persisted_query_cache_size,
+            manifest=manifest,
+            allow_list_only=settings.graphql_persisted_queries_only,
+        )
+
+    @staticmethod
+    def load_manifest(path: str) -> Dict[str, str]:
+        """
+        Load a ``{sha256: query}`` manifest file.
+
+        Raises:
+            ValueError: If an entry's hash does not match its query
+        """
+        with open(path, encoding="utf-8") as manifest_file:
+            manifest: Dict[str, str] = json.load(manifest_file)
+        for digest, query in manifest.items():
+            if query_hash(query) != digest:
+                raise ValueError(f"Persisted query manifest hash mismatch for {digest}")
+        return manifest
+
+    def lookup(self, digest: str) -> Optional[str]:
+        """Return the query text registered for a hash, if any."""
+        query = self.registered.get(digest)
+        if query is None and not self.allow_list_only:
+            query = self._queries.get(digest)
+        return query
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters for client-registered queries."""
+        return self._queries.stats()
+
+    def resolve(self, request_data: GraphQLRequestData) -> Optional[GraphQLError]:
+        """
+        Apply the APQ protocol to a request.
+
+        Fills in ``request_data.query`` for hash-only requests and
+        registers new hash/query pairs.
+
+        Returns:
+            An error to send back instead of executing, or None
+        """
+        extensions: Dict[str, Any] = request_data.extensions or {}
+        persisted = extensions.get("persistedQuery")
+
+        if persisted is None:
+            if self.allow_list_only and (
+                request_data.query is None
+                or query_hash(request_data.query) not in self.registered
+            ):
+                return _error("PersistedQueryNotAllowed", "PERSISTED_QUERY_NOT_ALLOWED")
+            return None
+
+        if (
+            not isinstance(persisted, dict)
+            or persisted.get("version") != PERSISTED_QUERY_VERSION
+            or not isinstance(persisted.get("sha256Hash"), str)
+        ):
+            return _error("PersistedQueryNotSupported", "PERSISTED_QUERY_NOT_SUPPORTED")
+        digest = persisted["sha256Hash"]
+
+        if request_data.query is None:
+            query = self.lookup(digest)
+            if query is None:
+                return _error("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+            request_data.query = query
+            return None
+
+        if query_hash(request_data.query) != digest:
+            return _error(
+                "provided sha does not match query", "PERSISTED_QUERY_HASH_MISMATCH"
+            )
+        if digest not in self.registered:
+            if self.allow_list_only:
+                return _error("PersistedQueryNotAllowed", "PERSISTED_QUERY_NOT_ALLOWED")
+            self._queries.set(digest, request_data.query)
+        return None
+
+
+persisted_queries = PersistedQueryStore.from_settings(get_settings())
+
+
+class PersistedQueryRouter(GraphQLRouter):
+    """GraphQL router that resolves persisted query hashes before execution."""
+
+    def __init__(
+        self,
+        *args: Any,
+        store: PersistedQueryStore = persisted_queries,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.store = store
+
+    def should_render_graphql_ide(self, request: Any) -> bool:
+        # Hash-only GET requests carry no query but must still execute
+        if request.query_params.get("extensions") is not None:
+            return False
+        return super().should_render_graphql_ide(request)
+
+    async def execute_single(
+        self,
+        request: Any,
+        request_adapter: Any,
+        sub_response: Any,
+        context: Any,
+        root_value: Any,
+        request_data: GraphQLRequestData,
+    ) -> ExecutionResult:
+        error = self.store.resolve(request_data)
+        if error is not None:
+            return ExecutionResult(data=None, errors=[error])
+        return await super().execute_single(
+            request=request,
+            request_adapter=request_adapter,
+            sub_response=sub_response,
+            context=context,
+            root_value=root_value,
+            request_data=request_data,
+        )
@@ -0,0 +1,75 @@
+"""
+Column projection for GraphQL resolvers.
+
+Maps the fields a query selects on a Strawberry type to the model
+columns backing them, so resolvers can select just those columns
+instead of loading full ORM instances.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Sequence, Set
+
+from sqlalchemy.orm import InstrumentedAttribute
+from strawberry.types import Info
+from strawberry.types.nodes import SelectedField, Selection
+
+
+@lru_cache(maxsize=None)
+def type_columns(model: Any, type_cls: Any) -> Dict[str, InstrumentedAttribute[Any]]:
+    """
+    Return the model columns exposed as fields of a Strawberry type.
+
+    Columns without a matching field (such as ``password_hash``) are
+    never included.
+
+    Returns:
+        Column attributes keyed by the field's Python name, in field order
+    """
+    column_names = set(model.__mapper__.column_attrs.keys())
+    return {
+        field.python_name: getattr(model, field.python_name)
+        for field in type_cls.__strawberry_definition__.fields
+        if field.python_name in column_names
+    }
+
+
+def _selected_names(selections: Iterable[Selection], names: Set[str]) -> None:
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            names.add(selection.name)
+        else:
+            # Fragment spreads and inline fragments
+            _selected_names(selection.selections, names)
+
+
+def selected_columns(
+    info: Info[Any, Any],
+    model: Any,
+    type_cls: Any,
+    required: Sequence[str] = ("id",),
+) -> List[InstrumentedAttribute[Any]]:
+    """
+    Return the columns needed to resolve the current field's selection.
+
+    Args:
+        info: Resolver info for a field returning ``type_cls`` (or a list of it)
+        model: SQLAlchemy model backing the type
+        type_cls: Strawberry type being resolved
+        required: Python names of columns to load even when not selected,
+            e.g. keys used by nested resolvers
+
+    Returns:
+        Column attributes in field order
+    """
+    selected: Set[str] = set()
+    for field in info.selected_fields:
+        _selected_names(field.selections, selected)
+
+    name_converter = info.schema.config.name_converter
+    wanted = set(required)
+    for field in type_cls.__strawberry_definition__.fields:
+        if name_converter.from_field(field) in selected:
+            wanted.add(field.python_name)
+
+    columns = type_columns(model, type_cls)
+    return [column for name, column in columns.items() if name in wanted]
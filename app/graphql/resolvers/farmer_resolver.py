@@ -0,0 +1,101 @@
+"""
+Farmer GraphQL resolvers for Farmers Marketplace.
+"""
+
+from typing import Optional
+from uuid import UUID
+
+import strawberry
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from strawberry.exceptions import StrawberryGraphQLError
+from strawberry.types import Info
+
+from app.graphql.context import GraphQLContext
+from app.graphql.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    Connection,
+    paginate,
+)
+from app.graphql.types.farmer_type import Farmer
+from app.models.farmers.farmer import Farmer as FarmerModel
+from app.services.farmer_service import FarmerService
+
+# Same bounds as the REST location search
+MIN_RADIUS_KM = 0.1
+MAX_RADIUS_KM = 500.0
+
+
+@strawberry.type
+class FarmerQuery:
+    """Farmer-related GraphQL queries."""
+
+    @strawberry.field
+    async def farmers(
+        self, info: Info[GraphQLContext, None], skip: int = 0, limit: int = 20
+    ) -> list[Farmer]:
+        """Get farmers with pagination, ordered by ID."""
+        if not 1 <= limit <= MAX_PAGE_SIZE or skip < 0:
+            raise StrawberryGraphQLError(
+                f"limit must be between 1 and {MAX_PAGE_SIZE} "
+                "and skip must not be negative"
+            )
+        async with info.context.session() as db:
+            farmer_models = await FarmerService.get_all(db, skip=skip, limit=limit)
+
+        loaders = info.context.loaders
+        for farmer_model in farmer_models:
+            loaders.farmer_by_id.prime(farmer_model.id, farmer_model)
+        return [Farmer.from_model(farmer) for farmer in farmer_models]
+
+    @strawberry.field
+    async def farmers_connection(
+        self,
+        info: Info[GraphQLContext, None],
+        first: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+    ) -> Connection[Farmer]:
+        """Get farmers as a Relay connection, ordered by ID."""
+        query = select(FarmerModel).options(selectinload(FarmerModel.location))
+        return await paginate(
+            info, query, FarmerModel.id, Farmer.from_model, first, after
+        )
+
+    @strawberry.field
+    async def farmer(
+        self, info: Info[GraphQLContext, None], id: UUID
+    ) -> Optional[Farmer]:
+        """Get farmer by ID."""
+        farmer_model = await info.context.loaders.farmer_by_id.load(id)
+        return Farmer.from_model(farmer_model) if farmer_model else None
+
+    @strawberry.field
+    async def nearby_farmers(
+        self,
+        info: Info[GraphQLContext, None],
+        lat: float,
+        lng: float,
+        radius: float = 50.0,
+        first: int = 20,
+    ) -> list[Farmer]:
+        """Get the farmers closest to a point within a radius (km), closest first."""
+        if not MIN_RADIUS_KM <= radius <= MAX_RADIUS_KM:
+            raise StrawberryGraphQLError(
+                f"radius must be between {MIN_RADIUS_KM:g} and {MAX_RADIUS_KM:g} km"
+            )
+        if not 1 <= first <= MAX_PAGE_SIZE:
+            raise StrawberryGraphQLError(f"first must be between 1 and {MAX_PAGE_SIZE}")
+
+        async with info.context.session() as db:
+            farmers = await FarmerService.search_cached_by_location(
+                db, lat, lng, radius, order_by="distance", limit=first
+            )
+        return [Farmer.from_model(farmer) for farmer in farmers]
+
+    @strawberry.field
+    async def organic_farmers(self, info: Info[GraphQLContext, None]) -> list[Farmer]:
+        """Get all organic certified farmers."""
+        async with info.context.session() as db:
+            farmers = await FarmerService.get_cached_organic_farmers(db)
+        return [Farmer.from_model(farmer) for farmer in farmers]
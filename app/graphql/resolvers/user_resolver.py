@@ -9,8 +9,13 @@ import strawberry
 from fastapi import HTTPException
 from sqlalchemy import select
 from strawberry.exceptions import StrawberryGraphQLError
+from strawberry.types import Info
 
-from app.core.database import get_db
+from app.core.dependencies import invalidate_principal
+from app.core.hashing import PasswordHasherBusy
+from app.graphql.context import GraphQLContext
+from app.graphql.pagination import DEFAULT_PAGE_SIZE, Connection, paginate
+from app.graphql.projection import selected_columns, type_columns
 from app.graphql.types.user_type import User, UserInput
 from app.models.users.user import User as UserModel
 from app.models.users.user import UserType as UserTypeEnum
@@ -22,40 +27,56 @@ class UserQuery:
     """User-related GraphQL queries."""
 
     @strawberry.field
-    async def user(self, id: UUID) -> Optional[User]:
+    async def user(self, info: Info[GraphQLContext, None], id: UUID) -> Optional[User]:
         """Get user by ID."""
-        async for db in get_db():
-            query = select(UserModel).where(UserModel.id == id)
-            result = await db.execute(query)
-            user_model = result.scalar_one_or_none()
-
-            if not user_model:
-                return None
+        user_model = await info.context.loaders.user_by_id.load(id)
+        if not user_model:
+            return None
 
-            return User.from_model(user_model)
-        return None
+        return User.from_model(user_model)
 
     @strawberry.field
-    async def users(self, skip: int = 0, limit: int = 100) -> list[User]:
+    async def users(
+        self, info: Info[GraphQLContext, None], skip: int = 0, limit: int = 100
+    ) -> list[User]:
         """Get list of users with pagination."""
-        async for db in get_db():
-            query = select(UserModel).offset(skip).limit(limit)
+        # Select only the columns the query asks for and build the
+        # response from plain rows rather than ORM instances
+        columns = selected_columns(info, UserModel, User)
+        async with info.context.session() as db:
+            # Ordered so offset pages are stable; id is always projected
+            query = (
+                select(*columns).order_by(UserModel.id).offset(skip).limit(limit)
+            )
             result = await db.execute(query)
-            user_models = result.scalars().all()
+            rows = result.all()
 
-            return [User.from_model(user) for user in user_models]
-        return []
+        return [User.from_model(row) for row in rows]
 
     @strawberry.field
-    async def current_user(self, token: str) -> Optional[User]:
+    async def users_connection(
+        self,
+        info: Info[GraphQLContext, None],
+        first: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+    ) -> Connection[User]:
+        """Get users as a Relay connection, ordered by ID."""
+        query = select(*type_columns(UserModel, User).values())
+        return await paginate(
+            info, query, UserModel.id, User.from_model, first, after
+        )
+
+    @strawberry.field
+    async def current_user(
+        self, info: Info[GraphQLContext, None], token: str
+    ) -> Optional[User]:
         """Get current authenticated user."""
-        async for db in get_db():
+        async with info.context.session() as db:
             try:
                 user_model = await auth_service.get_current_user_from_token(db, token)
-                return User.from_model(user_model)
             except HTTPException:
                 return None
-        return None
+        return User.from_model(user_model)
 
 
 @strawberry.type
@@ -63,11 +84,13 @@ class UserMutation:
     """User-related GraphQL mutations."""
 
     @strawberry.field
-    async def create_user(self, user_input: UserInput) -> User:
+    async def create_user(
+        self, info: Info[GraphQLContext, None], user_input: UserInput
+    ) -> User:
         """Create a new user."""
         from app.schemas.user import UserCreate
 
-        async for db in get_db():
+        async with info.context.session() as db:
             try:
                 # Convert GraphQL enum string to SQLAlchemy enum
                 user_type_enum = UserTypeEnum(user_input.user_type.value)
@@ -85,15 +108,20 @@ class UserMutation:
             except HTTPException as e:
                 # Convert HTTPException to Strawberry error
                 raise StrawberryGraphQLError(str(e.detail))
+            except PasswordHasherBusy as e:
+                raise StrawberryGraphQLError(
+                    str(e), extensions={"code": "SERVICE_BUSY"}
+                )
             except Exception:
                 # Log unexpected errors but don't expose internal details
                 raise StrawberryGraphQLError("Failed to create user")
-        raise RuntimeError("Database session not available")
 
     @strawberry.field
-    async def delete_user(self, id: UUID, token: str) -> bool:
+    async def delete_user(
+        self, info: Info[GraphQLContext, None], id: UUID, token: str
+    ) -> bool:
         """Delete a user (requires authentication)."""
-        async for db in get_db():
+        async with info.context.session() as db:
             try:
                 # Verify current user (authentication check)
                 await auth_service.get_current_user_from_token(db, token)
@@ -108,6 +136,9 @@ class UserMutation:
 
                 await db.delete(user)
                 await db.commit()
+                invalidate_principal(user.email)
+                info.context.loaders.user_by_id.clear(id)
+                info.context.loaders.user_by_email.clear(user.email)
                 return True
             except HTTPException:
                 # Authentication failed - return False instead of raising error
@@ -115,4 +146,3 @@ class UserMutation:
             except Exception:
                 # Log unexpected errors but don't expose internal details
                 raise StrawberryGraphQLError("Failed to delete user")
-        return False
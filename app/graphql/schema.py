@@ -2,17 +2,17 @@
 GraphQL schema for Farmers Marketplace.
 """
 
-from typing import Any
-
 import strawberry
-from strawberry.fastapi import GraphQLRouter
-from strawberry.schema.schema import Schema
 
+from app.graphql.context import get_context
+from app.graphql.extensions import DocumentCache, OperationMetrics, QueryCostLimiter
+from app.graphql.persisted_queries import PersistedQueryRouter
+from app.graphql.resolvers.farmer_resolver import FarmerQuery
 from app.graphql.resolvers.user_resolver import UserMutation, UserQuery
 
 
 @strawberry.type
-class Query(UserQuery):
+class Query(UserQuery, FarmerQuery):
     """
     GraphQL queries for Farmers Marketplace.
     """
@@ -36,7 +36,13 @@ class Mutation(UserMutation):
 
 
 # Create the schema
-schema = strawberry.Schema(query=Query, mutation=Mutation)
-
-# Create GraphQL router for FastAPI
-graphql_router: GraphQLRouter[Schema, Any] = GraphQLRouter(schema)
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    extensions=[OperationMetrics, DocumentCache, QueryCostLimiter],
+)
+
+# Create GraphQL router for FastAPI (resolves persisted query hashes)
+graphql_router: PersistedQueryRouter = PersistedQueryRouter(
+    schema, context_getter=get_context
+)
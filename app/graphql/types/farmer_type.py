@@ -0,0 +1,87 @@
+"""
+Farmer and Location GraphQL types for Farmers Marketplace.
+"""
+
+from typing import TYPE_CHECKING, Annotated, Any, Optional
+from uuid import UUID
+
+import strawberry
+from strawberry.types import Info
+
+if TYPE_CHECKING:
+    from app.graphql.context import GraphQLContext
+    from app.graphql.types.user_type import User
+
+
+@strawberry.type
+class Location:
+    """GraphQL Location type."""
+
+    id: int
+    address: Optional[str]
+    city: Optional[str]
+    state: Optional[str]
+    country: Optional[str]
+    latitude: float
+    longitude: float
+
+    @classmethod
+    def from_model(cls, location_model: Any) -> "Location":
+        """Convert a SQLAlchemy Location (or location schema) to the GraphQL type."""
+        return cls(
+            id=location_model.id,
+            address=location_model.address,
+            city=location_model.city,
+            state=location_model.state,
+            country=location_model.country,
+            latitude=location_model.latitude,
+            longitude=location_model.longitude,
+        )
+
+
+@strawberry.type
+class Farmer:
+    """GraphQL Farmer type."""
+
+    id: UUID
+    user_id: UUID
+    farm_name: str
+    farm_size: Optional[float]
+    organic_certified: bool
+    description: Optional[str]
+    location: Optional[Location]
+    distance_km: Optional[float] = strawberry.field(
+        default=None,
+        description="Distance from the search point (nearby searches only)",
+    )
+
+    @strawberry.field
+    async def user(
+        self, info: Info["GraphQLContext", None]
+    ) -> Optional[Annotated["User", strawberry.lazy("app.graphql.types.user_type")]]:
+        """The user account owning this farmer profile."""
+        from app.graphql.types.user_type import User
+
+        user_model = await info.context.loaders.user_by_id.load(self.user_id)
+        return User.from_model(user_model) if user_model else None
+
+    @classmethod
+    def from_model(
+        cls, farmer_model: Any, distance_km: Optional[float] = None
+    ) -> "Farmer":
+        """
+        Convert a SQLAlchemy Farmer (or farmer response schema) to the GraphQL type.
+
+        The farmer's location must already be loaded.
+        """
+        location = farmer_model.location
+        return cls(
+            id=farmer_model.id,
+            user_id=farmer_model.user_id,
+            farm_name=farmer_model.farm_name,
+            farm_size=farmer_model.farm_size,
+            organic_certified=farmer_model.organic_certified,
+            description=farmer_model.description,
+            location=Location.from_model(location) if location else None,
+            distance_km=getattr(farmer_model, "distance_km", distance_km),
+        )
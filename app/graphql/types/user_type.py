@@ -4,12 +4,17 @@ User GraphQL types for Farmers Marketplace.
 
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Annotated, Any, Optional, Union
 from uuid import UUID
 
 import strawberry
+from strawberry.types import Info
 
 if TYPE_CHECKING:
+    from app.graphql.context import GraphQLContext
+    from app.graphql.types.farmer_type import Farmer
+    from sqlalchemy import Row
+
     from app.models.users.user import User as UserModel
 
 
@@ -34,17 +39,37 @@ class User:
     created_at: datetime
     updated_at: datetime
 
+    @strawberry.field
+    async def farmer(
+        self, info: Info["GraphQLContext", None]
+    ) -> Optional[
+        Annotated["Farmer", strawberry.lazy("app.graphql.types.farmer_type")]
+    ]:
+        """Farmer profile of this user, if they have one."""
+        from app.graphql.types.farmer_type import Farmer
+
+        farmer_model = await info.context.loaders.farmer_by_user_id.load(self.id)
+        return Farmer.from_model(farmer_model) if farmer_model else None
+
     @classmethod
-    def from_model(cls, user_model: "UserModel") -> "User":
-        """Convert SQLAlchemy User model to GraphQL User type."""
+    def from_model(cls, user_model: Union["UserModel", "Row[Any]"]) -> "User":
+        """
+        Convert a SQLAlchemy User, or a row of some of its columns, to the GraphQL type.
+
+        Columns missing from a projected row are left unset; resolvers
+        only leave out columns the query did not select.
+        """
+        # Unselected fields are never resolved, so None stands in for them
+        unset: Any = None
+        user_type = getattr(user_model, "user_type", None)
         return cls(
             id=user_model.id,
-            email=user_model.email,
-            user_type=UserType(user_model.user_type.value),
-            is_active=user_model.is_active,
-            is_verified=user_model.is_verified,
-            created_at=user_model.created_at,
-            updated_at=user_model.updated_at,
+            email=getattr(user_model, "email", unset),
+            user_type=UserType(user_type.value) if user_type is not None else unset,
+            is_active=getattr(user_model, "is_active", unset),
+            is_verified=getattr(user_model, "is_verified", unset),
+            created_at=getattr(user_model, "created_at", unset),
+            updated_at=getattr(user_model, "updated_at", unset),
         )
 
 
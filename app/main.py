@@ -14,15 +14,21 @@ TODO: Expand this application with:
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from loguru import logger
 
 from app.api.auth import router as auth_router
 from app.api.users import router as users_router
 from app.api.farmers import router as farmers_router
+from app.api.exports import router as exports_router
 from app.core.config import get_settings
-from app.core.database import init_db
+from app.core.database import init_db, warm_up_pool
+from app.core.hashing import PasswordHasherBusy, password_hasher
+from app.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from app.core.metrics import MetricsMiddleware, registry
+from app.core.middleware import QueryStatsMiddleware, RequestCoalescingMiddleware
 from app.graphql.schema import graphql_router
 # from app.core.middleware import AuthenticationMiddleware
 
@@ -33,8 +39,14 @@ async def lifespan(app: FastAPI):
     logger.info("Starting up...")
     await init_db()
     logger.info("Database initialized")
+    try:
+        await warm_up_pool()
+    except Exception as e:
+        # Requests will open connections on demand instead
+        logger.warning(f"Database pool warm-up failed: {e}")
     yield
     logger.info("Shutting down...")
+    password_hasher.shutdown()
 
 
 # Initialize FastAPI application
@@ -48,6 +60,15 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Identical concurrent GETs share one response. Added first so it runs
+# inside CORS, which must still answer each request for its own Origin.
+if settings.request_coalescing_enabled:
+    app.add_middleware(
+        RequestCoalescingMiddleware,
+        paths=settings.request_coalescing_paths,
+        exclude_paths=settings.request_coalescing_exclude_paths,
+    )
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -57,6 +78,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Count SQL statements per request and flag likely N+1 patterns
+if settings.query_stats_enabled:
+    app.add_middleware(
+        QueryStatsMiddleware,
+        repeat_threshold=settings.query_repeat_warning_threshold,
+    )
+
+# Record per-route latency and status codes for /metrics
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 # Optional: Add authentication middleware for automatic route protection
 # Uncomment the lines below to enable automatic authentication for protected paths
 # app.add_middleware(
@@ -66,6 +98,19 @@ app.add_middleware(
 #     require_auth_by_default=False
 # )
 
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(
+    request: Request, exc: PasswordHasherBusy
+) -> JSONResponse:
+    """Answer requests rejected by the saturated hashing pool with 503."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 # Include GraphQL router
 app.include_router(graphql_router, prefix="/graphql", tags=["graphql"])
 
@@ -73,6 +118,7 @@ app.include_router(graphql_router, prefix="/graphql", tags=["graphql"])
 app.include_router(auth_router, prefix="/auth", tags=["authentication"])
 app.include_router(users_router, prefix="/api/users", tags=["users"])
 app.include_router(farmers_router, prefix="/api/farmers", tags=["farmers"])
+app.include_router(exports_router, prefix="/api/exports", tags=["exports"])
 
 
 # Basic root endpoint
@@ -88,6 +134,12 @@ async def root():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus metrics endpoint."""
+    return Response(registry.render(), media_type=METRICS_CONTENT_TYPE)
+
+
 # TODO: Contributors should add additional routers and middleware:
 # app.include_router(api_router, prefix="/api/v1", tags=["api"])
 # app.include_router(mobile_router, prefix="/mobile", tags=["mobile"])
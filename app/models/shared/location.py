@@ -2,10 +2,11 @@
 Location model for storing geographical coordinates and address information.
 """
 
-from sqlalchemy import Float, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from typing import TYPE_CHECKING
+from sqlalchemy import Float, Index, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
+from typing import TYPE_CHECKING, Optional
 
+from app.core.geo import GEOHASH_PRECISION, encode_geohash
 from app.models.base import Base
 
 if TYPE_CHECKING:
@@ -16,6 +17,7 @@ class Location(Base):
     """Location model for storing address and coordinates."""
 
     __tablename__ = "locations"
+    __table_args__ = (Index("ix_locations_lat_lng", "latitude", "longitude"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     address: Mapped[str] = mapped_column(String(255), nullable=True)
@@ -24,6 +26,21 @@ class Location(Base):
     country: Mapped[str] = mapped_column(String(100), nullable=True)
     latitude: Mapped[float] = mapped_column(Float, nullable=False)
     longitude: Mapped[float] = mapped_column(Float, nullable=False)
+    # Spatial index key, kept in sync with latitude/longitude
+    geohash: Mapped[Optional[str]] = mapped_column(
+        String(GEOHASH_PRECISION), nullable=True, index=True
+    )
 
     # Reverse relation added in Farmer model
-    farmer: Mapped["Farmer"] = relationship("Farmer", back_populates="location", uselist=False) 
\ No newline at end of file
+    farmer: Mapped["Farmer"] = relationship(
+        "Farmer", back_populates="location", uselist=False
+    )
+
+    @validates("latitude", "longitude")
+    def _sync_geohash(self, key: str, value: float) -> float:
+        """Recompute the geohash whenever a coordinate changes."""
+        lat = value if key == "latitude" else self.latitude
+        lng = value if key == "longitude" else self.longitude
+        if lat is not None and lng is not None:
+            self.geohash = encode_geohash(lat, lng)
+        return value
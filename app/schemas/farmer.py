@@ -1,6 +1,6 @@
 from uuid import UUID
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 from app.schemas.location import LocationCreate, LocationResponse
 
@@ -23,4 +23,34 @@ class FarmerResponse(FarmerBase):
     location: Optional[LocationResponse] = None
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+
+class NearbyFarmerResponse(FarmerResponse):
+    distance_km: float = Field(
+        ..., description="Great-circle distance from the search point"
+    )
+
+
+class FarmerBulkError(BaseModel):
+    row: int = Field(..., description="1-based position of the record in the input")
+    error: str
+
+
+class FarmerBulkResult(BaseModel):
+    created: int = 0
+    failed: int = 0
+    farmer_ids: List[UUID] = Field(default_factory=list)
+    errors: List[FarmerBulkError] = Field(default_factory=list)
+
+
+class FarmerBatchRequest(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1, max_length=100)
+
+
+class FarmerBatchResponse(BaseModel):
+    results: List[Optional[FarmerResponse]] = Field(
+        ...,
+        description="One entry per requested ID, in request order (null if not found)",
+    )
+    missing: List[UUID] = Field(default_factory=list)
@@ -3,7 +3,7 @@ User-related Pydantic schemas for API requests and responses.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
@@ -46,6 +46,22 @@ class UserResponse(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserBatchRequest(BaseModel):
+    """Schema for fetching many users by ID."""
+
+    ids: List[UUID] = Field(..., min_length=1, max_length=100)
+
+
+class UserBatchResponse(BaseModel):
+    """Schema for a batch lookup, aligned with the requested IDs."""
+
+    results: List[Optional[UserResponse]] = Field(
+        ...,
+        description="One entry per requested ID, in request order (null if not found)",
+    )
+    missing: List[UUID] = Field(default_factory=list)
+
+
 class UserInDB(UserResponse):
     """Schema for user in database (includes password hash)."""
 
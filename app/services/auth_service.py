@@ -3,15 +3,19 @@ Authentication service for user registration, login, and password management.
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
+from uuid import UUID
 
 import bcrypt
 from fastapi import HTTPException, status
 from jose import JWTError, jwt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.core.config import get_settings
+from app.core.hashing import password_hasher
+from app.core.security import decode_access_token
 from app.models.users.user import User
 from app.schemas.user import TokenData, UserCreate
 
@@ -43,6 +47,29 @@ class AuthService:
         result = await db.execute(select(User).where(User.email == email))
         return result.scalar_one_or_none()
 
+    async def get_users_by_ids(
+        self,
+        db: AsyncSession,
+        user_ids: List[UUID],
+        columns: Optional[Sequence[Any]] = None,
+    ) -> List[Optional[User]]:
+        """
+        Get many users by ID with one query, aligned with the requested IDs.
+
+        Args:
+            db: Database session
+            user_ids: User IDs, possibly repeated
+            columns: Optional subset of columns to load; others stay deferred
+        """
+        if not user_ids:
+            return []
+        query = select(User).where(User.id.in_(set(user_ids)))
+        if columns is not None:
+            query = query.options(load_only(*columns))
+        result = await db.execute(query)
+        by_id = {user.id: user for user in result.scalars().all()}
+        return [by_id.get(user_id) for user_id in user_ids]
+
     async def authenticate_user(
         self, db: AsyncSession, email: str, password: str
     ) -> Optional[User]:
@@ -50,7 +77,7 @@ class AuthService:
         user = await self.get_user_by_email(db, email)
         if not user:
             return None
-        if not self.verify_password(password, user.password_hash):
+        if not await password_hasher.verify(password, user.password_hash):
             return None
         return user
 
@@ -65,7 +92,7 @@ class AuthService:
             )
 
         # Create new user
-        hashed_password = self.get_password_hash(user_create.password)
+        hashed_password = await password_hasher.hash(user_create.password)
         db_user = User(
             email=user_create.email,
             password_hash=hashed_password,
@@ -104,9 +131,7 @@ class AuthService:
         )
 
         try:
-            payload = jwt.decode(
-                token, self.settings.secret_key, algorithms=[self.settings.algorithm]
-            )
+            payload = decode_access_token(token)
             email = payload.get("sub")
             if email is None:
                 raise credentials_exception
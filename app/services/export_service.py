@@ -0,0 +1,110 @@
+"""
+Export service for bulk data extraction.
+
+Streams farmers (with their location) and users from a server-side
+cursor in fixed-size batches, so memory stays flat regardless of how
+large the tables are.
+"""
+
+from typing import Any, AsyncIterator, Dict, List, Union
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import Label
+
+from app.models.farmers.farmer import Farmer
+from app.models.shared.location import Location
+from app.models.users.user import User
+
+# Mapped attributes and labels, both of which carry the row key
+ExportColumn = Union[InstrumentedAttribute[Any], Label[Any]]
+
+FARMER_EXPORT_COLUMNS: List[ExportColumn] = [
+    Farmer.id,
+    Farmer.user_id,
+    Farmer.farm_name,
+    Farmer.farm_size,
+    Farmer.organic_certified,
+    Farmer.description,
+    Location.address.label("location_address"),
+    Location.city.label("location_city"),
+    Location.state.label("location_state"),
+    Location.country.label("location_country"),
+    Location.latitude.label("location_latitude"),
+    Location.longitude.label("location_longitude"),
+]
+
+# password_hash is deliberately never exported
+USER_EXPORT_COLUMNS: List[ExportColumn] = [
+    User.id,
+    User.username,
+    User.email,
+    User.user_type,
+    User.is_active,
+    User.is_verified,
+    User.created_at,
+    User.updated_at,
+]
+
+
+class ExportService:
+    """Service class for streaming table exports."""
+
+    @staticmethod
+    def farmer_fields() -> List[str]:
+        """Field names of exported farmer rows, in column order."""
+        return [column.key for column in FARMER_EXPORT_COLUMNS]
+
+    @staticmethod
+    def user_fields() -> List[str]:
+        """Field names of exported user rows, in column order."""
+        return [column.key for column in USER_EXPORT_COLUMNS]
+
+    @staticmethod
+    async def _stream(
+        db: AsyncSession, query: Select[Any], batch_size: int
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        async for partition in result.mappings().partitions(batch_size):
+            yield [dict(row) for row in partition]
+
+    @staticmethod
+    async def stream_farmers(
+        db: AsyncSession, batch_size: int = 1000
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream all farmers joined with their location.
+
+        Args:
+            db: Database session
+            batch_size: Rows fetched from the cursor per batch
+
+        Yields:
+            Batches of flat farmer rows
+        """
+        query = (
+            select(*FARMER_EXPORT_COLUMNS)
+            .outerjoin(Location, Farmer.location_id == Location.id)
+            .order_by(Farmer.id)
+        )
+        async for batch in ExportService._stream(db, query, batch_size):
+            yield batch
+
+    @staticmethod
+    async def stream_users(
+        db: AsyncSession, batch_size: int = 1000
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream all users without credentials.
+
+        Args:
+            db: Database session
+            batch_size: Rows fetched from the cursor per batch
+
+        Yields:
+            Batches of user rows
+        """
+        query = select(*USER_EXPORT_COLUMNS).order_by(User.id)
+        async for batch in ExportService._stream(db, query, batch_size):
+            yield batch
@@ -4,28 +4,155 @@ Farmer service for business logic operations.
 Handles farmer CRUD operations, location-based search, and verification processes.
 """
 
-from typing import Optional, List
+import asyncio
+import heapq
+import uuid
+from time import monotonic
+from typing import (
+    Any,
+    AsyncIterable,
+    Dict,
+    Iterator,
+    Literal,
+    Optional,
+    List,
+    Set,
+    Tuple,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import and_, case, func, insert, or_, select
+from sqlalchemy.orm import contains_eager, selectinload
 from uuid import UUID
-from math import radians, sin, cos, sqrt, atan2
+from pydantic import TypeAdapter, ValidationError
 
+from app.core.cache import MemoryCacheBackend, ResultCache
+from app.core.config import get_settings
+from app.core.geo import (
+    GeoIndex,
+    bounding_box,
+    covering_geohashes,
+    encode_geohash,
+    geohash_prefix_range,
+    haversine_km,
+)
 from app.models.farmers.farmer import Farmer
 from app.models.shared.location import Location
-from app.schemas.farmer import FarmerCreate, FarmerUpdate
+from app.models.users.user import User
+from app.schemas.farmer import (
+    FarmerBulkError,
+    FarmerBulkResult,
+    FarmerCreate,
+    FarmerResponse,
+    FarmerUpdate,
+    NearbyFarmerResponse,
+)
+
+# Read-through cache for farmer read endpoints. Single farmers are
+# versioned per ID and every list/search result shares the "lists"
+# scope, so a write invalidates exactly the entries it can affect.
+_settings = get_settings()
+farmer_cache = ResultCache(
+    MemoryCacheBackend(
+        maxsize=_settings.farmer_cache_size, ttl=_settings.farmer_cache_ttl_seconds
+    ),
+    namespace="farmers",
+    ttl=_settings.farmer_cache_ttl_seconds,
+)
+LISTS_SCOPE = "lists"
+_farmer_adapter: TypeAdapter[Optional[FarmerResponse]] = TypeAdapter(
+    Optional[FarmerResponse]
+)
+_farmer_list_adapter: TypeAdapter[List[FarmerResponse]] = TypeAdapter(
+    List[FarmerResponse]
+)
+
+
+# Coordinates of every located farmer for nearest-farmer queries. Writes
+# through FarmerService update it in place; the periodic reload picks up
+# writes made by other processes.
+farmer_geo_index: GeoIndex[UUID] = GeoIndex()
+_geo_index_lock = asyncio.Lock()
+_geo_index_loaded_at = 0.0
+
+
+_nearby_list_adapter: TypeAdapter[List[NearbyFarmerResponse]] = TypeAdapter(
+    List[NearbyFarmerResponse]
+)
+
+LocationOrder = Literal["distance"]
+
+
+def _to_responses(farmers: List[Farmer]) -> List[FarmerResponse]:
+    return [FarmerResponse.model_validate(farmer) for farmer in farmers]
+
+
+def to_nearby_responses(
+    results: List[Tuple[Farmer, float]]
+) -> List[NearbyFarmerResponse]:
+    """Attach the computed distance (rounded to meters) to each farmer."""
+    return [
+        NearbyFarmerResponse(
+            **FarmerResponse.model_validate(farmer).model_dump(),
+            distance_km=round(distance, 3),
+        )
+        for farmer, distance in results
+    ]
 
 
 class FarmerService:
     """Service class for farmer business logic operations."""
     
     @staticmethod
-    async def get_all(db: AsyncSession) -> List[Farmer]:
-        """Get all farmers with their location information."""
-        result = await db.execute(
-            select(Farmer).options(selectinload(Farmer.location))
+    async def get_all(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Farmer]:
+        """Get farmers with their location information, ordered by ID."""
+        query = (
+            select(Farmer)
+            .options(selectinload(Farmer.location))
+            .order_by(Farmer.id)
+            .offset(skip)
         )
-        return result.scalars().all()
+        if limit is not None:
+            query = query.limit(limit)
+        result = await db.execute(query)
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_page(
+        db: AsyncSession,
+        limit: int,
+        after: Optional[UUID] = None
+    ) -> Tuple[List[Farmer], Optional[UUID]]:
+        """
+        Get a page of farmers using keyset pagination on the primary key.
+
+        Args:
+            db: Database session
+            limit: Maximum number of farmers to return
+            after: ID of the last farmer on the previous page
+
+        Returns:
+            Tuple of (farmers, ID to pass as ``after`` for the next page or
+            None when this is the last page)
+        """
+        query = (
+            select(Farmer)
+            .options(selectinload(Farmer.location))
+            .order_by(Farmer.id)
+            .limit(limit + 1)
+        )
+        if after is not None:
+            query = query.where(Farmer.id > after)
+
+        result = await db.execute(query)
+        farmers = list(result.scalars().all())
+        if len(farmers) > limit:
+            return farmers[:limit], farmers[limit - 1].id
+        return farmers, None
 
     @staticmethod
     async def get_by_id(db: AsyncSession, farmer_id: UUID) -> Optional[Farmer]:
@@ -37,6 +164,30 @@ class FarmerService:
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_by_ids(
+        db: AsyncSession, farmer_ids: List[UUID]
+    ) -> List[Optional[Farmer]]:
+        """
+        Get many farmers by ID with a single query.
+
+        Args:
+            db: Database session
+            farmer_ids: Farmer IDs, possibly repeated
+
+        Returns:
+            One entry per requested ID in request order, None for misses
+        """
+        if not farmer_ids:
+            return []
+        result = await db.execute(
+            select(Farmer)
+            .where(Farmer.id.in_(set(farmer_ids)))
+            .options(selectinload(Farmer.location))
+        )
+        by_id = {farmer.id: farmer for farmer in result.scalars().all()}
+        return [by_id.get(farmer_id) for farmer_id in farmer_ids]
+
     @staticmethod
     async def get_by_user_id(db: AsyncSession, user_id: UUID) -> Optional[Farmer]:
         """Get a farmer by user ID with location information."""
@@ -58,8 +209,161 @@ class FarmerService:
         db.add(farmer)
         await db.commit()
         await db.refresh(farmer)
+        if data.location:
+            farmer_geo_index.upsert(
+                farmer.id, data.location.latitude, data.location.longitude
+            )
+        await FarmerService.invalidate_cache(farmer.id)
         return farmer
 
+    @staticmethod
+    def _format_validation_error(error: ValidationError) -> str:
+        messages = []
+        for item in error.errors():
+            field = ".".join(str(part) for part in item["loc"])
+            messages.append(f"{field}: {item['msg']}" if field else item["msg"])
+        return "; ".join(messages)
+
+    @staticmethod
+    async def _insert_rows(db: AsyncSession, rows: List[FarmerCreate]) -> List[UUID]:
+        """Insert farmers and their locations with one multi-row INSERT each."""
+        location_values = []
+        for row in rows:
+            if row.location:
+                values = row.location.model_dump()
+                # Bulk inserts bypass the model's geohash validator
+                values["geohash"] = encode_geohash(
+                    values["latitude"], values["longitude"]
+                )
+                location_values.append(values)
+
+        location_ids: Iterator[int] = iter(())
+        if location_values:
+            result = await db.execute(
+                insert(Location).returning(Location.id, sort_by_parameter_order=True),
+                location_values,
+            )
+            location_ids = iter(result.scalars().all())
+
+        farmer_values = []
+        for row in rows:
+            values = row.model_dump(exclude={"location"})
+            values["id"] = uuid.uuid4()
+            values["location_id"] = next(location_ids) if row.location else None
+            farmer_values.append(values)
+
+        farmer_result = await db.execute(
+            insert(Farmer).returning(Farmer.id, sort_by_parameter_order=True),
+            farmer_values,
+        )
+        return list(farmer_result.scalars().all())
+
+    @staticmethod
+    async def _flush_chunk(
+        db: AsyncSession,
+        chunk: List[Tuple[int, FarmerCreate]],
+        seen_user_ids: Set[UUID],
+        result: FarmerBulkResult,
+    ) -> None:
+        """Check a chunk against the database and insert its valid rows."""
+        user_ids = [row.user_id for _, row in chunk]
+        existing_users = set(
+            (await db.execute(select(User.id).where(User.id.in_(user_ids)))).scalars()
+        )
+        profile_query = select(Farmer.user_id).where(Farmer.user_id.in_(user_ids))
+        with_profile = set((await db.execute(profile_query)).scalars())
+
+        valid: List[Tuple[int, FarmerCreate]] = []
+        for index, row in chunk:
+            if row.user_id not in existing_users:
+                error = "User not found"
+            elif row.user_id in seen_user_ids:
+                error = "Duplicate user_id in import"
+            elif row.user_id in with_profile:
+                error = "User already has a farmer profile"
+            else:
+                seen_user_ids.add(row.user_id)
+                valid.append((index, row))
+                continue
+            result.errors.append(FarmerBulkError(row=index, error=error))
+
+        if not valid:
+            return
+
+        try:
+            async with db.begin_nested():
+                result.farmer_ids.extend(
+                    await FarmerService._insert_rows(db, [row for _, row in valid])
+                )
+            return
+        except IntegrityError:
+            pass
+
+        # A concurrent write conflicted with the chunk; retry row by row
+        # so only the offending rows are reported
+        for index, row in valid:
+            try:
+                async with db.begin_nested():
+                    farmer_ids = await FarmerService._insert_rows(db, [row])
+                    result.farmer_ids.extend(farmer_ids)
+            except IntegrityError:
+                result.errors.append(
+                    FarmerBulkError(row=index, error="Conflicts with existing data")
+                )
+
+    @staticmethod
+    async def bulk_create(
+        db: AsyncSession,
+        records: AsyncIterable[Dict[str, Any]],
+        chunk_size: int = 500,
+    ) -> FarmerBulkResult:
+        """
+        Create many farmers (with optional locations) from raw records.
+
+        Records are validated as they arrive and inserted in chunks using
+        multi-row ``INSERT ... RETURNING`` statements, each chunk inside a
+        savepoint. Invalid records are reported individually and do not
+        abort the import. The transaction is committed once at the end.
+
+        Args:
+            db: Database session
+            records: Raw farmer records in ``FarmerCreate`` shape
+            chunk_size: Number of valid records inserted per statement
+
+        Returns:
+            Created farmer IDs and per-record errors
+        """
+        result = FarmerBulkResult()
+        seen_user_ids: Set[UUID] = set()
+        chunk: List[Tuple[int, FarmerCreate]] = []
+        index = 0
+
+        async for record in records:
+            index += 1
+            try:
+                chunk.append((index, FarmerCreate.model_validate(record)))
+            except ValidationError as e:
+                error = FarmerService._format_validation_error(e)
+                result.errors.append(FarmerBulkError(row=index, error=error))
+                continue
+
+            if len(chunk) >= chunk_size:
+                await FarmerService._flush_chunk(db, chunk, seen_user_ids, result)
+                chunk = []
+
+        if chunk:
+            await FarmerService._flush_chunk(db, chunk, seen_user_ids, result)
+
+        await db.commit()
+        if result.farmer_ids:
+            # Reload the snapshot rather than replaying every imported row
+            farmer_geo_index.invalidate()
+            await FarmerService.invalidate_cache()
+        result.errors.sort(key=lambda error: error.row)
+        result.created = len(result.farmer_ids)
+        result.failed = len(result.errors)
+        return result
+
     @staticmethod
     async def update(db: AsyncSession, farmer: Farmer, data: FarmerUpdate) -> Farmer:
         """Update an existing farmer with optional location updates."""
@@ -76,16 +380,23 @@ class FarmerService:
             else:
                 # Create new location
                 farmer.location = Location(**data.location.model_dump())
+            coordinates = (farmer.location.latitude, farmer.location.longitude)
         
         await db.commit()
         await db.refresh(farmer)
+        if data.location:
+            farmer_geo_index.upsert(farmer.id, *coordinates)
+        await FarmerService.invalidate_cache(farmer.id)
         return farmer
 
     @staticmethod
     async def delete(db: AsyncSession, farmer: Farmer) -> None:
         """Delete a farmer and associated location."""
+        farmer_id = farmer.id
         await db.delete(farmer)
         await db.commit()
+        farmer_geo_index.remove(farmer_id)
+        await FarmerService.invalidate_cache(farmer_id)
 
     @staticmethod
     async def search_by_location(
@@ -106,40 +417,154 @@ class FarmerService:
         Returns:
             List of farmers within the specified radius
         """
-        def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-            """Calculate distance between two points using Haversine formula."""
-            R = 6371  # Earth's radius in kilometers
-            
-            dlat = radians(lat2 - lat1)
-            dlon = radians(lon2 - lon1)
-            
-            a = (
-                sin(dlat / 2) ** 2 + 
-                cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
-            )
-            c = 2 * atan2(sqrt(a), sqrt(1 - a))
-            
-            return R * c
+        results = await FarmerService.search_by_location_with_distance(
+            db, lat, lng, radius_km
+        )
+        return [farmer for farmer, _ in results]
 
-        # Get all farmers with location data
-        result = await db.execute(
-            select(Farmer).options(selectinload(Farmer.location))
+    @staticmethod
+    async def search_by_location_with_distance(
+        db: AsyncSession,
+        lat: float,
+        lng: float,
+        radius_km: float = 50,
+        order_by: Optional[LocationOrder] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[Farmer, float]]:
+        """
+        Search for farmers within a radius and keep each one's distance.
+
+        Args:
+            db: Database session
+            lat: Latitude of search center
+            lng: Longitude of search center
+            radius_km: Search radius in kilometers (default: 50km)
+            order_by: ``"distance"`` to return the closest farmers first
+            limit: Maximum number of farmers to return
+
+        Returns:
+            ``(farmer, distance_km)`` tuples within the specified radius
+        """
+        box = bounding_box(lat, lng, radius_km)
+
+        # Bounding-box prefilter pushed into SQL; the geohash ranges let the
+        # database scan only the index cells overlapping the search area.
+        query = (
+            select(Farmer)
+            .join(Farmer.location)
+            .where(Location.latitude.between(box.min_lat, box.max_lat))
+            .options(contains_eager(Farmer.location))
         )
-        all_farmers = result.scalars().all()
+        if box.crosses_antimeridian:
+            query = query.where(
+                or_(
+                    Location.longitude >= box.min_lng,
+                    Location.longitude <= box.max_lng,
+                )
+            )
+        else:
+            query = query.where(Location.longitude.between(box.min_lng, box.max_lng))
+
+        cells = covering_geohashes(box)
+        if cells:
+            cell_filters = []
+            for cell in cells:
+                low, high = geohash_prefix_range(cell)
+                condition = Location.geohash >= low
+                if high is not None:
+                    condition = and_(condition, Location.geohash < high)
+                cell_filters.append(condition)
+            query = query.where(or_(*cell_filters))
+
+        result = await db.execute(query)
+        candidates = result.scalars().all()
 
-        # Filter farmers within the specified radius
+        # Exact distance check only on the candidate rows
         nearby_farmers = []
-        for farmer in all_farmers:
+        for farmer in candidates:
             if farmer.location:
-                distance = calculate_distance(
-                    lat, lng, 
-                    farmer.location.latitude, 
+                distance = haversine_km(
+                    lat, lng,
+                    farmer.location.latitude,
                     farmer.location.longitude
                 )
                 if distance <= radius_km:
-                    nearby_farmers.append(farmer)
+                    nearby_farmers.append((farmer, distance))
+
+        if order_by == "distance":
+            if limit is not None:
+                return heapq.nsmallest(limit, nearby_farmers, key=lambda item: item[1])
+            nearby_farmers.sort(key=lambda item: item[1])
+        return nearby_farmers if limit is None else nearby_farmers[:limit]
+
+    @staticmethod
+    async def refresh_geo_index(db: AsyncSession, force: bool = False) -> None:
+        """
+        Load the farmer coordinate snapshot if it is missing or too old.
+
+        Args:
+            db: Database session
+            force: Reload even if the snapshot is fresh
+        """
+        global _geo_index_loaded_at
 
-        return nearby_farmers
+        def is_fresh() -> bool:
+            max_age = get_settings().geo_index_refresh_seconds
+            return farmer_geo_index.loaded and (
+                max_age == 0 or monotonic() - _geo_index_loaded_at < max_age
+            )
+
+        if not force and is_fresh():
+            return
+        async with _geo_index_lock:
+            if not force and is_fresh():
+                return
+            farmer_geo_index.begin_load()
+            try:
+                result = await db.execute(
+                    select(Farmer.id, Location.latitude, Location.longitude)
+                    .join(Farmer.location)
+                )
+            except Exception:
+                farmer_geo_index.cancel_load()
+                raise
+            farmer_geo_index.load(result.all())
+            _geo_index_loaded_at = monotonic()
+
+    @staticmethod
+    async def get_nearest(
+        db: AsyncSession,
+        lat: float,
+        lng: float,
+        limit: int = 20,
+        max_distance_km: Optional[float] = None,
+    ) -> List[Tuple[Farmer, float]]:
+        """
+        Find the farmers closest to given coordinates.
+
+        Candidates are ranked against the in-memory coordinate snapshot,
+        so only the returned farmers are loaded from the database.
+
+        Args:
+            db: Database session
+            lat: Latitude of search center
+            lng: Longitude of search center
+            limit: Maximum number of farmers to return
+            max_distance_km: Optional search radius in kilometers
+
+        Returns:
+            ``(farmer, distance_km)`` tuples, closest first
+        """
+        await FarmerService.refresh_geo_index(db)
+        ranked = farmer_geo_index.nearest(lat, lng, limit, max_distance_km)
+        farmer_ids = [farmer_id for farmer_id, _ in ranked]
+        farmers = await FarmerService.get_by_ids(db, farmer_ids)
+        # Farmers deleted by another process since the last reload are skipped
+        return [
+            (farmer, distance)
+            for farmer, (_, distance) in zip(farmers, ranked)
+            if farmer is not None
+        ]
 
     @staticmethod
     async def get_organic_farmers(db: AsyncSession) -> List[Farmer]:
@@ -152,11 +577,125 @@ class FarmerService:
         return result.scalars().all()
 
     @staticmethod
-    async def search_by_farm_name(db: AsyncSession, farm_name: str) -> List[Farmer]:
-        """Search farmers by farm name (case-insensitive partial match)."""
-        result = await db.execute(
+    def _contains_pattern(term: str) -> str:
+        """Build an ILIKE pattern matching ``term`` literally anywhere."""
+        escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return f"%{escaped}%"
+
+    @staticmethod
+    async def search_by_farm_name(
+        db: AsyncSession,
+        farm_name: str,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Farmer]:
+        """
+        Search farmers by farm name or description (case-insensitive).
+
+        On PostgreSQL the match is served by the pg_trgm GIN indexes and
+        results are ranked by trigram similarity, strongest first. Other
+        databases fall back to ordering name matches before description
+        matches, then by name.
+
+        Args:
+            db: Database session
+            farm_name: Text to search for
+            limit: Maximum number of farmers to return
+            offset: Number of ranked results to skip
+
+        Returns:
+            One page of matching farmers, best matches first
+        """
+        pattern = FarmerService._contains_pattern(farm_name)
+        name_match = Farmer.farm_name.ilike(pattern, escape="\\")
+        query = (
             select(Farmer)
-            .where(Farmer.farm_name.ilike(f"%{farm_name}%"))
+            .where(or_(name_match, Farmer.description.ilike(pattern, escape="\\")))
             .options(selectinload(Farmer.location))
         )
-        return result.scalars().all() 
\ No newline at end of file
+
+        if db.bind is not None and db.bind.dialect.name == "postgresql":
+            rank = func.greatest(
+                func.similarity(Farmer.farm_name, farm_name),
+                func.word_similarity(farm_name, Farmer.description),
+            )
+            query = query.order_by(rank.desc(), Farmer.id)
+        else:
+            query = query.order_by(
+                case((name_match, 0), else_=1), Farmer.farm_name, Farmer.id
+            )
+
+        result = await db.execute(query.offset(offset).limit(limit))
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def invalidate_cache(farmer_id: Optional[UUID] = None) -> None:
+        """
+        Invalidate cached reads after a write.
+
+        Args:
+            farmer_id: Farmer that changed; list results are always invalidated
+        """
+        if farmer_id is not None:
+            await farmer_cache.bump(f"farmer:{farmer_id}")
+        await farmer_cache.bump(LISTS_SCOPE)
+
+    @staticmethod
+    async def get_cached_by_id(
+        db: AsyncSession, farmer_id: UUID
+    ) -> Optional[FarmerResponse]:
+        """Cached variant of ``get_by_id`` returning the response model."""
+        async def load() -> Optional[FarmerResponse]:
+            farmer = await FarmerService.get_by_id(db, farmer_id)
+            return FarmerResponse.model_validate(farmer) if farmer else None
+
+        return await farmer_cache.get_or_load(
+            f"farmer:{farmer_id}", "detail", _farmer_adapter, load
+        )
+
+    @staticmethod
+    async def get_cached_organic_farmers(db: AsyncSession) -> List[FarmerResponse]:
+        """Cached variant of ``get_organic_farmers``."""
+        async def load() -> List[FarmerResponse]:
+            return _to_responses(await FarmerService.get_organic_farmers(db))
+
+        return await farmer_cache.get_or_load(
+            LISTS_SCOPE, "organic", _farmer_list_adapter, load
+        )
+
+    @staticmethod
+    async def search_cached_by_location(
+        db: AsyncSession,
+        lat: float,
+        lng: float,
+        radius_km: float = 50,
+        order_by: Optional[LocationOrder] = None,
+        limit: Optional[int] = None,
+    ) -> List[NearbyFarmerResponse]:
+        """Cached variant of ``search_by_location_with_distance``."""
+        async def load() -> List[NearbyFarmerResponse]:
+            return to_nearby_responses(
+                await FarmerService.search_by_location_with_distance(
+                    db, lat, lng, radius_km, order_by=order_by, limit=limit
+                )
+            )
+
+        key = f"location:{lat:.6f}:{lng:.6f}:{radius_km:g}:{order_by}:{limit}"
+        return await farmer_cache.get_or_load(
+            LISTS_SCOPE, key, _nearby_list_adapter, load
+        )
+
+    @staticmethod
+    async def search_cached_by_farm_name(
+        db: AsyncSession, farm_name: str, limit: int = 50, offset: int = 0
+    ) -> List[FarmerResponse]:
+        """Cached variant of ``search_by_farm_name``."""
+        async def load() -> List[FarmerResponse]:
+            return _to_responses(
+                await FarmerService.search_by_farm_name(db, farm_name, limit, offset)
+            )
+
+        key = f"name:{limit}:{offset}:{farm_name}"
+        return await farmer_cache.get_or_load(
+            LISTS_SCOPE, key, _farmer_list_adapter, load
+        )
@@ -0,0 +1,6 @@
+"""
+Benchmark suite for the Farmers Marketplace API.
+
+Run with ``python -m benchmarks.run`` and compare result files with
+``python -m benchmarks.compare``.
+"""
@@ -0,0 +1,90 @@
+"""
+Compare a benchmark run against a stored baseline.
+
+Usage:
+    python -m benchmarks.compare baseline.json results.json --threshold 10
+
+Exits with status 1 when any scenario's p95 latency grew, or its
+throughput dropped, by more than the threshold percentage.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+# metric -> True when a higher value is better
+METRICS = {"p50_ms": False, "p95_ms": False, "p99_ms": False, "rps": True}
+GATED_METRICS = ("p95_ms", "rps")
+
+
+def _change(baseline: float, current: float) -> float:
+    """Relative change in percent (0 when there is no baseline)."""
+    if not baseline:
+        return 0.0
+    return (current - baseline) / baseline * 100
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[Dict[str, Any]]:
+    """
+    Compare scenario metrics between two result files.
+
+    Args:
+        baseline: Parsed baseline results
+        current: Parsed results of the new run
+        threshold: Allowed regression in percent
+
+    Returns:
+        One row per scenario and metric with the change and whether it
+        counts as a regression
+    """
+    rows = []
+    for name, stats in current["scenarios"].items():
+        base_stats = baseline["scenarios"].get(name)
+        if base_stats is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            change = _change(base_stats[metric], stats[metric])
+            worse = -change if higher_is_better else change
+            rows.append(
+                {
+                    "scenario": name,
+                    "metric": metric,
+                    "baseline": base_stats[metric],
+                    "current": stats[metric],
+                    "change_pct": round(change, 2),
+                    "regression": metric in GATED_METRICS and worse > threshold,
+                }
+            )
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare benchmark results")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument(
+        "--threshold", type=float, default=10.0, help="Allowed regression in percent"
+    )
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+    with open(args.current) as handle:
+        current = json.load(handle)
+
+    rows = compare(baseline, current, args.threshold)
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['scenario']:<28} {row['metric']:<7} "
+            f"{row['baseline']:>10} -> {row['current']:>10} "
+            f"({row['change_pct']:+.1f}%){flag}"
+        )
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""
+Benchmark runner.
+
+Seeds a benchmark database, then drives the API in-process through an
+httpx ASGI client and reports latency percentiles and throughput per
+scenario as JSON.
+
+Usage:
+    python -m benchmarks.run --users 10000 --requests 2000 --output results.json
+
+Seeding drops and recreates all tables, so point ``--database-url`` at a
+disposable database.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///./benchmark.db"
+
+
+@dataclass
+class Scenario:
+    """One request shape to measure."""
+
+    name: str
+    method: str
+    path: str
+    # Builds request keyword arguments for the i-th request
+    build: Callable[[int], Dict[str, Any]]
+    authenticated: bool = False
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(latencies: List[float], elapsed: float, errors: int) -> Dict[str, Any]:
+    """
+    Summarize one scenario run.
+
+    Args:
+        latencies: Per-request latencies in seconds
+        elapsed: Wall-clock duration of the run in seconds
+        errors: Number of responses with a 4xx/5xx status
+
+    Returns:
+        Machine-readable statistics with latencies in milliseconds
+    """
+    ordered = sorted(latencies)
+    count = len(ordered)
+    return {
+        "requests": count,
+        "errors": errors,
+        "rps": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_ms": round(sum(ordered) / count * 1000, 3) if count else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if count else 0.0,
+    }
+
+
+def build_scenarios(users: int, seed: int) -> List[Scenario]:
+    """Scenarios covering the farmer, user and auth hot paths."""
+    from benchmarks.datagen import BENCH_PASSWORD, REGIONS, bench_email
+
+    rng = random.Random(seed)
+    centers = [rng.choice(REGIONS) for _ in range(256)]
+
+    def location_search(i: int) -> Dict[str, Any]:
+        _, _, lat, lng = centers[i % len(centers)]
+        return {"params": {"lat": lat, "lng": lng, "radius": 25.0}}
+
+    def login(i: int) -> Dict[str, Any]:
+        return {
+            "json": {"username": bench_email(i % users), "password": BENCH_PASSWORD}
+        }
+
+    return [
+        Scenario(
+            "farmers_list", "GET", "/api/farmers/", lambda i: {"params": {"limit": 50}}
+        ),
+        Scenario(
+            "farmers_search_location",
+            "GET",
+            "/api/farmers/search/location/",
+            location_search,
+        ),
+        Scenario("users_login", "POST", "/api/users/login", login),
+        # Exercises the get_current_user dependency plus one profile lookup
+        Scenario(
+            "current_user",
+            "GET",
+            "/api/farmers/me/profile",
+            lambda i: {},
+            authenticated=True,
+        ),
+        Scenario(
+            "graphql_users",
+            "POST",
+            "/graphql",
+            lambda i: {"json": {"query": "{ users(limit: 20) { id email userType } }"}},
+        ),
+    ]
+
+
+async def run_scenario(
+    client: Any,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Issue ``requests`` requests with ``concurrency`` concurrent workers.
+
+    Args:
+        client: httpx.AsyncClient bound to the application
+        scenario: Scenario to run
+        requests: Total number of requests
+        concurrency: Number of concurrent workers
+        headers: Extra headers (e.g. Authorization) for every request
+
+    Returns:
+        Statistics from ``summarize``
+    """
+    latencies: List[float] = []
+    errors = 0
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal errors, next_index
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+            kwargs = scenario.build(index)
+            started = perf_counter()
+            response = await client.request(
+                scenario.method, scenario.path, headers=headers, **kwargs
+            )
+            latencies.append(perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, perf_counter() - started, errors)
+
+
+async def _login(client: Any, email: str, password: str) -> Dict[str, str]:
+    response = await client.post(
+        "/api/users/login", json={"username": email, "password": password}
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def main(args: argparse.Namespace) -> Dict[str, Any]:
+    # Settings are read on first import, so configure them first; the
+    # development environment echoes every SQL statement
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("ENVIRONMENT", "benchmark")
+
+    from httpx import ASGITransport, AsyncClient
+
+    from app.core import database
+    from app.main import app
+    from app.models.base import Base
+    from benchmarks.datagen import BENCH_PASSWORD, bench_email, seed
+
+    scenarios = build_scenarios(args.users, args.seed)
+    if args.scenarios:
+        scenarios = [s for s in scenarios if s.name in args.scenarios]
+
+    async with app.router.lifespan_context(app):
+        engine = database.get_engine()
+        if engine is None:
+            raise RuntimeError("Database not initialized. Call init_db() first.")
+        seeded: Optional[Dict[str, int]] = None
+        if not args.skip_seed:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+                await conn.run_sync(Base.metadata.create_all)
+            summary = await seed(engine, args.users, seed=args.seed)
+            seeded = summary.as_dict()
+            print(
+                f"Seeded {summary.users} users and {summary.farmers} farmers",
+                file=sys.stderr,
+            )
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            auth_headers = await _login(client, bench_email(0), BENCH_PASSWORD)
+            results: Dict[str, Any] = {}
+            for scenario in scenarios:
+                headers = auth_headers if scenario.authenticated else None
+                warmup = max(1, args.requests // 10)
+                await run_scenario(client, scenario, warmup, args.concurrency, headers)
+                results[scenario.name] = await run_scenario(
+                    client, scenario, args.requests, args.concurrency, headers
+                )
+                print(f"{scenario.name}: {results[scenario.name]}", file=sys.stderr)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "database": engine.dialect.name,
+            "users": args.users,
+            "seeded": seeded,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "scenarios": results,
+    }
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("BENCH_DATABASE_URL", DEFAULT_DATABASE_URL),
+    )
+    parser.add_argument(
+        "--users", type=int, default=10_000, help="Users to seed (10k-1M)"
+    )
+    parser.add_argument(
+        "--requests", type=int, default=1000, help="Requests per scenario"
+    )
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--seed", type=int, default=42, help="Random seed for data and requests"
+    )
+    parser.add_argument("--scenarios", nargs="*", help="Only run these scenarios")
+    parser.add_argument(
+        "--skip-seed", action="store_true", help="Reuse already seeded data"
+    )
+    parser.add_argument("--output", help="Write JSON results here instead of stdout")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    report = asyncio.run(main(arguments))
+    rendered = json.dumps(report, indent=2)
+    if arguments.output:
+        with open(arguments.output, "w") as handle:
+            handle.write(rendered + "\n")
+    else:
+        print(rendered)
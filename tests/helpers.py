@@ -0,0 +1,48 @@
+"""
+Shared test helpers for in-memory database tests.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+
+from app.graphql.context import GraphQLContext
+from app.models.base import Base
+
+
+@asynccontextmanager
+async def memory_session() -> AsyncIterator[AsyncSession]:
+    """Open a session on a fresh in-memory SQLite database with the schema."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            yield session
+    finally:
+        await engine.dispose()
+
+
+def capture_statements(session: AsyncSession) -> List[str]:
+    """Record the SQL of every statement the session's engine runs from now on."""
+    statements: List[str] = []
+    event.listen(
+        session.bind.sync_engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    return statements
+
+
+def graphql_context(session: AsyncSession) -> GraphQLContext:
+    """GraphQL context on the session, with its SQL captured in ``statements``."""
+    context = GraphQLContext(session)
+    context.statements = capture_statements(session)
+    return context
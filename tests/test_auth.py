@@ -327,3 +327,61 @@ class TestPasswordHashing:
         
         # Hashes should be different due to salt
         assert hash1 != hash2
+
+
+class TestVerifiedTokenCache:
+    """Test suite for the verified JWT cache."""
+
+    def setup_method(self):
+        from app.core.security import verified_token_cache
+        verified_token_cache.clear()
+
+    def test_repeated_verification_hits_cache(self):
+        """Test: Verifying the same token twice decodes it only once"""
+        from unittest.mock import patch
+        from app.core.security import verified_token_cache, verify_token
+
+        token = create_token_for_user(user_id="123", username="testuser")
+        hits, misses = verified_token_cache.hits, verified_token_cache.misses
+
+        with patch("app.core.security.jwt.decode", wraps=jwt.decode) as decode:
+            first = verify_token(token, Exception("invalid"))
+            second = verify_token(token, Exception("invalid"))
+
+        assert first.username == second.username == "testuser"
+        assert decode.call_count == 1
+        assert verified_token_cache.hits == hits + 1
+        assert verified_token_cache.misses == misses + 1
+
+    def test_decode_access_token_reuses_cached_payload(self):
+        """Test: The shared decode path stores one entry per token"""
+        from app.core.security import decode_access_token, verified_token_cache
+
+        token = create_token_for_user(user_id="123", username="testuser")
+        hits = verified_token_cache.hits
+        decode_access_token(token)
+        decode_access_token(token)
+
+        assert verified_token_cache.stats()["size"] == 1
+        assert verified_token_cache.hits == hits + 1
+
+    def test_invalid_token_is_not_cached(self):
+        """Test: Invalid tokens keep failing and are never cached"""
+        from jose import JWTError
+        from app.core.security import decode_access_token, verified_token_cache
+
+        for _ in range(2):
+            with pytest.raises(JWTError):
+                decode_access_token("invalid.token.here")
+
+        assert len(verified_token_cache) == 0
+
+    def test_expired_token_is_not_cached(self):
+        """Test: Cache entries never outlive the token's exp claim"""
+        from datetime import timedelta
+        from jose import JWTError
+        from app.core.security import create_access_token, decode_access_token
+
+        token = create_access_token({"sub": "testuser"}, timedelta(seconds=-1))
+        with pytest.raises(JWTError):
+            decode_access_token(token)
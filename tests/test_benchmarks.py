@@ -0,0 +1,51 @@
+"""
+Tests for the benchmark statistics and baseline comparison.
+"""
+
+from benchmarks.compare import compare
+from benchmarks.run import percentile, summarize
+
+
+def _results(p95_ms, rps):
+    return {
+        "scenarios": {
+            "farmers_list": {
+                "p50_ms": 1.0,
+                "p95_ms": p95_ms,
+                "p99_ms": 10.0,
+                "rps": rps,
+            }
+        }
+    }
+
+
+def test_percentile_nearest_rank():
+    """Test nearest-rank percentiles."""
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+def test_summarize_reports_milliseconds_and_throughput():
+    """Test that a run summary uses milliseconds and requests per second."""
+    summary = summarize([0.001, 0.002, 0.003, 0.004], elapsed=2.0, errors=1)
+    assert summary["requests"] == 4
+    assert summary["errors"] == 1
+    assert summary["rps"] == 2.0
+    assert summary["p50_ms"] == 2.0
+    assert summary["max_ms"] == 4.0
+
+
+def test_compare_flags_latency_and_throughput_regressions():
+    """Test that regressions beyond the threshold are flagged."""
+    rows = compare(_results(10.0, 100.0), _results(12.0, 85.0), threshold=10.0)
+    flagged = {row["metric"] for row in rows if row["regression"]}
+    assert flagged == {"p95_ms", "rps"}
+
+
+def test_compare_ignores_changes_within_threshold():
+    """Test that small changes and improvements are not regressions."""
+    rows = compare(_results(10.0, 100.0), _results(10.5, 150.0), threshold=10.0)
+    assert not any(row["regression"] for row in rows)
@@ -0,0 +1,188 @@
+"""
+Tests for in-process caching primitives.
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+from unittest.mock import patch
+
+from pydantic import TypeAdapter
+
+from app.core.cache import CacheBackend, ResultCache, SingleFlight, TTLCache
+
+
+def test_get_set_and_stats():
+    """Test basic storage with hit/miss accounting."""
+    cache: TTLCache[str] = TTLCache(maxsize=10, ttl=60)
+    assert cache.get("a") is None
+    cache.set("a", "value")
+    assert cache.get("a") == "value"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted first."""
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_entries_expire():
+    """Test default and per-entry expiry."""
+    cache: TTLCache[int] = TTLCache(maxsize=10, ttl=60)
+    with patch("app.core.cache.monotonic", return_value=1000.0):
+        cache.set("default", 1)
+        cache.set("short", 2, ttl=5)
+
+    with patch("app.core.cache.monotonic", return_value=1010.0):
+        assert cache.get("default") == 1
+        assert cache.get("short") is None
+
+    with patch("app.core.cache.monotonic", return_value=1061.0):
+        assert cache.get("default") is None
+
+
+def test_disabled_cache_stores_nothing():
+    """Test that a zero TTL disables the cache."""
+    cache: TTLCache[int] = TTLCache(maxsize=10, ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_delete_and_clear():
+    """Test explicit invalidation."""
+    cache: TTLCache[int] = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.delete("a")
+    cache.delete("missing")
+    assert cache.get("a") is None
+    cache.clear()
+    assert cache.get("b") is None
+
+
+class FakeSharedBackend(CacheBackend):
+    """Dict-backed stand-in for a shared cache server."""
+
+    def __init__(self) -> None:
+        self.data: Dict[str, bytes] = {}
+        self.counters: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        assert isinstance(value, bytes)
+        self.data[key] = value
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+    async def get_counter(self, key: str) -> int:
+        return self.counters.get(key, 0)
+
+    async def incr(self, key: str) -> int:
+        self.counters[key] = self.counters.get(key, 0) + 1
+        return self.counters[key]
+
+
+ADAPTER: TypeAdapter[List[int]] = TypeAdapter(List[int])
+
+
+async def test_single_flight_collapses_concurrent_loads():
+    """Test that concurrent callers share one in-flight load."""
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(single_flight.do("key", load) for _ in range(5)))
+
+    assert results == [1] * 5
+    assert calls == 1
+
+
+async def test_single_flight_propagates_errors():
+    """Test that a failed load fails every waiting caller."""
+    single_flight = SingleFlight()
+
+    async def load():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        *(single_flight.do("key", load) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_result_cache_reads_through_shared_backend():
+    """Test that results are serialized to the backend and reused."""
+    backend = FakeSharedBackend()
+    cache = ResultCache(backend, namespace="test", ttl=60)
+    loads = 0
+
+    async def load():
+        nonlocal loads
+        loads += 1
+        return [1, 2, 3]
+
+    assert await cache.get_or_load("lists", "all", ADAPTER, load) == [1, 2, 3]
+    assert await cache.get_or_load("lists", "all", ADAPTER, load) == [1, 2, 3]
+    assert loads == 1
+    assert list(backend.data.values()) == [b"[1,2,3]"]
+
+
+async def test_result_cache_bump_invalidates_scope_only():
+    """Test that bumping a scope invalidates its entries and no others."""
+    cache = ResultCache(FakeSharedBackend(), namespace="test", ttl=60)
+    values = {"a": [1], "b": [2]}
+
+    async def cached(scope):
+        async def load():
+            return list(values[scope])
+        return await cache.get_or_load(scope, "key", ADAPTER, load)
+
+    await cached("a")
+    await cached("b")
+    values.update(a=[10], b=[20])
+    await cache.bump("a")
+
+    assert await cached("a") == [10]
+    assert await cached("b") == [2]
+
+
+async def test_result_cache_does_not_serve_loads_racing_a_write():
+    """Test that a load started before an invalidation is not served after it."""
+    cache = ResultCache(FakeSharedBackend(), namespace="test", ttl=60)
+    current = [1]
+
+    async def slow_stale_load():
+        stale = list(current)
+        await cache.bump("lists")  # a write commits while the load runs
+        return stale
+
+    assert await cache.get_or_load("lists", "key", ADAPTER, slow_stale_load) == [1]
+    current[0] = 2
+
+    async def load():
+        return list(current)
+
+    assert await cache.get_or_load("lists", "key", ADAPTER, load) == [2]
@@ -0,0 +1,59 @@
+"""
+Tests for authentication dependencies and the principal cache.
+"""
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.dependencies import (
+    CurrentUser,
+    get_current_user,
+    get_optional_current_user,
+    invalidate_principal,
+    principal_cache,
+)
+from app.core.security import create_access_token
+
+
+@pytest.fixture(autouse=True)
+def clear_principal_cache():
+    """Start every test with an empty principal cache."""
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
+def _credentials(subject: str) -> HTTPAuthorizationCredentials:
+    token = create_access_token({"sub": subject})
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+async def test_cached_principal_skips_database():
+    """Test that a cached principal is returned without a user lookup."""
+    cached = CurrentUser(id="1", username="farmer@test.com", email="farmer@test.com")
+    principal_cache.set("farmer@test.com", cached)
+
+    # The database is not initialized here, so a lookup would raise
+    user = await get_current_user(_credentials("farmer@test.com"))
+    assert user == cached
+
+    optional_user = await get_optional_current_user(_credentials("farmer@test.com"))
+    assert optional_user == cached
+
+
+async def test_invalidate_principal_forces_lookup():
+    """Test that invalidation removes the cached principal."""
+    principal_cache.set(
+        "farmer@test.com",
+        CurrentUser(id="1", username="farmer@test.com", email="farmer@test.com"),
+    )
+    invalidate_principal("farmer@test.com")
+    assert principal_cache.get("farmer@test.com") is None
+
+
+async def test_missing_credentials_rejected():
+    """Test that requests without a token are rejected before any lookup."""
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(None)
+    assert exc_info.value.status_code == 401
@@ -0,0 +1,91 @@
+"""
+Tests for the streaming export endpoints.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from unittest.mock import patch
+from uuid import uuid4
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.exports import _export_stream
+from app.models.users.user import UserType
+from app.services.export_service import ExportService
+
+FIELDS = ["id", "email", "user_type", "created_at"]
+
+
+def _rows(count, start=0):
+    return [
+        {
+            "id": uuid4(),
+            "email": f"user{i},x@example.com",
+            "user_type": UserType.FARMER,
+            "created_at": datetime(2024, 1, 1, 12, 0, 0),
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def _batches(*sizes):
+    async def batches(db, batch_size):
+        start = 0
+        for size in sizes:
+            yield _rows(size, start)
+            start += size
+
+    return batches
+
+
+async def _fake_get_db():
+    yield object()
+
+
+async def _collect(format, *sizes):
+    with patch("app.api.exports.get_db", _fake_get_db):
+        return [
+            chunk
+            async for chunk in _export_stream(_batches(*sizes), FIELDS, format, 2)
+        ]
+
+
+def test_user_export_never_includes_password_hash():
+    """Test that credentials are not part of the user export."""
+    assert "password_hash" not in ExportService.user_fields()
+
+
+async def test_ndjson_export_yields_one_chunk_per_batch():
+    """Test that NDJSON exports flush each batch as it is read."""
+    chunks = await _collect("ndjson", 2, 2, 1)
+
+    assert len(chunks) == 3
+    lines = b"".join(chunks).decode().splitlines()
+    assert len(lines) == 5
+    record = json.loads(lines[0])
+    assert record["email"] == "user0,x@example.com"
+    assert record["user_type"] == UserType.FARMER.value
+    assert record["created_at"] == "2024-01-01T12:00:00"
+
+
+async def test_csv_export_writes_header_then_rows():
+    """Test that CSV exports start with a header and quote values."""
+    chunks = await _collect("csv", 2, 1)
+
+    assert len(chunks) == 3
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+    assert rows[0] == FIELDS
+    assert len(rows) == 4
+    assert rows[1][1] == "user0,x@example.com"
+    assert rows[1][2] == UserType.FARMER.value
+
+
+async def test_export_requires_authentication(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Test that exports are not available anonymously."""
+    response = await client.get("/api/exports/farmers")
+    assert response.status_code == 401
@@ -0,0 +1,152 @@
+"""
+Tests for bulk farmer import.
+"""
+
+import io
+from uuid import uuid4
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.farmers import _csv_record, _iter_upload
+from app.models.farmers.farmer import Farmer
+from app.models.shared.location import Location
+from app.models.users.user import User, UserType
+from app.services.farmer_service import FarmerService
+from tests.helpers import memory_session
+
+
+@pytest.fixture
+async def db():
+    """In-memory SQLite session with the schema created."""
+    async with memory_session() as session:
+        yield session
+
+
+async def _users(db: AsyncSession, count: int):
+    users = [
+        User(
+            email=f"user{i}@test.com",
+            username=f"user{i}",
+            password_hash="hash",
+            user_type=UserType.FARMER,
+        )
+        for i in range(count)
+    ]
+    db.add_all(users)
+    await db.commit()
+    return [str(user.id) for user in users]
+
+
+async def _records(records):
+    for record in records:
+        yield record
+
+
+async def test_bulk_create_inserts_valid_rows_and_reports_errors(db):
+    """Test that bad rows are reported without aborting the import."""
+    user_ids = await _users(db, 3)
+    records = [
+        {
+            "user_id": user_ids[0],
+            "farm_name": "A",
+            "location": {"latitude": 9.9, "longitude": -84.1},
+        },
+        {"user_id": user_ids[1], "farm_name": "B"},
+        {"user_id": user_ids[1], "farm_name": "Duplicate"},
+        {"user_id": str(uuid4()), "farm_name": "No user"},
+        {"farm_name": "No user_id"},
+        {
+            "user_id": user_ids[2],
+            "farm_name": "C",
+            "location": {"latitude": 10.0, "longitude": 1.0},
+        },
+    ]
+
+    result = await FarmerService.bulk_create(db, _records(records), chunk_size=2)
+
+    assert result.created == 3
+    assert result.failed == 3
+    assert [(error.row, error.error) for error in result.errors] == [
+        (3, "Duplicate user_id in import"),
+        (4, "User not found"),
+        (5, "user_id: Field required"),
+    ]
+    result_rows = await db.execute(select(Farmer).order_by(Farmer.farm_name))
+    farmers = result_rows.scalars().all()
+    assert [farmer.farm_name for farmer in farmers] == ["A", "B", "C"]
+    assert {farmer.id for farmer in farmers} == set(result.farmer_ids)
+
+
+async def test_bulk_create_sets_location_geohash(db):
+    """Test that bulk-inserted locations get a geohash like ORM inserts."""
+    (user_id,) = await _users(db, 1)
+    records = [
+        {
+            "user_id": user_id,
+            "farm_name": "A",
+            "location": {"latitude": 9.9, "longitude": -84.1},
+        }
+    ]
+
+    await FarmerService.bulk_create(db, _records(records))
+
+    location = (await db.execute(select(Location))).scalar_one()
+    assert location.geohash == Location(latitude=9.9, longitude=-84.1).geohash
+
+
+async def test_bulk_create_rejects_users_with_existing_profile(db):
+    """Test that users who already have a profile are reported."""
+    (user_id,) = await _users(db, 1)
+    await FarmerService.bulk_create(
+        db, _records([{"user_id": user_id, "farm_name": "A"}])
+    )
+
+    result = await FarmerService.bulk_create(
+        db, _records([{"user_id": user_id, "farm_name": "B"}])
+    )
+
+    assert result.created == 0
+    assert result.errors[0].error == "User already has a farmer profile"
+
+
+def test_csv_record_nests_location_columns():
+    """Test that location_ columns become a nested location and blanks are dropped."""
+    record = _csv_record(
+        {
+            "user_id": "abc",
+            "farm_name": "A",
+            "description": "",
+            "location_latitude": "1.5",
+            "location_longitude": "2.5",
+        }
+    )
+
+    assert record == {
+        "user_id": "abc",
+        "farm_name": "A",
+        "location": {"latitude": "1.5", "longitude": "2.5"},
+    }
+
+
+async def test_iter_upload_parses_in_batches_without_closing_the_upload():
+    """Test NDJSON and CSV parsing across batches, leaving the file open."""
+    ndjson = io.BytesIO(b'{"farm_name": "A"}\n\nnot json\n{"farm_name": "B"}\n')
+    upload = UploadFile(ndjson, filename="farmers.ndjson")
+    records = [record async for record in _iter_upload(upload, "ndjson", 2)]
+
+    assert records == [{"farm_name": "A"}, None, {"farm_name": "B"}]
+    assert not ndjson.closed
+
+    csv_file = io.BytesIO(
+        b'\xef\xbb\xbffarm_name,description\nA,"two\nlines"\nB,\nC,x\n'
+    )
+    upload = UploadFile(csv_file, filename="farmers.csv")
+    records = _iter_upload(upload, "csv", 2)
+    assert await records.__anext__() == {"farm_name": "A", "description": "two\nlines"}
+    # Stopping early (e.g. over the row limit) detaches instead of closing
+    await records.aclose()
+
+    assert not csv_file.closed
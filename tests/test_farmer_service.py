@@ -93,6 +93,38 @@ class TestFarmerService:
         assert result == [mock_farmer]
         mock_db_session.execute.assert_called_once()
 
+    async def test_get_page_with_more_results(self, mock_db_session):
+        """Test keyset page returns the next cursor when more rows exist."""
+        # Arrange
+        farmers = [MagicMock(spec=Farmer, id=uuid4()) for _ in range(3)]
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = farmers
+        mock_db_session.execute.return_value = mock_result
+
+        # Act
+        page, next_after = await FarmerService.get_page(mock_db_session, 2)
+
+        # Assert
+        assert page == farmers[:2]
+        assert next_after == farmers[1].id
+        mock_db_session.execute.assert_called_once()
+
+    async def test_get_page_last_page(self, mock_db_session, mock_farmer):
+        """Test keyset page without further results has no cursor."""
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [mock_farmer]
+        mock_db_session.execute.return_value = mock_result
+
+        # Act
+        page, next_after = await FarmerService.get_page(
+            mock_db_session, 10, after=uuid4()
+        )
+
+        # Assert
+        assert page == [mock_farmer]
+        assert next_after is None
+
     async def test_get_by_id_found(self, mock_db_session, mock_farmer):
         """Test getting farmer by ID when found."""
         # Arrange
@@ -153,6 +185,32 @@ class TestFarmerService:
         assert result is None
         mock_db_session.execute.assert_called_once()
 
+    async def test_get_by_ids_preserves_request_order(
+        self, mock_db_session, mock_farmer
+    ):
+        """Test batch lookup returns request order with None for misses."""
+        # Arrange
+        other = MagicMock(spec=Farmer)
+        other.id = uuid4()
+        missing_id = uuid4()
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [mock_farmer, other]
+        mock_db_session.execute.return_value = mock_result
+
+        # Act
+        result = await FarmerService.get_by_ids(
+            mock_db_session, [other.id, missing_id, mock_farmer.id, other.id]
+        )
+
+        # Assert
+        assert result == [other, None, mock_farmer, other]
+        mock_db_session.execute.assert_called_once()
+
+    async def test_get_by_ids_empty(self, mock_db_session):
+        """Test batch lookup with no IDs does not query."""
+        assert await FarmerService.get_by_ids(mock_db_session, []) == []
+        mock_db_session.execute.assert_not_called()
+
     async def test_create_farmer_without_location(self, mock_db_session, sample_farmer_data):
         """Test creating farmer without location."""
         # Arrange
@@ -354,6 +412,29 @@ class TestFarmerService:
         assert result == []
         mock_db_session.execute.assert_called_once()
 
+    async def test_search_by_farm_name_is_paged(self, mock_db_session):
+        """Test that name search applies limit and offset."""
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_db_session.execute.return_value = mock_result
+
+        # Act
+        await FarmerService.search_by_farm_name(
+            mock_db_session, "Test", limit=10, offset=20
+        )
+
+        # Assert
+        query = mock_db_session.execute.call_args[0][0]
+        compiled = query.compile(compile_kwargs={"literal_binds": True})
+        assert "LIMIT 10" in str(compiled)
+        assert "OFFSET 20" in str(compiled)
+        assert "farmers.description" in str(compiled)
+
+    def test_contains_pattern_escapes_wildcards(self):
+        """Test that LIKE wildcards in the search term match literally."""
+        assert FarmerService._contains_pattern("100%_\\x") == "%100\\%\\_\\\\x%"
+
 
 class TestFarmerServiceDistanceCalculation:
     """Test distance calculation functionality."""
@@ -414,6 +495,56 @@ class TestFarmerServiceDistanceCalculation:
         assert farmer2 in result
         assert farmer3 not in result
 
+    async def test_search_with_distance_orders_and_limits(self, mock_db_session):
+        """Test that distances are returned and used for ordering and limit."""
+        farmers = []
+        for latitude in (40.8128, 40.7128, 40.7628):
+            farmer = MagicMock(spec=Farmer)
+            farmer.location = MagicMock(spec=Location)
+            farmer.location.latitude = latitude
+            farmer.location.longitude = -74.0060
+            farmers.append(farmer)
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = farmers
+        mock_db_session.execute.return_value = mock_result
+
+        unordered = await FarmerService.search_by_location_with_distance(
+            mock_db_session, 40.7128, -74.0060, 50.0
+        )
+        ordered = await FarmerService.search_by_location_with_distance(
+            mock_db_session, 40.7128, -74.0060, 50.0, order_by="distance", limit=2
+        )
+
+        assert [farmer for farmer, _ in unordered] == farmers
+        assert [farmer for farmer, _ in ordered] == [farmers[1], farmers[2]]
+        assert ordered[0][1] == pytest.approx(0.0)
+        assert ordered[1][1] == pytest.approx(5.56, abs=0.01)
+
+    async def test_get_nearest_ranks_from_snapshot(self, mock_db_session):
+        """Test nearest search loads the snapshot once and keeps distance order."""
+        near, far, deleted = uuid4(), uuid4(), uuid4()
+        snapshot = MagicMock()
+        snapshot.all.return_value = [
+            (far, 41.2128, -74.0060),
+            (near, 40.7628, -74.0060),
+            (deleted, 40.7138, -74.0060),
+        ]
+        farmers = MagicMock()
+        farmers.scalars.return_value.all.return_value = [
+            MagicMock(spec=Farmer, id=far),
+            MagicMock(spec=Farmer, id=near),
+        ]
+        mock_db_session.execute.side_effect = [snapshot, farmers]
+
+        await FarmerService.refresh_geo_index(mock_db_session, force=True)
+        result = await FarmerService.get_nearest(
+            mock_db_session, 40.7128, -74.0060, limit=3
+        )
+
+        assert [farmer.id for farmer, _ in result] == [near, far]
+        assert result[0][1] == pytest.approx(5.56, abs=0.01)
+        assert mock_db_session.execute.call_count == 2
+
 
 class TestFarmerServiceEdgeCases:
     """Test edge cases and error scenarios."""
@@ -0,0 +1,154 @@
+"""
+Tests for geospatial helpers used by location search.
+"""
+
+import random
+
+import pytest
+
+from app.core.geo import (
+    GeoIndex,
+    bounding_box,
+    covering_geohashes,
+    encode_geohash,
+    geohash_prefix_range,
+    haversine_km,
+)
+from app.models.farmers.farmer import Farmer  # noqa: F401
+from app.models.shared.location import Location
+
+
+def test_haversine_known_distance():
+    """Test distance between New York and Los Angeles (~3936 km)."""
+    distance = haversine_km(40.7128, -74.0060, 34.0522, -118.2437)
+    assert 3900 < distance < 3970
+
+
+def test_encode_geohash_known_value():
+    """Test geohash encoding against a reference value."""
+    assert encode_geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+
+def test_bounding_box_contains_circle():
+    """Test that the box contains points at the edge of the radius."""
+    box = bounding_box(9.93, -84.08, 50)
+    assert box.min_lat < 9.93 < box.max_lat
+    assert box.min_lng < -84.08 < box.max_lng
+    assert not box.crosses_antimeridian
+    # ~0.45 degrees of latitude per 50 km
+    assert box.max_lat - 9.93 == pytest.approx(0.4497, abs=1e-3)
+
+
+def test_bounding_box_antimeridian_and_poles():
+    """Test wrap-around and polar boxes."""
+    wrapped = bounding_box(0.0, 179.9, 50)
+    assert wrapped.crosses_antimeridian
+
+    polar = bounding_box(89.9, 0.0, 50)
+    assert polar.min_lng == -180.0
+    assert polar.max_lng == 180.0
+
+
+def test_geohash_prefix_range():
+    """Test prefix ranges including carry over the last alphabet character."""
+    assert geohash_prefix_range("dr5") == ("dr5", "dr6")
+    assert geohash_prefix_range("d9") == ("d9", "db")
+    assert geohash_prefix_range("dz") == ("dz", "e")
+    assert geohash_prefix_range("zz") == ("zz", None)
+
+
+def test_covering_geohashes_include_all_points_in_box():
+    """Test that covering cells contain every point inside the box."""
+    box = bounding_box(9.93, -84.08, 50)
+    cells = covering_geohashes(box)
+    assert 0 < len(cells) <= 16
+
+    for lat in (box.min_lat, 9.93, box.max_lat):
+        for lng in (box.min_lng, -84.08, box.max_lng):
+            geohash = encode_geohash(lat, lng)
+            assert any(geohash.startswith(cell) for cell in cells)
+
+
+def test_covering_geohashes_whole_globe_disables_prefilter():
+    """Test that huge boxes skip the geohash prefilter."""
+    box = bounding_box(0.0, 0.0, 20000)
+    assert covering_geohashes(box) == []
+
+
+def test_location_geohash_tracks_coordinates():
+    """Test that the Location geohash is kept in sync with coordinates."""
+    location = Location(latitude=40.7128, longitude=-74.0060)
+    assert location.geohash == encode_geohash(40.7128, -74.0060)
+
+    location.latitude = 9.93
+    location.longitude = -84.08
+    assert location.geohash == encode_geohash(9.93, -84.08)
+
+
+def _random_points(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [(i, rng.uniform(-60, 60), rng.uniform(-180, 180)) for i in range(count)]
+
+
+def test_geo_index_nearest_matches_brute_force():
+    """Test k-nearest results against a full haversine scan."""
+    points = _random_points(500)
+    index = GeoIndex()
+    index.load(points)
+
+    expected = sorted(
+        (haversine_km(10.0, -80.0, lat, lng), key) for key, lat, lng in points
+    )[:10]
+    result = index.nearest(10.0, -80.0, 10)
+
+    assert [key for key, _ in result] == [key for _, key in expected]
+    for (_, distance), (expected_distance, _) in zip(result, expected):
+        assert distance == pytest.approx(expected_distance, rel=1e-9)
+
+
+def test_geo_index_radius_queries():
+    """Test radius filtering in nearest() and within()."""
+    points = _random_points(500)
+    index = GeoIndex()
+    index.load(points)
+
+    expected = {
+        key for key, lat, lng in points if haversine_km(0.0, 0.0, lat, lng) <= 2000
+    }
+    within = index.within(0.0, 0.0, 2000)
+    assert {key for key, _ in within} == expected
+    assert [d for _, d in within] == sorted(d for _, d in within)
+
+    capped = index.nearest(0.0, 0.0, 1000, max_distance_km=2000)
+    assert {key for key, _ in capped} == expected
+    assert len(index.within(0.0, 0.0, 30000)) == len(points)
+
+
+def test_geo_index_upsert_and_remove():
+    """Test incremental updates keep keys and coordinates consistent."""
+    index = GeoIndex()
+    index.load([("a", 0.0, 0.0), ("b", 1.0, 1.0), ("c", 2.0, 2.0)])
+
+    index.remove("a")
+    index.upsert("c", 50.0, 50.0)
+    index.upsert("d", 0.0, 0.1)
+    index.remove("missing")
+
+    assert len(index) == 3
+    assert "a" not in index
+    assert [key for key, _ in index.nearest(0.0, 0.0, 3)] == ["d", "b", "c"]
+
+
+def test_geo_index_load_replays_concurrent_writes():
+    """Test that writes made while a snapshot is read survive the load."""
+    index = GeoIndex()
+    index.load([("old", 0.0, 0.0)])
+
+    index.begin_load()
+    index.upsert("new", 1.0, 1.0)
+    index.remove("gone")
+    index.load([("old", 0.0, 0.0), ("gone", 2.0, 2.0)])
+
+    assert "new" in index
+    assert "gone" not in index
+    assert index.loaded
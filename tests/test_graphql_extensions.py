@@ -0,0 +1,132 @@
+"""
+Tests for GraphQL schema extensions.
+"""
+
+from typing import List, Optional
+
+import strawberry
+
+from app.graphql.extensions import DEFAULT_LIST_SIZE, QueryCostLimiter
+
+
+@strawberry.type
+class Item:
+    name: str
+
+    @strawberry.field
+    def children(self, limit: int = 10) -> List["Item"]:
+        return [Item(name=f"{self.name}.{i}") for i in range(min(limit, 2))]
+
+    @strawberry.field
+    def parent(self) -> Optional["Item"]:
+        return None
+
+
+@strawberry.type
+class ItemPage:
+    edges: List[Item]
+
+
+resolved: List[str] = []
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def items(self, first: Optional[int] = None) -> List[Item]:
+        resolved.append("items")
+        return [Item(name="a")]
+
+    @strawberry.field
+    def page(self, first: int = 10) -> ItemPage:
+        return ItemPage(edges=[Item(name="a")])
+
+    @strawberry.field
+    def item(self) -> Item:
+        resolved.append("item")
+        return Item(name="a")
+
+
+def _schema(max_depth: int = 3, max_cost: int = 1000) -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query,
+        extensions=[lambda: QueryCostLimiter(max_depth=max_depth, max_cost=max_cost)],
+    )
+
+
+async def test_cost_multiplies_list_sizes():
+    """Test that list arguments, variables and defaults drive the cost."""
+    resolved.clear()
+    schema = _schema(max_cost=100)
+
+    # first: 5 items * (1 + 10 children * 1) = 55
+    ok = await schema.execute("{ items(first: 5) { name children { name } } }")
+    assert ok.errors is None
+    assert resolved == ["items"]
+
+    # first: 20 items * (1 + 10) = 220
+    rejected = await schema.execute(
+        "query Q($n: Int) { items(first: $n) { children { name } } }",
+        variable_values={"n": 20},
+    )
+    assert [e.message for e in rejected.errors] == [
+        "Query cost 220 exceeds the maximum of 100"
+    ]
+    assert rejected.data is None
+    assert resolved == ["items"]
+
+    # No size argument: DEFAULT_LIST_SIZE items * (1 + 1 child)
+    unbounded = await schema.execute("{ items { children(limit: 1) { name } } }")
+    assert [e.message for e in unbounded.errors] == [
+        f"Query cost {DEFAULT_LIST_SIZE * 2} exceeds the maximum of 100"
+    ]
+
+
+async def test_connection_page_size_applies_to_edges():
+    """Test that a connection's first argument sizes its edges list."""
+    schema = _schema(max_depth=4, max_cost=100)
+
+    # 1 page + first: 30 edges * (1 + 2 children * 1) = 91
+    ok = await schema.execute(
+        "{ page(first: 30) { edges { children(limit: 2) { name } } } }"
+    )
+    assert ok.errors is None
+
+    # Default first: 10 edges * (1 + 10 children) + 1 = 111
+    rejected = await schema.execute("{ page { edges { children { name } } } }")
+    assert [e.message for e in rejected.errors] == [
+        "Query cost 111 exceeds the maximum of 100"
+    ]
+
+
+async def test_depth_limit_counts_fragments():
+    """Test that nesting through fragments counts towards the depth."""
+    resolved.clear()
+    schema = _schema(max_depth=3)
+
+    ok = await schema.execute("{ item { parent { name } } }")
+    assert ok.errors is None
+
+    query = """
+        query Deep { item { ...Nested } }
+        fragment Nested on Item { parent { parent { name } } }
+    """
+    rejected = await schema.execute(query)
+    assert [e.message for e in rejected.errors] == [
+        "Query depth 4 exceeds the maximum of 3"
+    ]
+    assert resolved == ["item"]
+
+
+async def test_zero_disables_limits_and_introspection_is_free():
+    """Test that limits of 0 are disabled and introspection is not counted."""
+    schema = _schema(max_depth=0, max_cost=0)
+    result = await schema.execute(
+        "{ items(first: 100000) { children(limit: 100000) { name } } }"
+    )
+    assert result.errors is None
+
+    introspection = await _schema(max_depth=2, max_cost=1).execute(
+        "{ __schema { types { fields { type { ofType { name } } } } } }"
+    )
+    assert introspection.errors is None
@@ -0,0 +1,151 @@
+"""
+Tests for Farmer GraphQL queries and the User/Farmer relations.
+"""
+
+import pytest
+
+from app.graphql.schema import schema
+from app.models.farmers.farmer import Farmer
+from app.models.shared.location import Location
+from app.models.users.user import User, UserType
+from app.services.farmer_service import FarmerService
+from tests.helpers import graphql_context, memory_session
+
+FARMS = [
+    ("Far", 10.0, -84.2, True),
+    ("Near", 9.93, -84.08, False),
+    ("Middle", 9.95, -84.1, True),
+]
+
+
+@pytest.fixture
+async def context():
+    """GraphQL context on an in-memory database with three farmers and a buyer."""
+    async with memory_session() as session:
+        for i, (name, lat, lng, organic) in enumerate(FARMS):
+            user = User(
+                email=f"farmer{i}@test.com",
+                username=f"farmer{i}",
+                password_hash="hash",
+                user_type=UserType.FARMER,
+            )
+            session.add(user)
+            await session.flush()
+            session.add(Farmer(
+                user_id=user.id,
+                farm_name=name,
+                organic_certified=organic,
+                location=Location(latitude=lat, longitude=lng),
+            ))
+        session.add(User(
+            email="buyer@test.com",
+            username="buyer",
+            password_hash="hash",
+            user_type=UserType.BUYER,
+        ))
+        await session.commit()
+        await FarmerService.invalidate_cache()
+
+        yield graphql_context(session)
+
+
+async def test_nearby_farmers_with_users_in_batched_queries(context):
+    """Test distance ordering and that nested relations are batched."""
+    query = """
+        {
+            nearbyFarmers(lat: 9.9, lng: -84.1, radius: 50, first: 2) {
+                farmName distanceKm location { latitude }
+                user { email farmer { farmName } }
+            }
+        }
+    """
+    result = await schema.execute(query, context_value=context)
+
+    assert result.errors is None
+    farmers = result.data["nearbyFarmers"]
+    assert [farmer["farmName"] for farmer in farmers] == ["Near", "Middle"]
+    assert farmers[0]["distanceKm"] == pytest.approx(3.991, abs=0.01)
+    assert farmers[0]["user"] == {
+        "email": "farmer1@test.com",
+        "farmer": {"farmName": "Near"},
+    }
+    # search (+ location), users, farmers-by-user (+ location): no per-row queries
+    assert len(context.statements) <= 5
+
+
+async def test_user_farmer_relation(context):
+    """Test User.farmer for farmers and non-farmers."""
+    result = await schema.execute(
+        "{ users { email farmer { farmName organicCertified } } }",
+        context_value=context,
+    )
+
+    assert result.errors is None
+    by_email = {user["email"]: user["farmer"] for user in result.data["users"]}
+    assert by_email["buyer@test.com"] is None
+    assert by_email["farmer2@test.com"] == {
+        "farmName": "Middle",
+        "organicCertified": True,
+    }
+
+
+async def test_farmer_list_lookup_and_organic(context):
+    """Test farmers, farmer(id) and organicFarmers."""
+    listed = await schema.execute(
+        "{ farmers(limit: 2) { id farmName } }", context_value=context
+    )
+    assert listed.errors is None
+    assert len(listed.data["farmers"]) == 2
+
+    farmer_id = listed.data["farmers"][0]["id"]
+    single = await schema.execute(
+        f'{{ farmer(id: "{farmer_id}") {{ farmName user {{ email }} }} }}',
+        context_value=context,
+    )
+    assert single.data["farmer"]["farmName"] == listed.data["farmers"][0]["farmName"]
+
+    organic = await schema.execute(
+        "{ organicFarmers { farmName } }", context_value=context
+    )
+    organic_names = [farmer["farmName"] for farmer in organic.data["organicFarmers"]]
+    assert sorted(organic_names) == ["Far", "Middle"]
+
+
+async def test_nearby_farmers_validates_arguments(context):
+    """Test radius and page size bounds."""
+    result = await schema.execute(
+        "{ nearbyFarmers(lat: 0, lng: 0, radius: 5000) { id } }", context_value=context
+    )
+    assert result.errors[0].message == "radius must be between 0.1 and 500 km"
+
+
+async def test_farmers_connection(context):
+    """Test that farmer connections page by cursor and load locations."""
+    query = """
+        query Page($after: String) {
+            farmersConnection(first: 2, after: $after) {
+                totalCount
+                edges { node { farmName location { latitude } } }
+                pageInfo { hasNextPage endCursor }
+            }
+        }
+    """
+    first = await schema.execute(query, context_value=context)
+    assert first.errors is None
+    connection = first.data["farmersConnection"]
+    assert connection["totalCount"] == 3
+    assert len(connection["edges"]) == 2
+    assert connection["pageInfo"]["hasNextPage"] is True
+
+    second = await schema.execute(
+        query,
+        variable_values={"after": connection["pageInfo"]["endCursor"]},
+        context_value=context,
+    )
+    assert second.errors is None
+    edges = connection["edges"] + second.data["farmersConnection"]["edges"]
+    assert sorted(edge["node"]["farmName"] for edge in edges) == sorted(
+        name for name, *_ in FARMS
+    )
+    assert all(edge["node"]["location"] is not None for edge in edges)
+    assert second.data["farmersConnection"]["pageInfo"]["hasNextPage"] is False
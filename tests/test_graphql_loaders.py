@@ -0,0 +1,74 @@
+"""
+Tests for GraphQL request context and DataLoader batching.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from app.graphql.context import GraphQLContext
+
+
+def _context_with_rows(rows):
+    db = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    db.execute.return_value = result
+    return GraphQLContext(db), db
+
+
+async def test_user_loader_batches_into_one_query():
+    """Test that concurrent loads are fetched with a single statement."""
+    known_ids = [uuid4(), uuid4()]
+    missing_id = uuid4()
+    rows = [SimpleNamespace(id=user_id) for user_id in reversed(known_ids)]
+    context, db = _context_with_rows(rows)
+
+    results = await asyncio.gather(
+        context.loaders.user_by_id.load(known_ids[0]),
+        context.loaders.user_by_id.load(missing_id),
+        context.loaders.user_by_id.load(known_ids[1]),
+    )
+
+    assert [r.id if r else None for r in results] == [known_ids[0], None, known_ids[1]]
+    db.execute.assert_called_once()
+
+
+async def test_loader_caches_within_request():
+    """Test that repeated keys in one request do not hit the database again."""
+    user_id = uuid4()
+    context, db = _context_with_rows([SimpleNamespace(id=user_id)])
+
+    first = await context.loaders.user_by_id.load(user_id)
+    second = await context.loaders.user_by_id.load(user_id)
+
+    assert first is second
+    db.execute.assert_called_once()
+
+
+async def test_farmer_loader_keys_by_user_id():
+    """Test that farmers are matched to the requested user IDs."""
+    user_id = uuid4()
+    farmer = SimpleNamespace(id=uuid4(), user_id=user_id)
+    context, _ = _context_with_rows([farmer])
+
+    assert await context.loaders.farmer_by_user_id.load(user_id) is farmer
+
+
+async def test_session_access_is_serialized():
+    """Test that concurrent resolvers borrow the shared session one at a time."""
+    context, _ = _context_with_rows([])
+    active = 0
+    max_active = 0
+
+    async def borrow():
+        nonlocal active, max_active
+        async with context.session():
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0)
+            active -= 1
+
+    await asyncio.gather(borrow(), borrow(), borrow())
+    assert max_active == 1
@@ -0,0 +1,130 @@
+"""
+Tests for Relay-style GraphQL connections.
+"""
+
+import pytest
+
+from app.graphql.schema import schema
+from app.models.users.user import User, UserType
+from tests.helpers import graphql_context, memory_session
+
+PAGE_QUERY = """
+    query Page($first: Int!, $after: String) {
+        usersConnection(first: $first, after: $after) {
+            edges { cursor node { id email } }
+            pageInfo { hasNextPage hasPreviousPage startCursor endCursor }
+        }
+    }
+"""
+
+
+@pytest.fixture
+async def context():
+    """GraphQL context on an in-memory database with five users."""
+    async with memory_session() as session:
+        for i in range(5):
+            session.add(User(
+                email=f"user{i}@test.com",
+                username=f"user{i}",
+                password_hash="hash",
+                user_type=UserType.BUYER,
+            ))
+        await session.commit()
+
+        yield graphql_context(session)
+
+
+async def test_pages_cover_all_users_once(context):
+    """Test that following endCursor walks every user in ID order."""
+    ids, after, pages = [], None, 0
+    while True:
+        result = await schema.execute(
+            PAGE_QUERY,
+            variable_values={"first": 2, "after": after},
+            context_value=context,
+        )
+        assert result.errors is None
+        connection = result.data["usersConnection"]
+        page_info = connection["pageInfo"]
+        assert page_info["hasPreviousPage"] is (after is not None)
+        assert page_info["startCursor"] == connection["edges"][0]["cursor"]
+        assert page_info["endCursor"] == connection["edges"][-1]["cursor"]
+        ids.extend(edge["node"]["id"] for edge in connection["edges"])
+        pages += 1
+        if not page_info["hasNextPage"]:
+            break
+        after = page_info["endCursor"]
+
+    assert pages == 3
+    assert len(ids) == 5
+    assert ids == sorted(ids)
+
+
+async def test_total_count_only_queried_when_selected(context):
+    """Test that totalCount issues its count query lazily."""
+    result = await schema.execute(
+        "{ usersConnection(first: 2) { edges { node { email } } } }",
+        context_value=context,
+    )
+    assert result.errors is None
+    assert len(context.statements) == 1
+    assert "count" not in context.statements[0].lower()
+
+    context.statements.clear()
+    result = await schema.execute(
+        "{ usersConnection(first: 2) { totalCount edges { node { email } } } }",
+        context_value=context,
+    )
+    assert result.errors is None
+    assert result.data["usersConnection"]["totalCount"] == 5
+    assert len(context.statements) == 2
+
+
+async def test_empty_page_and_invalid_arguments(context):
+    """Test the last page, malformed cursors and page size bounds."""
+    last = await schema.execute(
+        "{ usersConnection(first: 5) { pageInfo { endCursor } } }",
+        context_value=context,
+    )
+    end_cursor = last.data["usersConnection"]["pageInfo"]["endCursor"]
+
+    result = await schema.execute(
+        PAGE_QUERY,
+        variable_values={"first": 2, "after": end_cursor},
+        context_value=context,
+    )
+    assert result.data["usersConnection"]["edges"] == []
+    assert result.data["usersConnection"]["pageInfo"] == {
+        "hasNextPage": False,
+        "hasPreviousPage": True,
+        "startCursor": None,
+        "endCursor": None,
+    }
+
+    invalid = await schema.execute(
+        PAGE_QUERY,
+        variable_values={"first": 2, "after": "not-a-cursor"},
+        context_value=context,
+    )
+    assert [e.message for e in invalid.errors] == ["Invalid pagination cursor"]
+
+    too_many = await schema.execute(
+        PAGE_QUERY, variable_values={"first": 101}, context_value=context
+    )
+    assert [e.message for e in too_many.errors] == ["first must be between 1 and 100"]
+
+
+async def test_offset_users_are_ordered_by_id(context):
+    """Test that skip/limit pages of users are stable and disjoint."""
+    query = "query Page($skip: Int!) { users(skip: $skip, limit: 2) { id } }"
+    ids = []
+    for skip in (0, 2, 4):
+        result = await schema.execute(
+            query, variable_values={"skip": skip}, context_value=context
+        )
+        assert result.errors is None
+        ids.extend(user["id"] for user in result.data["users"])
+
+    assert ids == sorted(set(ids))
+    assert len(ids) == 5
+    assert "ORDER BY" in context.statements[-1]
@@ -0,0 +1,162 @@
+"""
+Tests for automatic persisted queries and the GraphQL document cache.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+import strawberry
+import strawberry.schema.schema
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from strawberry.http import GraphQLRequestData
+
+from app.graphql.extensions import DocumentCache, document_cache
+from app.graphql.persisted_queries import (
+    PersistedQueryRouter,
+    PersistedQueryStore,
+    query_hash,
+)
+
+QUERY = "query Hello { hello }"
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self) -> str:
+        return "world"
+
+
+schema = strawberry.Schema(query=Query, extensions=[DocumentCache])
+
+
+def _request(query=None, digest=None, version=1) -> GraphQLRequestData:
+    extensions = None
+    if digest is not None:
+        extensions = {"persistedQuery": {"version": version, "sha256Hash": digest}}
+    return GraphQLRequestData(
+        query=query, variables=None, operation_name=None, extensions=extensions
+    )
+
+
+def test_store_registers_and_resolves_hashes():
+    """Test the APQ round trip: miss, register, then hash-only hit."""
+    store = PersistedQueryStore(maxsize=10)
+    digest = query_hash(QUERY)
+
+    assert store.resolve(_request(digest=digest)).message == "PersistedQueryNotFound"
+    assert store.resolve(_request(QUERY, digest)) is None
+
+    request = _request(digest=digest)
+    assert store.resolve(request) is None
+    assert request.query == QUERY
+
+
+def test_store_rejects_bad_requests():
+    """Test hash mismatches and unsupported versions."""
+    store = PersistedQueryStore(maxsize=10)
+
+    mismatch = store.resolve(_request("{ hello }", query_hash(QUERY)))
+    assert mismatch.extensions["code"] == "PERSISTED_QUERY_HASH_MISMATCH"
+    unsupported = store.resolve(_request(digest=query_hash(QUERY), version=2))
+    assert unsupported.extensions["code"] == "PERSISTED_QUERY_NOT_SUPPORTED"
+    assert store.resolve(_request("{ hello }")) is None
+
+
+def test_allow_list_only_runs_manifest_operations(tmp_path):
+    """Test that allow-list mode rejects unregistered operations."""
+    digest = query_hash(QUERY)
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps({digest: QUERY}))
+    store = PersistedQueryStore(
+        maxsize=10,
+        manifest=PersistedQueryStore.load_manifest(str(manifest_path)),
+        allow_list_only=True,
+    )
+
+    request = _request(digest=digest)
+    assert store.resolve(request) is None
+    assert request.query == QUERY
+    assert store.resolve(_request(QUERY)) is None
+
+    other = "{ hello }"
+    assert store.resolve(_request(other)).message == "PersistedQueryNotAllowed"
+    not_allowed = store.resolve(_request(other, query_hash(other)))
+    assert not_allowed.message == "PersistedQueryNotAllowed"
+    not_found = store.resolve(_request(digest=query_hash(other)))
+    assert not_found.message == "PersistedQueryNotFound"
+
+
+def test_manifest_hashes_are_verified(tmp_path):
+    """Test that a manifest entry with a wrong hash is refused."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps({"0" * 64: QUERY}))
+
+    with pytest.raises(ValueError):
+        PersistedQueryStore.load_manifest(str(manifest_path))
+
+
+async def test_document_cache_skips_parse_and_validation():
+    """Test that valid documents are cached and invalid ones are not."""
+    document_cache.clear()
+    query = "query Cached { hello }"
+
+    first = await schema.execute(query)
+    hits = document_cache.hits
+    second = await schema.execute(query)
+
+    assert first.data == second.data == {"hello": "world"}
+    assert document_cache.hits == hits + 1
+
+    for _ in range(2):
+        invalid = await schema.execute("{ missing }")
+        assert invalid.errors
+    assert document_cache.get(query_hash("{ missing }")) is None
+
+
+async def test_document_cache_validates_each_document_once():
+    """Test the strawberry contract DocumentCache relies on to skip validation."""
+    document_cache.clear()
+    validate = strawberry.schema.schema.validate_document
+
+    with patch.object(
+        strawberry.schema.schema, "validate_document", wraps=validate
+    ) as spy:
+        for _ in range(3):
+            result = await schema.execute("query Once { hello }")
+            assert result.data == {"hello": "world"}
+        assert spy.call_count == 1
+
+        # Invalid documents are validated (and rejected) every time
+        spy.reset_mock()
+        for _ in range(2):
+            assert (await schema.execute("{ missing }")).errors
+        assert spy.call_count == 2
+
+
+async def test_router_serves_hash_only_get_requests():
+    """Test APQ over HTTP, including hash-only GET requests."""
+    app = FastAPI()
+    router = PersistedQueryRouter(schema, store=PersistedQueryStore(maxsize=10))
+    app.include_router(router, prefix="/graphql")
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": query_hash(QUERY)}}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        missing = await client.post("/graphql", json={"extensions": extensions})
+        registered = await client.post(
+            "/graphql", json={"query": QUERY, "extensions": extensions}
+        )
+        cached = await client.get(
+            "/graphql",
+            params={"extensions": json.dumps(extensions)},
+            headers={"Accept": "*/*"},
+        )
+
+    missing_error = missing.json()["errors"][0]
+    assert missing_error["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+    assert registered.json() == {"data": {"hello": "world"}}
+    assert cached.json() == {"data": {"hello": "world"}}
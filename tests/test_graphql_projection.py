@@ -0,0 +1,75 @@
+"""
+Tests for selection-set column projection in GraphQL resolvers.
+"""
+
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import strawberry
+from strawberry.types import Info
+
+from app.graphql.context import GraphQLContext
+from app.graphql.projection import selected_columns, type_columns
+from app.graphql.types.user_type import User
+from app.models.users.user import User as UserModel
+
+captured: List[List[str]] = []
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def users(self, info: Info) -> List[User]:
+        columns = selected_columns(info, UserModel, User)
+        captured.append([column.key for column in columns])
+        return []
+
+
+schema = strawberry.Schema(query=Query)
+
+
+def test_type_columns_exclude_unexposed_columns():
+    """Test that only columns backing GraphQL fields are projected."""
+    columns = type_columns(UserModel, User)
+    assert "password_hash" not in columns
+    assert "username" not in columns
+    assert list(columns)[:2] == ["id", "email"]
+
+
+async def test_selected_columns_follow_the_selection_set():
+    """Test camelCase names, fragments and the always-loaded key column."""
+    captured.clear()
+    query = """
+        query {
+            users { email ...Flags ... on User { createdAt } __typename }
+        }
+        fragment Flags on User { isActive userType }
+    """
+    result = await schema.execute(query)
+
+    assert result.errors is None
+    assert captured == [["id", "email", "user_type", "is_active", "created_at"]]
+
+
+def test_from_model_accepts_partial_rows():
+    """Test building the GraphQL type from a projected row."""
+    user = User.from_model(SimpleNamespace(id=uuid4(), email="a@b.co"))
+    assert user.email == "a@b.co"
+    assert user.user_type is None
+
+
+async def test_user_loader_defers_password_hash():
+    """Test that the user loader selects only the public columns."""
+    db = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = []
+    db.execute.return_value = result
+    context = GraphQLContext(db)
+
+    await context.loaders.user_by_id.load(uuid4())
+
+    statement = str(db.execute.call_args.args[0])
+    assert "users.email" in statement
+    assert "password_hash" not in statement
@@ -0,0 +1,80 @@
+"""
+Tests for the asynchronous password hashing pool.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+from httpx import ASGITransport, AsyncClient
+
+from app.core.hashing import PasswordHasher, PasswordHasherBusy, password_hasher
+
+
+async def test_hash_and_verify_round_trip():
+    """Test hashing and verification through the worker pool."""
+    hasher = PasswordHasher(max_workers=2, max_queue=4)
+    try:
+        hashed = await hasher.hash("testpassword123")
+        assert hashed != "testpassword123"
+        assert await hasher.verify("testpassword123", hashed) is True
+        assert await hasher.verify("wrongpassword", hashed) is False
+
+        stats = hasher.stats()
+        assert stats["submitted"] == 3
+        assert stats["completed"] == 3
+        assert stats["in_flight"] == 0
+    finally:
+        hasher.shutdown()
+
+
+async def test_rejects_when_queue_is_full():
+    """Test that calls beyond workers + queue limit are rejected."""
+    hasher = PasswordHasher(max_workers=1, max_queue=0)
+    try:
+        results = await asyncio.gather(
+            hasher.hash("first-password"),
+            hasher.hash("second-password"),
+            return_exceptions=True,
+        )
+        assert isinstance(results[0], str)
+        assert isinstance(results[1], PasswordHasherBusy)
+        assert hasher.stats()["rejected"] == 1
+    finally:
+        hasher.shutdown()
+
+
+async def test_event_loop_stays_responsive_while_hashing():
+    """Test that other coroutines run while bcrypt is working."""
+    hasher = PasswordHasher(max_workers=1, max_queue=1)
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(ticker())
+    try:
+        await hasher.hash("testpassword123")
+    finally:
+        task.cancel()
+        hasher.shutdown()
+    assert ticks > 1
+
+
+async def test_busy_hasher_maps_to_503():
+    """Test that the API answers a saturated hashing pool with 503."""
+    from app.main import app
+
+    with patch.object(password_hasher, "verify", side_effect=PasswordHasherBusy()):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/auth/login", data={"username": "testuser", "password": "secret"}
+            )
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert response.json() == {"detail": "Authentication service busy, please retry"}
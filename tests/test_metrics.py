@@ -0,0 +1,108 @@
+"""
+Tests for the in-process Prometheus metrics.
+"""
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.metrics import (
+    Counter,
+    Histogram,
+    Metric,
+    MetricsMiddleware,
+    MetricsRegistry,
+    UNMATCHED_ROUTE,
+    http_requests_total,
+)
+
+
+def test_counter_renders_labels():
+    """Test counter exposition with escaped labels."""
+    counter = Counter("jobs_total", "Jobs.", ("queue",))
+    counter.inc(queue='a"b')
+    counter.inc(2, queue='a"b')
+
+    assert counter.collect() == [
+        "# HELP jobs_total Jobs.",
+        "# TYPE jobs_total counter",
+        'jobs_total{queue="a\\"b"} 3',
+    ]
+
+
+def test_counter_rejects_unknown_labels():
+    """Test that label names are validated."""
+    counter = Counter("jobs_total", "Jobs.", ("queue",))
+    try:
+        counter.inc(route="/")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test histogram buckets, sum and count."""
+    histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    lines = histogram.collect()
+    assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{le="1"} 3' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+    assert "latency_seconds_sum 2.65" in lines
+    assert "latency_seconds_count 4" in lines
+
+
+def test_registry_renders_collectors():
+    """Test that scrape-time collectors are rendered."""
+    registry = MetricsRegistry()
+    registry.add_collector(
+        lambda: [("pool_size", "gauge", "Pool size.", [({"pool": "db"}, 5)])]
+    )
+
+    assert 'pool_size{pool="db"} 5' in registry.render()
+
+
+def test_registry_returns_registered_metric_type():
+    """Test that registration keeps the concrete type and rejects duplicates."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.")
+    assert isinstance(histogram, Histogram)
+
+    with pytest.raises(ValueError):
+        registry.counter("latency_seconds", "Latency.")
+    with pytest.raises(TypeError):
+        Metric("untyped", "Abstract.")  # type: ignore[abstract]
+
+
+async def test_middleware_labels_requests_with_route_template():
+    """Test that requests are labelled by route template, not raw path."""
+    router = APIRouter()
+
+    @router.get("/{item_id}")
+    async def read_item(item_id: int):
+        return {"id": item_id}
+
+    app = FastAPI()
+    app.include_router(router, prefix="/metrics-test/items")
+    app.add_middleware(MetricsMiddleware)
+
+    before = http_requests_total.value(
+        method="GET", route="/metrics-test/items/{item_id}", status="200"
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        await client.get("/metrics-test/items/1")
+        await client.get("/metrics-test/items/2")
+        await client.get("/metrics-test/missing")
+
+    assert http_requests_total.value(
+        method="GET", route="/metrics-test/items/{item_id}", status="200"
+    ) == before + 2
+    unmatched = http_requests_total.value(
+        method="GET", route=UNMATCHED_ROUTE, status="404"
+    )
+    assert unmatched >= 1
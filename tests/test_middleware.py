@@ -0,0 +1,222 @@
+"""
+Tests for the ASGI authentication, query stats and coalescing middleware.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from loguru import logger
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core import database
+from app.core.middleware import (
+    AuthenticationMiddleware,
+    QueryStatsMiddleware,
+    RequestCoalescingMiddleware,
+    create_auth_middleware,
+)
+from app.core.security import create_access_token
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/public/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/api/v1/protected/me")
+    async def me(request: Request):
+        return request.state.current_user
+
+    @app.get("/api/v1/protected/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i}\n"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(
+        AuthenticationMiddleware,
+        protected_paths=["/api/v1/protected"],
+        public_paths=["/public", "/docs"],
+    )
+    return app
+
+
+@pytest.fixture
+async def client():
+    async with AsyncClient(
+        transport=ASGITransport(app=_build_app()), base_url="http://testserver"
+    ) as async_client:
+        yield async_client
+
+
+async def test_public_path_passes_without_token(client: AsyncClient):
+    """Test that public paths do not require authentication."""
+    response = await client.get("/public/ping")
+    assert response.status_code == 200
+
+
+async def test_protected_path_requires_header(client: AsyncClient):
+    """Test that protected paths reject requests without a token."""
+    response = await client.get("/api/v1/protected/me")
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+    assert response.json()["detail"] == "Authorization header missing"
+
+
+async def test_protected_path_rejects_bad_scheme_and_token(client: AsyncClient):
+    """Test that malformed headers and invalid tokens are rejected."""
+    response = await client.get(
+        "/api/v1/protected/me", headers={"Authorization": "Basic abc"}
+    )
+    assert response.status_code == 401
+
+    response = await client.get(
+        "/api/v1/protected/me", headers={"Authorization": "Bearer not-a-token"}
+    )
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Could not validate credentials"
+
+
+async def test_valid_token_sets_request_state(client: AsyncClient):
+    """Test that the decoded user is exposed on request.state."""
+    token = create_access_token({"sub": "farmer@test.com"})
+    response = await client.get(
+        "/api/v1/protected/me", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"username": "farmer@test.com", "sub": "farmer@test.com"}
+
+
+async def test_streaming_response_passes_through(client: AsyncClient):
+    """Test that streaming responses are not buffered or altered."""
+    token = create_access_token({"sub": "farmer@test.com"})
+    response = await client.get(
+        "/api/v1/protected/stream", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200
+    assert response.text == "chunk-0\nchunk-1\nchunk-2\n"
+
+
+def test_path_classification():
+    """Test prefix classification precedence and defaults."""
+    middleware = create_auth_middleware(
+        protected_paths=["/api"],
+        public_paths=["/api/public"],
+        require_auth_by_default=True,
+    )(app=None)
+
+    assert middleware._requires_authentication("/api/public/x") is False
+    assert middleware._requires_authentication("/api/farmers") is True
+    assert middleware._requires_authentication("/other") is True
+
+
+async def test_query_stats_middleware_sets_server_timing():
+    """Test statement counting, Server-Timing and the N+1 warning."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", database._before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", database._after_cursor_execute)
+
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items():
+        async with engine.connect() as connection:
+            for i in range(4):
+                await connection.execute(text("SELECT :i"), {"i": i})
+        return {"ok": True}
+
+    app.add_middleware(QueryStatsMiddleware, repeat_threshold=3)
+
+    messages = []
+    handler_id = logger.add(
+        lambda message: messages.append(str(message)), level="WARNING"
+    )
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/items")
+    finally:
+        logger.remove(handler_id)
+        await engine.dispose()
+
+    assert response.status_code == 200
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert 'desc="4 queries"' in response.headers["server-timing"]
+    assert any("Possible N+1 query" in message for message in messages)
+
+
+def _build_coalescing_app():
+    app = FastAPI()
+    calls = []
+
+    @app.get("/api/items/{item_id}")
+    async def item(item_id: int, request: Request):
+        calls.append(item_id)
+        await asyncio.sleep(0.05)
+        if item_id == 0:
+            raise RuntimeError("boom")
+        return {"item": item_id, "q": dict(request.query_params), "call": len(calls)}
+
+    @app.get("/api/exports/items")
+    async def export():
+        calls.append("export")
+        await asyncio.sleep(0.05)
+        return {"ok": True}
+
+    app.add_middleware(
+        RequestCoalescingMiddleware, paths=["/api"], exclude_paths=["/api/exports"]
+    )
+    return app, calls
+
+
+async def test_coalescing_shares_identical_in_flight_requests():
+    """Test that identical concurrent GETs run the endpoint once."""
+    app, calls = _build_coalescing_app()
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        responses = await asyncio.gather(
+            client.get("/api/items/1?a=1&b=2"),
+            client.get("/api/items/1?b=2&a=1"),
+            client.get("/api/items/1?a=1&b=2"),
+            client.get(
+                "/api/items/1?a=1&b=2", headers={"Authorization": "Bearer other"}
+            ),
+            client.get("/api/exports/items"),
+            client.get("/api/exports/items"),
+        )
+
+    assert [r.status_code for r in responses] == [200] * 6
+    assert responses[0].json() == responses[1].json() == responses[2].json()
+    assert calls.count(1) == 2  # one per distinct credential
+    assert calls.count("export") == 2
+
+    # Nothing is retained once the group completes
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        await client.get("/api/items/1?a=1&b=2")
+    assert calls.count(1) == 3
+
+
+async def test_coalescing_followers_retry_when_leader_fails():
+    """Test that a failing leader does not fail the requests waiting on it."""
+    app, calls = _build_coalescing_app()
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = await asyncio.gather(
+            *(client.get("/api/items/0") for _ in range(3))
+        )
+
+    assert [r.status_code for r in responses] == [500] * 3
+    assert calls.count(0) == 3
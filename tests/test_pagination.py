@@ -0,0 +1,25 @@
+"""
+Tests for keyset pagination cursor helpers.
+"""
+
+import pytest
+from uuid import uuid4
+
+from app.core.pagination import decode_cursor, decode_uuid_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    """Test that cursors decode back to the encoded sort key."""
+    farmer_id = uuid4()
+    cursor = encode_cursor(farmer_id)
+    assert "=" not in cursor
+    assert decode_uuid_cursor(cursor) == farmer_id
+    assert decode_cursor(encode_cursor("plain-key")) == "plain-key"
+
+
+def test_invalid_cursor_raises_value_error():
+    """Test that malformed cursors are rejected."""
+    with pytest.raises(ValueError):
+        decode_cursor("%%%")
+    with pytest.raises(ValueError):
+        decode_uuid_cursor(encode_cursor("not-a-uuid"))
@@ -0,0 +1,91 @@
+"""
+Tests for the fast JSON response path.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+from fastapi import Response
+
+from app.core.config import Settings
+from app.core.responses import ModelResponder
+from app.schemas.farmer import FarmerResponse
+
+
+def _farmer(**overrides):
+    data = {
+        "id": uuid4(),
+        "user_id": uuid4(),
+        "farm_name": "Green Valley Farm",
+        "farm_size": 150.0,
+        "organic_certified": True,
+        "description": None,
+        "location": SimpleNamespace(
+            id=1,
+            address=None,
+            city="San José",
+            state=None,
+            country="Costa Rica",
+            latitude=9.93,
+            longitude=-84.08,
+        ),
+    }
+    data.update(overrides)
+    return SimpleNamespace(**data)
+
+
+def test_default_path_returns_models():
+    """Test that responders return models when the fast path is off."""
+    responder = ModelResponder(FarmerResponse, router="farmers")
+    with patch("app.core.responses.get_settings", return_value=Settings()):
+        result = responder.many([_farmer()])
+
+    assert isinstance(result[0], FarmerResponse)
+
+
+def test_fast_path_encodes_bytes_once():
+    """Test that the fast path returns encoded JSON matching the models."""
+    farmers = [_farmer(), _farmer(location=None)]
+    responder = ModelResponder(FarmerResponse, router="farmers")
+    settings = Settings(fast_json_routers=["farmers"])
+
+    with patch("app.core.responses.get_settings", return_value=settings):
+        result = responder.many(farmers)
+
+    assert isinstance(result, Response)
+    assert result.media_type == "application/json"
+    expected = [
+        json.loads(FarmerResponse.model_validate(farmer).model_dump_json())
+        for farmer in farmers
+    ]
+    assert json.loads(result.body) == expected
+
+
+def test_fast_path_keeps_status_and_headers():
+    """Test that status codes and sub-response headers are preserved."""
+    responder = ModelResponder(FarmerResponse, router="farmers")
+    sub_response = Response()
+    del sub_response.headers["content-length"]
+    sub_response.headers["X-Next-Cursor"] = "abc"
+
+    with patch(
+        "app.core.responses.get_settings",
+        return_value=Settings(fast_json_responses=True),
+    ):
+        result = responder.one(_farmer(), status_code=201, response=sub_response)
+
+    assert result.status_code == 201
+    assert result.headers["x-next-cursor"] == "abc"
+    assert result.headers["content-length"] == str(len(result.body))
+
+
+def test_router_selection():
+    """Test that per-router selection only affects listed routers."""
+    responder = ModelResponder(FarmerResponse, router="users")
+    with patch(
+        "app.core.responses.get_settings",
+        return_value=Settings(fast_json_routers=["farmers"]),
+    ):
+        assert responder.fast is False
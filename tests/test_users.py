@@ -3,10 +3,14 @@ Comprehensive test suite for user management API endpoints.
 """
 
 from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import get_db
+
 
 class TestUserRegistration:
     """Test user registration endpoints."""
@@ -136,6 +140,32 @@ class TestUserLogin:
         assert response.status_code == 401
         assert "Incorrect username or password" in response.json()["detail"]
 
+    async def test_login_authenticates_with_username_field(self):
+        """Test that login passes UserLogin.username as the account email."""
+        from app.main import app
+
+        authenticate = AsyncMock(return_value=SimpleNamespace(email="a@example.com"))
+        app.dependency_overrides[get_db] = lambda: None
+        try:
+            with patch(
+                "app.api.users.auth_service.authenticate_user", authenticate
+            ):
+                async with AsyncClient(
+                    transport=ASGITransport(app=app), base_url="http://test"
+                ) as client:
+                    response = await client.post(
+                        "/api/users/login",
+                        json={"username": "a@example.com", "password": "secret123"},
+                    )
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+
+        assert response.status_code == 200
+        assert response.json()["token_type"] == "bearer"
+        authenticate.assert_awaited_once_with(
+            None, email="a@example.com", password="secret123"
+        )
+
 
 class TestUserAuthentication:
     """Test user authentication endpoints."""